@@ -0,0 +1,82 @@
+"""
+Event-loop lag under 10,000 concurrent governed tool calls (emocore.async_adapters).
+
+Starts 10,000 fake tool calls at once, spread over 200 agents (one
+AsyncToolCallingAgentAdapter each, 50 calls per agent so no session hits
+the step fuse). Every call awaits a random 0-2 s "tool" inside
+`async with adapter.monitor(...)`. A probe task meanwhile sleeps 1 ms in a
+loop and records how late it wakes up (event-loop lag).
+
+Three runs: the same calls without governance (baseline: task start-up
+and timer cost of 10k tasks), inline governance (steps run on the loop)
+and a shared GovernanceWorker (steps batched onto one thread). Reported:
+wall time, p99 and max loop lag once all tasks are running (after the
+first 250 ms), the max lag of the start-up burst, and the number of
+worker batches.
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+import random
+import time
+
+from emocore.agent import EmoCoreAgent
+from emocore.async_adapters import AsyncToolCallingAgentAdapter, GovernanceWorker
+
+CALLS = 10_000
+AGENTS = 200
+TICK = 0.001
+STARTUP = 0.25
+
+
+async def _probe(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append((start, time.perf_counter() - start - TICK))
+
+
+async def _call(adapter, delay, tool):
+    if adapter is None:
+        await asyncio.sleep(delay)
+        return
+    async with adapter.monitor(tool) as audit:
+        await asyncio.sleep(delay)
+        audit.success(env_delta=0.3)
+
+
+async def run(mode: str):
+    rng = random.Random(7)
+    worker = GovernanceWorker() if mode == "worker" else None
+    adapters = [
+        None if mode == "bare" else AsyncToolCallingAgentAdapter(EmoCoreAgent(), worker=worker)
+        for _ in range(AGENTS)
+    ]
+    lags, stop = [], asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _call(adapters[i % AGENTS], rng.uniform(0.0, 2.0), f"tool_{i % 7}") for i in range(CALLS)
+    ))
+    wall = time.perf_counter() - start
+    stop.set()
+    await probe
+    batches = 0
+    if worker:
+        batches = worker.batches
+        worker.close()
+    # Steady state: after the start-up burst that creates the 10k tasks
+    steady = sorted(lag for at, lag in lags if at >= start + STARTUP)
+    every = sorted(lag for _, lag in lags)
+    return wall, steady[int(0.99 * (len(steady) - 1))], steady[-1], every[-1], batches
+
+
+if __name__ == "__main__":
+    print("--- RESULT ---")
+    for mode in ("bare", "inline", "worker"):
+        wall, p99, worst, startup, batches = asyncio.run(run(mode))
+        print(f"{mode}_wall_s: {wall:.3f}")
+        print(f"{mode}_loop_lag_p99_ms: {p99 * 1e3:.2f}")
+        print(f"{mode}_loop_lag_max_ms: {worst * 1e3:.2f}")
+        print(f"{mode}_startup_lag_max_ms: {startup * 1e3:.2f}")
+        if mode == "worker":
+            print(f"{mode}_batches: {batches}")
@@ -0,0 +1,84 @@
+"""
+Multi-process fleet throughput: session-steps per second vs worker processes.
+
+Steps 200,000 sessions (BALANCED with max_steps lifted, so none halt) for
+50 steps:
+
+- emofleet: one EmoFleet in this process (the single-GIL baseline)
+- governor_wN: FleetGovernor with N worker processes, one shard each, for
+  N = 1, 2, 4, ... up to the host's CPU count
+
+Signals are written into the shared signal table once, as per-shard
+producers would; each timed step is the governor's fan-out / fan-in plus
+the workers' EmoFleet steps. Scaling efficiency is throughput / (N x the
+1-worker throughput). Results depend on the cores actually available:
+workers beyond the core count only time-share.
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import dataclasses
+import time
+
+import numpy as np
+
+from emocore.fleet import EmoFleet
+from emocore.profiles import PROFILES, ProfileType
+from emocore.shared_fleet import FleetGovernor, REWARD, NOVELTY, URGENCY, DIFFICULTY, DT
+
+SESSIONS = 200_000
+STEPS = 50
+PROFILE = dataclasses.replace(PROFILES[ProfileType.BALANCED], max_steps=10**9)
+
+
+def signals():
+    rng = np.random.default_rng(0)
+    table = np.empty((SESSIONS, 5))
+    table[:, REWARD] = rng.uniform(0.2, 0.5, SESSIONS)
+    table[:, NOVELTY] = rng.uniform(0.2, 0.4, SESSIONS)
+    table[:, URGENCY] = rng.uniform(0.0, 0.2, SESSIONS)
+    table[:, DIFFICULTY] = rng.uniform(0.0, 0.2, SESSIONS)
+    table[:, DT] = 0.1
+    return table
+
+
+def emofleet(table) -> float:
+    fleet = EmoFleet(PROFILE, size=SESSIONS)
+    columns = [table[:, c] for c in (REWARD, NOVELTY, URGENCY, DIFFICULTY, DT)]
+    fleet._advance(*columns)  # Warm-up
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        fleet._advance(*columns)
+    elapsed = time.perf_counter() - start
+    assert not fleet.halted.any()
+    return SESSIONS * STEPS / elapsed
+
+
+def governor(table, workers) -> float:
+    with FleetGovernor(PROFILE, size=SESSIONS, workers=workers) as gov:
+        gov.fleet.signals[:] = table
+        gov.step()  # Warm-up (workers attach and build their views)
+        start = time.perf_counter()
+        for _ in range(STEPS):
+            gov.step()
+        elapsed = time.perf_counter() - start
+        assert not gov.fleet.halted.any()
+    return SESSIONS * STEPS / elapsed
+
+
+if __name__ == "__main__":
+    table = signals()
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+
+    print("--- RESULT ---")
+    print(f"cpus: {cpus}")
+    print(f"emofleet_session_steps_per_s: {emofleet(table):,.0f}")
+    single = None
+    for n in counts:
+        rate = governor(table, n)
+        single = single or rate
+        print(f"governor_w{n}_session_steps_per_s: {rate:,.0f}")
+        print(f"governor_w{n}_scaling_efficiency: {rate / (n * single):.2f}")
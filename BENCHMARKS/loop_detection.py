@@ -0,0 +1,60 @@
+"""
+Periodic loop detection cost as history grows (S-2, emocore.loops).
+
+Streams 100k actions through a PeriodDetector and through a full
+RuleBasedExtractor, and reports the per-step cost of each 10k-step slice.
+The stream mixes random actions with long loops (period 37 and 150), so
+lookups, evictions and confirmations all happen. With O(1) per step and
+bounded memory, every slice should cost the same regardless of how much
+history came before it.
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import random
+import time
+
+from emocore.extractor import RuleBasedExtractor
+from emocore.loops import PeriodDetector
+from emocore.observation import Observation
+from emocore.symbols import SymbolTable
+
+STEPS = 100_000
+SLICE = 10_000
+
+
+def _stream(seed=3):
+    rng = random.Random(seed)
+    out = []
+    while len(out) < STEPS:
+        out += [rng.randrange(5000) for _ in range(rng.randrange(50, 500))]
+        cycle = [rng.randrange(5000) for _ in range(rng.choice([37, 150]))]
+        out += cycle * rng.randrange(2, 6)
+    return out[:STEPS]
+
+
+def _sliced(fn, items):
+    timings = []
+    for start in range(0, len(items), SLICE):
+        chunk = items[start:start + SLICE]
+        t0 = time.perf_counter()
+        for item in chunk:
+            fn(item)
+        timings.append((time.perf_counter() - t0) / len(chunk))
+    return timings
+
+
+if __name__ == "__main__":
+    actions = _stream()
+    detector = PeriodDetector()
+    detector_us = _sliced(detector.push, actions)
+
+    extractor = RuleBasedExtractor(time_limit=10**9, step_limit=10**9)
+    extractor.symbols = SymbolTable()
+    observations = [Observation(f"a{a}", "success", 0.2, 0.1, 1.0) for a in actions]
+    extractor_us = _sliced(extractor.extract_values, observations)
+
+    print("--- RESULT ---")
+    print("history_steps  detector_us  extractor_us")
+    for i, (d, e) in enumerate(zip(detector_us, extractor_us)):
+        print(f"{(i + 1) * SLICE:>13}  {d * 1e6:>11.3f}  {e * 1e6:>12.3f}")
+    print(f"detector_slowdown_last_vs_first: {detector_us[-1] / detector_us[0]:.2f}x")
+    print(f"detector_memory_entries: {len(detector._last_seen)} (max_period={detector.max_period})")
@@ -0,0 +1,77 @@
+"""
+SessionRegistry at 1M registered sessions: memory per session and lookup latency.
+
+Registers 1,000,000 sessions (string conversation IDs, BALANCED profile,
+64 shards, TTL and LRU bounds that never trigger), then times 200,000
+get() calls on random registered IDs, one perf_counter_ns() pair each.
+
+Reports:
+- bytes_per_session: resident memory growth / sessions (agent + ID +
+  registry entry), and the registry's own share (entry, table slot)
+  measured with tracemalloc on a 100k-session sample
+- get_ns p50 / p99 / p99.9 (timer overhead included, ~50-100 ns)
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import gc
+import random
+import time
+import tracemalloc
+
+from emocore import SessionRegistry
+from emocore.agent import EmoCoreAgent
+
+SESSIONS = 1_000_000
+LOOKUPS = 200_000
+SAMPLE = 100_000
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def registry_overhead() -> float:
+    agents = [EmoCoreAgent() for _ in range(SAMPLE)]
+    registry = SessionRegistry(ttl=3600.0, max_sessions=10 * SAMPLE, factory=agents.__getitem__)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(SAMPLE):
+        registry.get(i)
+    overhead = (tracemalloc.get_traced_memory()[0] - base) / SAMPLE
+    tracemalloc.stop()
+    return overhead
+
+
+def main():
+    print("--- RESULT ---")
+    print(f"registry_bytes_per_session: {registry_overhead():.0f}")
+    gc.collect()
+
+    keys = [f"conv-{i:08d}" for i in range(SESSIONS)]
+    registry = SessionRegistry(ttl=3600.0, max_sessions=2 * SESSIONS)
+    before = rss_bytes()
+    start = time.perf_counter()
+    for key in keys:
+        registry.get(key)
+    created = time.perf_counter() - start
+    grown = rss_bytes() - before
+    assert len(registry) == SESSIONS
+    print(f"sessions: {len(registry)}")
+    print(f"create_us_per_session: {created / SESSIONS * 1e6:.1f}")
+    print(f"bytes_per_session: {grown / SESSIONS:.0f}")
+
+    rng = random.Random(0)
+    probes = [keys[rng.randrange(SESSIONS)] for _ in range(LOOKUPS)]
+    get, clock = registry.get, time.perf_counter_ns
+    samples = []
+    for key in probes:
+        t0 = clock()
+        get(key)
+        samples.append(clock() - t0)
+    samples.sort()
+    for label, q in (("p50", 0.5), ("p99", 0.99), ("p99_9", 0.999)):
+        print(f"get_ns_{label}: {samples[int(q * (LOOKUPS - 1))]}")
+
+
+if __name__ == "__main__":
+    main()
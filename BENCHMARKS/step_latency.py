@@ -0,0 +1,108 @@
+"""
+Single-session step latency: legacy NumPy governance vs the scalar kernel.
+
+"before": GovernanceEngine as it was, building an np.array and running
+          W.T @ s - V.T @ s plus np.clip on every step.
+"after":  the fused (W - V) scalar kernel with profile constants folded in.
+"compiled": EmoEngine(compiled=True), the whole step state machine
+          specialized for the profile (emocore.compiler).
+
+"before" and "after" run the same EmoEngine loop; only the governance kernel differs.
+The legacy variant needs NumPy and is skipped if it is not installed.
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import time
+
+from emocore.engine import EmoEngine
+from emocore.governance import GovernanceEngine
+from emocore.profiles import PROFILES, ProfileType
+
+STEPS = 20_000
+REPEATS = 5
+
+
+class LegacyGovernanceEngine(GovernanceEngine):
+    """The pre-kernel NumPy implementation, kept here for comparison only."""
+
+    def __init__(self, profile=None):
+        import numpy as np
+        super().__init__(profile)
+        self._np = np
+        self._W = np.array(self.W)
+        self._V = np.array(self.V)
+
+    def compute_values(self, confidence, frustration, curiosity, arousal, risk, stagnating=False, dt=0.0):
+        np = self._np
+        s = np.array([confidence, frustration, curiosity, arousal, risk])
+        g = self._W.T @ s - self._V.T @ s
+        p = self.profile
+        if stagnating:
+            g[0] *= p.stagnation_effort_scale
+            g[3] *= p.stagnation_persistence_scale
+        g[0] *= p.effort_scale
+        g[1] *= p.risk_scale
+        g[2] *= p.exploration_scale
+        g[3] *= p.persistence_scale
+        g[2] -= p.exploration_decay + dt * p.time_exploration_decay
+        g[3] -= p.persistence_decay + dt * p.time_persistence_decay
+        g = np.clip(g, 0.0, 1.0)
+        return float(g[0]), float(g[1]), float(g[2]), float(g[3])
+
+
+def _profile():
+    # Never halts within the benchmark: isolates step cost from halt short-circuit
+    import dataclasses
+    return dataclasses.replace(
+        PROFILES[ProfileType.BALANCED],
+        max_steps=10**9,
+        exhaustion_threshold=-1.0,
+        max_risk=10.0,
+        max_exploration=10.0,
+    )
+
+
+def measure(governance_cls, compiled: bool = False) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        engine = EmoEngine(_profile(), compiled=compiled)
+        engine.governance = governance_cls(engine.profile)
+        start = time.perf_counter()
+        for i in range(STEPS):
+            engine.step(0.3 if i % 3 else -0.2, 0.2, 0.1, 0.1)
+        best = min(best, (time.perf_counter() - start) / STEPS)
+    return best
+
+
+def measure_kernel(governance_cls) -> float:
+    gov = governance_cls(_profile())
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for i in range(STEPS):
+            gov.compute_values(0.4, 0.2, 0.7, 0.3, 0.1, i % 2 == 0, 0.01)
+        best = min(best, (time.perf_counter() - start) / STEPS)
+    return best
+
+
+if __name__ == "__main__":
+    print("--- RESULT ---")
+    try:
+        import numpy  # noqa: F401
+        rows = [("before", LegacyGovernanceEngine), ("after", GovernanceEngine)]
+    except ImportError:
+        print("before: skipped (NumPy not installed)")
+        rows = [("after", GovernanceEngine)]
+
+    timings = {}
+    for label, cls in rows:
+        timings[label] = (measure_kernel(cls), measure(cls))
+        kernel, step = timings[label]
+        print(f"{label}_governance_us: {kernel * 1e6:.2f}  {label}_step_us: {step * 1e6:.2f}")
+
+    compiled = measure(GovernanceEngine, compiled=True)
+    print(f"compiled_step_us: {compiled * 1e6:.2f}")
+    print(f"compiled_speedup: {timings['after'][1] / compiled:.2f}x")
+
+    if "before" in timings:
+        print(f"governance_speedup: {timings['before'][0] / timings['after'][0]:.2f}x")
+        print(f"step_speedup: {timings['before'][1] / timings['after'][1]:.2f}x")
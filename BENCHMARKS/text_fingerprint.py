@@ -0,0 +1,49 @@
+"""
+Near-duplicate scoring cost per LLM response (emocore.fingerprint).
+
+Feeds responses of 1, 4 and 16 KB through a TextFingerprintIndex that is
+already full (capacity responses indexed, so every add also evicts) and
+reports the time per add(): shingling, MinHash sketch, LSH lookup and
+candidate comparison. Half of the responses are paraphrased repeats, so
+the LSH buckets produce candidates.
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import random
+import time
+
+from emocore.fingerprint import TextFingerprintIndex
+
+RESPONSES = 500
+VOCAB = [f"word{i}" for i in range(20_000)]
+
+
+def _responses(size_bytes, rng):
+    words = max(1, size_bytes // 7)
+    base = [" ".join(rng.choice(VOCAB) for _ in range(words)) for _ in range(RESPONSES // 2)]
+    out = []
+    for text in base:
+        out.append(text)
+        edited = text.split()
+        edited.insert(rng.randrange(len(edited)), "however")
+        out.append(" ".join(edited))
+    rng.shuffle(out)
+    return out
+
+
+def measure(size_bytes) -> float:
+    rng = random.Random(size_bytes)
+    index = TextFingerprintIndex()
+    warmup = _responses(size_bytes, rng)[:index.capacity]
+    for text in warmup:
+        index.add(text)
+    responses = _responses(size_bytes, rng)
+    start = time.perf_counter()
+    for text in responses:
+        index.add(text)
+    return (time.perf_counter() - start) / len(responses)
+
+
+if __name__ == "__main__":
+    print("--- RESULT ---")
+    for kb in (1, 4, 16):
+        print(f"response_{kb}kb_ms: {measure(kb * 1024) * 1e3:.3f}")
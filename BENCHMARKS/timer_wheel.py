@@ -0,0 +1,75 @@
+"""
+Parking many backing-off sessions: EscalationScheduler vs one sleeper each.
+
+Parks 50,000 sessions with random backoff delays (0.1-2 s) and waits until
+every one has been handed back:
+
+- sleepers: one asyncio task per session doing `await asyncio.sleep(delay)`
+- wheel: one EscalationScheduler, drained every 10 ms by a single task
+
+Reports the CPU time per session (park + wake) and the peak memory
+allocated while everything is parked. Real time, so the run takes ~2 s
+per mode.
+"""
+import os, sys; sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+import random
+import time
+import tracemalloc
+
+from emocore.temporal import BackoffSchedule, EscalationScheduler
+
+SESSIONS = 50_000
+POLL = 0.01
+
+
+def delays():
+    rng = random.Random(1)
+    return [rng.uniform(0.1, 2.0) for _ in range(SESSIONS)]
+
+
+async def sleepers(values):
+    woken = []
+
+    async def park(key, delay):
+        await asyncio.sleep(delay)
+        woken.append(key)
+
+    tasks = [asyncio.create_task(park(key, delay)) for key, delay in enumerate(values)]
+    await asyncio.sleep(0)  # Let every task start sleeping
+    peak = tracemalloc.get_traced_memory()[0]
+    await asyncio.gather(*tasks)
+    return woken, peak
+
+
+async def wheel(values):
+    scheduler = EscalationScheduler(BackoffSchedule(1.0, 1.0), max_retries=1, tick=POLL)
+    woken = []
+    for key, delay in enumerate(values):
+        scheduler.backoff.base_delay = delay  # One attempt each, at this session's delay
+        scheduler.record_failure(key)
+    peak = tracemalloc.get_traced_memory()[0]
+    while scheduler.parked:
+        await asyncio.sleep(POLL)
+        woken.extend(scheduler.ready())
+    return woken, peak
+
+
+def measure(mode):
+    values = delays()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    cpu = time.process_time()
+    woken, peak = asyncio.run(mode(values))
+    cpu = time.process_time() - cpu
+    tracemalloc.stop()
+    assert len(woken) == SESSIONS
+    return cpu / SESSIONS, (peak - base) / SESSIONS
+
+
+if __name__ == "__main__":
+    print("--- RESULT ---")
+    for mode in (sleepers, wheel):
+        cpu, memory = measure(mode)
+        print(f"{mode.__name__}_cpu_us_per_session: {cpu * 1e6:.1f}")
+        print(f"{mode.__name__}_bytes_per_parked_session: {memory:.0f}")
@@ -6,14 +6,30 @@ Public API:
     from emocore import EmoCoreAgent, step, Signals
     from emocore.profiles import PROFILES, ProfileType
 
+Session API (extractor + validator + engine as one object):
+    from emocore import GovernedSession
+    from emocore import SessionRegistry   # sessions by ID: sharded, TTL / LRU eviction
+
+asyncio API (event-loop services):
+    from emocore.async_adapters import AsyncLLMLoopAdapter, AsyncToolCallingAgentAdapter
+    from emocore.cancellation import HaltCancellation   # cancel in-flight work on HALT
+
+Batch API (many sessions per call):
+    from emocore.fleet import EmoFleet
+    from emocore.batch_extractor import BatchRuleBasedExtractor
+    from emocore.batch_validator import BatchSignalValidator
+    from emocore.shared_fleet import FleetGovernor   # multi-process, shared-memory state
+
 Usage:
     agent = EmoCoreAgent()
     result = step(agent, Signals(reward=0.5, novelty=0.1, urgency=0.2))
 """
 
 from emocore.agent import EmoCoreAgent
-from emocore.interface import step, observe, Signals
+from emocore.interface import step, step_many, observe, observe_batch, Signals
 from emocore.observation import Observation
+from emocore.session import GovernedSession
+from emocore.registry import SessionRegistry
 from emocore.adapters import LLMLoopAdapter, ToolCallingAgentAdapter
 from emocore.guarantees import StepResult, GuaranteeEnforcer
 from emocore.failures import FailureType
@@ -21,15 +37,21 @@ from emocore.modes import Mode
 from emocore.behavior import BehaviorBudget
 from emocore.state import PressureState
 from emocore.profiles import Profile, PROFILES, ProfileType
+from emocore.clock import Clock, MonotonicClock, DeltaClock, VirtualClock
+from emocore.horizon import HorizonForecast
 
 __all__ = [
     # Main API
     "EmoCoreAgent",
     "step",
+    "step_many",
     "observe",
+    "observe_batch",
     "Signals",
     "Observation",
     "StepResult",
+    "GovernedSession",
+    "SessionRegistry",
     # Adapters
     "LLMLoopAdapter",
     "ToolCallingAgentAdapter",
@@ -38,12 +60,18 @@ __all__ = [
     "Mode",
     "BehaviorBudget",
     "PressureState",
+    "HorizonForecast",
     # Profiles
     "Profile",
     "PROFILES",
     "ProfileType",
     # Guarantees
     "GuaranteeEnforcer",
+    # Clocks
+    "Clock",
+    "MonotonicClock",
+    "DeltaClock",
+    "VirtualClock",
 ]
 
 __version__ = "0.7.0"
@@ -2,15 +2,22 @@
 """
 Integration Surface: Reusable adapters for typical agent loops.
 These wrappers simplify the 'observe()' pattern by handling timing and
-Observation construction automatically.
+Observation construction automatically. Both govern through the agent's
+GovernedSession, so they share pipeline state with interface.observe().
 """
 
 import time
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Iterable, Iterator
 from contextlib import contextmanager
+from zlib import crc32
 
 from emocore.observation import Observation
-from emocore.interface import observe, StepResult
+from emocore.decision import failure_of, is_halted
+from emocore.extractor import LLMAgentExtractor, ToolAgentExtractor
+from emocore.failures import FailureType
+from emocore.fingerprint import TextFingerprintIndex, TextMatch, normalize
+from emocore.guarantees import StepResult
+from emocore.session import GovernedSession
 from emocore.agent import EmoCoreAgent
 
 
@@ -20,12 +27,26 @@ class LLMLoopAdapter:
     
     Automatically tracks time and constructs Observations from
     high-level execution results.
+    
+    Pass the raw response text to end_step(response=...) and the adapter
+    scores it itself: a TextFingerprintIndex over the session's recent
+    responses (see emocore.fingerprint) turns near-duplicate and paraphrased
+    output into low env_state_delta / agent_state_delta, and folds the
+    near-duplicate cluster into the action name so repeats cost novelty.
     """
     
-    def __init__(self, agent: EmoCoreAgent, token_limit: int = 100000):
+    def __init__(
+        self,
+        agent: EmoCoreAgent,
+        token_limit: int = 100000,
+        fingerprints: Optional[TextFingerprintIndex] = None,
+    ):
         self.agent = agent
         self.token_limit = token_limit
         self.last_step_start = 0.0
+        # Created on the first end_step(response=...) unless given
+        self.fingerprints = fingerprints
+        self.last_match: Optional[TextMatch] = None
         
     def start_step(self):
         """Mark the start of an LLM generation step."""
@@ -40,29 +61,207 @@ class LLMLoopAdapter:
         tokens_used: int = 0,
         error: Optional[str] = None,
         extractor: Any = None,
-        validator: Any = None
+        validator: Any = None,
+        response: Optional[str] = None,
     ) -> StepResult:
         """
         Produce an EmoCore governance decision for the completed step.
+        
+        With `response`, env_delta and agent_delta are derived from the text
+        (see observation_from_text) and the given values are ignored.
         """
         elapsed = time.monotonic() - self.last_step_start
+        return self._govern(
+            action, result, elapsed, env_delta, agent_delta, tokens_used, error,
+            extractor, validator, response,
+        )
+
+    def _govern(
+        self, action, result, elapsed, env_delta, agent_delta, tokens_used, error,
+        extractor, validator, response,
+    ) -> StepResult:
+        # Fingerprinting and the step form one critical section on thread-safe agents
+        with self.agent.lock:
+            if response is not None:
+                obs = self.observation_from_text(action, response, result, elapsed, tokens_used, error)
+            else:
+                obs = Observation(
+                    action=action,
+                    result=result,
+                    env_state_delta=env_delta,
+                    agent_state_delta=agent_delta,
+                    elapsed_time=elapsed,
+                    tokens_used=tokens_used,
+                    error=error
+                )
         
-        obs = Observation(
-            action=action,
+            return self._session(extractor, validator).observe(obs)
+
+    def _session(self, extractor: Any = None, validator: Any = None) -> GovernedSession:
+        # If the agent has no extractor yet, it gets an LLMAgentExtractor with our token limit
+        return GovernedSession.of(
+            self.agent, extractor, validator,
+            default_extractor=lambda: LLMAgentExtractor(token_limit=self.token_limit),
+        )
+
+    def stream(
+        self,
+        action: str,
+        check_every: int = 64,
+        max_repetition: float = 0.6,
+    ) -> "StreamMonitor":
+        """
+        Govern a streaming generation as it happens.
+        
+        Call start_step() first, feed() every chunk, and stop generating as
+        soon as feed() returns False; close() then completes the step like
+        end_step(response=...). See StreamMonitor.
+        """
+        return StreamMonitor(self, action, check_every, max_repetition)
+
+    def observation_from_text(
+        self,
+        action: str,
+        response: str,
+        result: str = "success",
+        elapsed_time: float = 0.0,
+        tokens_used: int = 0,
+        error: Optional[str] = None,
+    ) -> Observation:
+        """
+        Build an Observation from raw response text.
+        
+        env_state_delta is the response's novelty against the recent
+        responses, agent_state_delta how much it changed since the previous
+        one, and the action becomes "<action>#<cluster>" so that
+        near-duplicates read as repeated actions.
+        """
+        if self.fingerprints is None:
+            self.fingerprints = TextFingerprintIndex()
+        match = self.last_match = self.fingerprints.add(response)
+        return Observation(
+            action=f"{action}#{match.cluster}",
             result=result,
-            env_state_delta=env_delta,
-            agent_state_delta=agent_delta,
-            elapsed_time=elapsed,
+            env_state_delta=match.novelty,
+            agent_state_delta=match.delta,
+            elapsed_time=elapsed_time,
             tokens_used=tokens_used,
-            error=error
+            error=error,
         )
+
+
+class StreamMonitor:
+    """
+    Watches one streaming LLM generation and says when to abort it.
+    
+    feed() only buffers the chunk and counts tokens. Every `check_every`
+    tokens it evaluates the partial response:
+    - Repetition inside the stream: the share of word 3-grams already seen
+      earlier in this response. At or above `max_repetition` the stream is
+      aborted (runaway loop)
+    - Governance: a partial Observation (tokens so far plus the next
+      check_every, elapsed time, 1 - repetition as state deltas) is run
+      through GovernedSession.probe(); if that step would HALT the agent,
+      the stream is aborted
+    
+    Nothing is committed to the agent until close(), which runs the real
+    step on the full text and the actual token count.
+    """
+    
+    # Streams shorter than this many 3-grams are not judged for repetition
+    MIN_SHINGLES = 16
+    
+    def __init__(self, adapter: LLMLoopAdapter, action: str, check_every: int = 64, max_repetition: float = 0.6):
+        if check_every <= 0:
+            raise ValueError(f"check_every must be positive, got {check_every}")
+        self.adapter = adapter
+        self.action = action
+        self.check_every = check_every
+        self.max_repetition = max_repetition
+        self.tokens = 0
+        self.repetition = 0.0
+        self.abort_reason: Optional[str] = None
+        self.probe_failure: Optional[FailureType] = None
+        self._chunks: list = []
+        self._scanned = 0          # Chunks already shingled
+        self._pending = b""        # Trailing word that may continue in the next chunk
+        self._tail: list = []      # Last two complete words (3-grams span chunks)
+        self._shingles: set = set()
+        self._total = 0
+        self._next_check = check_every
+    
+    @property
+    def aborted(self) -> bool:
+        return self.abort_reason is not None
+    
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+    
+    def feed(self, chunk: str, tokens: int = 1) -> bool:
+        """Add a chunk of `tokens` tokens; False means abort the stream now."""
+        self._chunks.append(chunk)
+        self.tokens += tokens
+        if self.tokens >= self._next_check and self.abort_reason is None:
+            self._next_check = self.tokens + self.check_every
+            self._check()
+        return self.abort_reason is None
+    
+    def wrap(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Yield chunks (one token each) until the stream ends or must be aborted."""
+        for chunk in chunks:
+            yield chunk
+            if not self.feed(chunk):
+                return
+    
+    def close(self, result: Optional[str] = None, error: Optional[str] = None) -> StepResult:
+        """
+        Complete the step with the text received so far.
         
-        # If no extractor provided, try to use LLMAgentExtractor with our token limit
-        if extractor is None and not hasattr(self.agent, '_extractor'):
-             from emocore.extractor import LLMAgentExtractor
-             self.agent._extractor = LLMAgentExtractor(token_limit=self.token_limit)
+        result defaults to 'failure' for an aborted stream, 'success' otherwise.
+        """
+        if result is None:
+            result = "failure" if self.aborted else "success"
+        return self.adapter.end_step(
+            self.action, result, tokens_used=self.tokens, error=error, response=self.text,
+        )
+    
+    def _check(self) -> None:
+        self._scan()
+        if self._total >= self.MIN_SHINGLES and self.repetition >= self.max_repetition:
+            self.abort_reason = "repetition"
+            return
         
-        return observe(self.agent, obs, extractor=extractor, validator=validator)
+        change = 1.0 - self.repetition
+        partial = Observation(
+            action=self.action,
+            result="success",
+            env_state_delta=change,
+            agent_state_delta=change,
+            elapsed_time=time.monotonic() - self.adapter.last_step_start,
+            tokens_used=self.tokens + self.check_every,  # Projected to the next check
+        )
+        code = self.adapter._session().probe(partial)
+        if is_halted(code):
+            self.probe_failure = failure_of(code)
+            self.abort_reason = "projected_halt"
+    
+    def _scan(self) -> None:
+        """Shingle the chunks received since the last check."""
+        new = normalize("".join(self._chunks[self._scanned:]))
+        self._scanned = len(self._chunks)
+        data = self._pending + new
+        words = data.split()
+        # A chunk can end mid-word: keep the last word until a separator follows
+        self._pending = words.pop() if words and not data.endswith(b" ") else b""
+        window = self._tail + words
+        seen = self._shingles
+        grams = list(zip(window, window[1:], window[2:]))
+        seen.update(map(crc32, map(b" ".join, grams)))
+        self._total += len(grams)
+        self._tail = window[-2:]
+        repeated_total = self._total - len(seen)
+        self.repetition = repeated_total / self._total if self._total else 0.0
 
 
 class ToolCallingAgentAdapter:
@@ -86,40 +285,48 @@ class ToolCallingAgentAdapter:
                 result.success(env_delta=0.8)
         """
         start_time = time.monotonic()
-        state = {"status": "failure", "env_delta": 0.0, "agent_delta": 0.1, "error": None}
-        
-        class Auditor:
-            def success(self, env_delta: float = 0.1, agent_delta: float = 0.1):
-                state["status"] = "success"
-                state["env_delta"] = env_delta
-                state["agent_delta"] = agent_delta
-            
-            def error(self, msg: str):
-                state["status"] = "error"
-                state["error"] = msg
-        
-        auditor = Auditor()
+        auditor = ToolAuditor()
         try:
             yield auditor
         except Exception as e:
-            state["status"] = "error"
-            state["error"] = str(e)
+            auditor.error(str(e))
             raise
         finally:
-            elapsed = time.monotonic() - start_time
-            obs = Observation(
-                action=tool_name,
-                result=state["status"],
-                env_state_delta=state["env_delta"],
-                agent_state_delta=state["agent_delta"],
-                elapsed_time=elapsed,
-                error=state["error"]
-            )
+            obs = auditor.observation(tool_name, time.monotonic() - start_time)
             # We store the result on the auditor for optional retrieval
-            
-            # If no extractor exists, default to ToolAgentExtractor
-            if not hasattr(self.agent, '_extractor'):
-                from emocore.extractor import ToolAgentExtractor
-                self.agent._extractor = ToolAgentExtractor()
-                
-            auditor.governance_result = observe(self.agent, obs)
+            auditor.governance_result = _tool_session(self.agent).observe(obs)
+
+
+class ToolAuditor:
+    """Outcome of one monitored tool call (failure unless reported otherwise)."""
+    
+    def __init__(self):
+        self.status = "failure"
+        self.env_delta = 0.0
+        self.agent_delta = 0.1
+        self.error_message: Optional[str] = None
+        self.governance_result: Optional[StepResult] = None
+    
+    def success(self, env_delta: float = 0.1, agent_delta: float = 0.1):
+        self.status = "success"
+        self.env_delta = env_delta
+        self.agent_delta = agent_delta
+    
+    def error(self, msg: str):
+        self.status = "error"
+        self.error_message = msg
+    
+    def observation(self, tool_name: str, elapsed: float) -> Observation:
+        return Observation(
+            action=tool_name,
+            result=self.status,
+            env_state_delta=self.env_delta,
+            agent_state_delta=self.agent_delta,
+            elapsed_time=elapsed,
+            error=self.error_message,
+        )
+
+
+def _tool_session(agent: EmoCoreAgent) -> GovernedSession:
+    # If no extractor exists, default to ToolAgentExtractor
+    return GovernedSession.of(agent, default_extractor=ToolAgentExtractor)
@@ -2,17 +2,84 @@
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import threading
+from contextlib import nullcontext
+from typing import Optional
 from emocore.engine import EmoEngine
+from emocore.clock import Clock
 from emocore.profiles import Profile, PROFILES, ProfileType
 
 
+# Shared no-op context for agents that are not thread-safe (stateless)
+NO_LOCK = nullcontext()
+
+
 class EmoCoreAgent:
-    def __init__(self, profile: Profile = PROFILES[ProfileType.BALANCED]):
-        self.engine = EmoEngine(profile)
+    """
+    One governed session: an EmoEngine plus (created on first observe())
+    the agent-owned extractor, validator and GovernedSession.
+
+    thread_safe=True gives the agent its own re-entrant lock (`lock`).
+    Every governance entry point then runs under it: step(),
+    step_decision(), reset(), interface.step / step_many / observe /
+    observe_batch, GovernedSession and the adapters. Concurrent callers
+    are serialized per agent, so a step sees a consistent engine,
+    extractor and validator, and HALT stays terminal. Agents never share
+    a lock, so threads driving different agents do not contend. Calling
+    agent.engine directly bypasses the lock.
+    """
+
+    def __init__(
+        self,
+        profile: Profile = PROFILES[ProfileType.BALANCED],
+        clock: Optional[Clock] = None,
+        forecast: bool = False,
+        compiled: bool = False,
+        thread_safe: bool = False,
+    ):
+        # compiled=True: profile-specialized step routine (see emocore.compiler)
+        self.engine = EmoEngine(profile, clock=clock, compiled=compiled)
+        # Attach a lazy HorizonForecast to every StepResult (see emocore.horizon)
+        self.forecast = forecast
+        self.thread_safe = thread_safe
+        # Usable as `with agent.lock:` either way
+        self.lock = threading.RLock() if thread_safe else NO_LOCK
+
+    def step(
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
+        difficulty: float = 0.0,
+        trust: float = 1.0,
+        dt: Optional[float] = None,
+    ):
+        if self.thread_safe:
+            with self.lock:
+                return self.engine.step(reward, novelty, urgency, difficulty, trust, dt)
+        return self.engine.step(reward, novelty, urgency, difficulty, trust, dt)
+
+    def step_decision(
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
+        difficulty: float = 0.0,
+        trust: float = 1.0,
+        dt: Optional[float] = None,
+    ) -> int:
+        """Advance like step() and return an int decision code (see emocore.decision)."""
+        if self.thread_safe:
+            with self.lock:
+                return self.engine.step_decision(reward, novelty, urgency, difficulty, trust, dt)
+        return self.engine.step_decision(reward, novelty, urgency, difficulty, trust, dt)
 
-    def step(self, reward: float, novelty: float, urgency: float, difficulty: float = 0.0, trust: float = 1.0):
-        return self.engine.step(reward, novelty, urgency, difficulty, trust)
+    def current_budget(self):
+        """Budget of the latest step (zeroed after HALT)."""
+        with self.lock:
+            return self.engine.current_budget()
 
     def reset(self, reason: str) -> None:
         """Reset the agent from a HALTED state. See EmoEngine.reset for semantics."""
-        self.engine.reset(reason)
+        with self.lock:
+            self.engine.reset(reason)
@@ -74,3 +74,19 @@ class AppraisalEngine:
             arousal=deltas["arousal"],
             risk=deltas["risk"],
         )
+
+    def compute_values(self, reward: float, novelty: float, urgency: float, difficulty: float = 0.1):
+        """
+        Scalar form of compute(): the same deltas, without building the
+        stimulus dict or a PressureState.
+        
+        Returns:
+            (confidence, frustration, curiosity, arousal, risk) deltas.
+        """
+        return (
+            (reward*0.3) - (difficulty*0.1),
+            (0.0 if reward > 0 else difficulty*0.4) + (urgency*0.2),
+            (novelty*0.5) - ((1.0-novelty)*0.2),
+            urgency * 0.6,
+            -abs(reward)*0.3,
+        )
@@ -0,0 +1,275 @@
+# emocore/async_adapters.py
+"""
+asyncio adapters: the LLM loop and tool adapters for event-loop services.
+
+What this module provides:
+- AsyncLLMLoopAdapter: LLMLoopAdapter with `await adapter.end_step(...)`
+- AsyncToolCallingAgentAdapter: `async with adapter.monitor("tool") as audit`,
+  with an optional per-call timeout (the call is recorded as a "timeout"
+  result and asyncio.TimeoutError is raised)
+- GovernanceWorker: optional offloading. Adapters given a worker queue
+  their governance steps on it instead of running them on the event loop;
+  the worker runs everything queued since its last batch in one
+  executor call, on a single thread
+
+Semantics:
+- Inline (no worker), a governance step is a few tens of microseconds of
+  plain Python run on the loop, and never awaits
+- Steps reach an agent in submission order. Every adapter step runs
+  under agent.lock, so on a thread-safe agent (thread_safe=True) inline
+  and worker steps, or several workers, serialize safely. The default
+  agent lock is a no-op: govern such an agent inline or through one
+  worker, not both
+- A submitted step is always committed. Cancelling the awaiting task
+  only drops the result; a tool call cancelled inside `monitor` is
+  recorded as a "failure" with error "cancelled" and the CancelledError
+  propagates without waiting for governance
+- A closed worker rejects new steps with RuntimeError. If a batch cannot
+  be handed to the executor, its futures and those of every queued step
+  get that error (or are cancelled, if the drain task is), never left pending
+
+What this module does NOT do:
+- Make governance itself asynchronous or parallel: steps are CPU work,
+  the worker only moves them off the loop thread
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, List, Optional, Tuple
+
+from emocore.adapters import LLMLoopAdapter, ToolAuditor, _tool_session
+from emocore.agent import EmoCoreAgent
+from emocore.cancellation import step_owner
+from emocore.fingerprint import TextFingerprintIndex, TextMatch
+from emocore.guarantees import StepResult
+
+
+class GovernanceWorker:
+    """
+    Runs queued governance steps in batches on one worker thread.
+
+    One worker can serve any number of adapters on one event loop. Call
+    close() (or use `async with`) to stop its thread.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="emocore-governance")
+        self._pending: List[Tuple[Callable, tuple, asyncio.Future, Optional[asyncio.Task]]] = []
+        self._drain: Optional[asyncio.Task] = None
+        self._closed = False
+        self.batches = 0
+
+    def submit(self, fn: Callable, *args) -> asyncio.Future:
+        """
+        Queue fn(*args); the returned future resolves when its batch has run.
+
+        The step runs on behalf of the submitting task (see
+        cancellation.step_owner): a HALT it causes does not cancel that task.
+        Raises RuntimeError once the worker is closed.
+        """
+        if self._closed:
+            raise RuntimeError("GovernanceWorker is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((fn, args, future, asyncio.current_task(loop)))
+        if self._drain is None:
+            self._drain = loop.create_task(self._run())
+        return future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    outcomes = await loop.run_in_executor(self._executor, _run_batch, batch)
+                except asyncio.CancelledError:
+                    self._abandon(batch, None)
+                    raise
+                except Exception as e:
+                    # Executor shut down or the batch could not be scheduled:
+                    # nothing that is queued will run
+                    self._abandon(batch, e)
+                    return
+                self.batches += 1
+                for (_, _, future, _), (ok, value) in zip(batch, outcomes):
+                    if future.done():
+                        continue  # Awaiting task was cancelled; the step still ran
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+        finally:
+            self._drain = None
+
+    def _abandon(self, batch, error: Optional[BaseException]) -> None:
+        """Fail (error) or cancel (None) the futures of `batch` and of every queued step."""
+        queued, self._pending = self._pending, []
+        for _, _, future, _ in batch + queued:
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    def close(self) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "GovernanceWorker":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._drain is not None:
+            await asyncio.shield(self._drain)
+        self.close()
+
+
+def _run_batch(batch) -> List[Tuple[bool, Any]]:
+    outcomes = []
+    for fn, args, _, owner in batch:
+        try:
+            with step_owner(owner):
+                outcomes.append((True, fn(*args)))
+        except Exception as e:  # Delivered to the step's own future
+            outcomes.append((False, e))
+    return outcomes
+
+
+class AsyncLLMLoopAdapter:
+    """
+    LLMLoopAdapter for asyncio code: `await end_step(...)`.
+
+    Elapsed time is measured when end_step() is called; with a worker, the
+    response fingerprinting and the governance step both run on the worker.
+    """
+
+    def __init__(
+        self,
+        agent: EmoCoreAgent,
+        token_limit: int = 100000,
+        fingerprints: Optional[TextFingerprintIndex] = None,
+        worker: Optional[GovernanceWorker] = None,
+    ):
+        self.adapter = LLMLoopAdapter(agent, token_limit, fingerprints)
+        self.worker = worker
+
+    @property
+    def agent(self) -> EmoCoreAgent:
+        return self.adapter.agent
+
+    @property
+    def last_match(self) -> Optional[TextMatch]:
+        return self.adapter.last_match
+
+    def start_step(self):
+        """Mark the start of an LLM generation step."""
+        self.adapter.start_step()
+
+    async def end_step(
+        self,
+        action: str,
+        result: str,
+        env_delta: float = 0.0,
+        agent_delta: float = 0.1,
+        tokens_used: int = 0,
+        error: Optional[str] = None,
+        extractor: Any = None,
+        validator: Any = None,
+        response: Optional[str] = None,
+    ) -> StepResult:
+        """LLMLoopAdapter.end_step(), off the event loop when a worker is set."""
+        elapsed = time.monotonic() - self.adapter.last_step_start
+        args = (action, result, elapsed, env_delta, agent_delta, tokens_used, error,
+                extractor, validator, response)
+        if self.worker is None:
+            return self.adapter._govern(*args)
+        return await self.worker.submit(self.adapter._govern, *args)
+
+
+class AsyncToolCallingAgentAdapter:
+    """ToolCallingAgentAdapter for asyncio code: `async with adapter.monitor(...)`."""
+
+    def __init__(self, agent: EmoCoreAgent, worker: Optional[GovernanceWorker] = None):
+        self.agent = agent
+        self.worker = worker
+
+    @asynccontextmanager
+    async def monitor(self, tool_name: str, timeout: Optional[float] = None):
+        """
+        Audit a tool execution.
+
+        Usage:
+            async with adapter.monitor("search", timeout=5.0) as result:
+                res = await do_search()
+                result.success(env_delta=0.8)
+
+        A call that exceeds `timeout` (or raises asyncio.TimeoutError
+        itself) is recorded with result "timeout".
+        """
+        start_time = time.monotonic()
+        auditor = ToolAuditor()
+        cancelled = False
+        try:
+            if timeout is None:
+                yield auditor
+            else:
+                async with _deadline(timeout):
+                    yield auditor
+        except asyncio.TimeoutError:
+            auditor.status = "timeout"
+            auditor.error_message = "timeout"
+            raise
+        except asyncio.CancelledError:
+            auditor.status = "failure"
+            auditor.error_message = "cancelled"
+            cancelled = True
+            raise
+        except Exception as e:
+            auditor.error(str(e))
+            raise
+        finally:
+            obs = auditor.observation(tool_name, time.monotonic() - start_time)
+            session = _tool_session(self.agent)
+            if self.worker is None:
+                auditor.governance_result = session.observe(obs)
+            else:
+                future = self.worker.submit(session.observe, obs)
+                if cancelled:
+                    # Don't hold up cancellation; the result lands on the auditor later
+                    future.add_done_callback(lambda f: _store_result(auditor, f))
+                else:
+                    auditor.governance_result = await future
+
+
+def _store_result(auditor: ToolAuditor, future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        auditor.governance_result = future.result()
+
+
+@asynccontextmanager
+async def _deadline(timeout: float):
+    """asyncio.timeout() (3.11+), with an equivalent fallback for 3.10."""
+    if hasattr(asyncio, "timeout"):
+        async with asyncio.timeout(timeout):
+            yield
+        return
+    task = asyncio.current_task()
+    expired = False
+
+    def expire():
+        nonlocal expired
+        expired = True
+        task.cancel()
+
+    handle = asyncio.get_running_loop().call_later(timeout, expire)
+    try:
+        yield
+    except asyncio.CancelledError:
+        if expired:
+            raise asyncio.TimeoutError from None
+        raise
+    finally:
+        handle.cancel()
@@ -0,0 +1,414 @@
+# emocore/batch_extractor.py
+"""
+Batch extractors: RuleBasedExtractor for many sessions at once.
+
+What a batch extractor does:
+- Holds the extraction state of N sessions in arrays (current_reward,
+  current_novelty, current_difficulty, failure_streak, stagnation_counter,
+  novelty_debt, signal_trust, step_count, loop_period,
+  steps_without_progress, plus the LLM token counter)
+- Keeps each session's action window (interned action IDs) and state
+  window (fingerprint hashes) as int64 ring buffers, so history
+  membership is one vectorized comparison
+- Extracts one observation per session for any subset of sessions with
+  array arithmetic, returning an (rows, 5) signal array in Signals field
+  order (reward, novelty, urgency, difficulty, trust), ready for
+  interface.step_many() or EmoFleet.step()
+
+What a batch extractor does NOT do:
+- Change results: row i equals what the matching scalar extractor
+  (RuleBasedExtractor, LLMAgentExtractor, ToolAgentExtractor) returns for
+  the same session history, bit for bit, for finite inputs
+- Vectorize the string work: actions, results and the state fingerprint
+  (hash of action, result and rounded env delta) are handled per row in
+  Python, exactly like the scalar extractor, then stored as integers. The
+  periodic loop detectors (emocore.loops) also step per row
+- Validate signals (that's SignalValidator's job)
+
+Requires NumPy (the "fleet" extra).
+
+Usage:
+    extractor = BatchLLMAgentExtractor(size=1000, token_limit=50_000)
+    signals = extractor.extract(columns, sessions=active)   # (len(active), 5)
+"""
+from typing import Mapping, Sequence, Union
+
+import numpy as np
+
+from emocore.extractor import RuleBasedExtractor
+from emocore.observation import Observation
+from emocore.loops import PeriodDetector
+from emocore.symbols import ACTIONS, SymbolTable
+
+# Interned result kinds (any other string is OTHER)
+OTHER, SUCCESS, FAILURE, TIMEOUT, ERROR = 0, 1, 2, 3, 4
+_RESULT_KINDS = {"success": SUCCESS, "failure": FAILURE, "timeout": TIMEOUT, "error": ERROR}
+
+_COLUMNS = ("action", "result", "env_state_delta", "agent_state_delta", "elapsed_time")
+
+
+class _Rows:
+    """One batch of observations as columns (Python lists for strings, arrays for numbers)."""
+
+    __slots__ = ("action", "result", "kind", "env", "agent", "elapsed", "tokens", "has_error", "n")
+
+    def __init__(self, observations: Union[Sequence[Observation], Mapping[str, Sequence]]):
+        if isinstance(observations, Mapping):
+            missing = [name for name in _COLUMNS if name not in observations]
+            if missing:
+                raise ValueError(f"Columnar observations are missing columns: {missing}")
+            action = _as_list(observations["action"])
+            result = _as_list(observations["result"])
+            env = np.asarray(observations["env_state_delta"], dtype=np.float64)
+            agent = np.asarray(observations["agent_state_delta"], dtype=np.float64)
+            elapsed = np.asarray(observations["elapsed_time"], dtype=np.float64)
+            n = len(action)
+            tokens = (
+                np.asarray(observations["tokens_used"], dtype=np.int64)
+                if "tokens_used" in observations else np.zeros(n, dtype=np.int64)
+            )
+            errors = _as_list(observations["error"]) if "error" in observations else [None] * n
+        else:
+            observations = list(observations)
+            action = [o.action for o in observations]
+            result = [o.result for o in observations]
+            env = np.array([o.env_state_delta for o in observations], dtype=np.float64)
+            agent = np.array([o.agent_state_delta for o in observations], dtype=np.float64)
+            elapsed = np.array([o.elapsed_time for o in observations], dtype=np.float64)
+            tokens = np.array([o.tokens_used for o in observations], dtype=np.int64)
+            errors = [o.error for o in observations]
+            n = len(action)
+
+        for name, column in (("result", result), ("env_state_delta", env),
+                             ("agent_state_delta", agent), ("elapsed_time", elapsed),
+                             ("tokens_used", tokens), ("error", errors)):
+            if len(column) != n:
+                raise ValueError(f"Column {name!r} has {len(column)} rows, expected {n}")
+
+        self.n = n
+        self.action = action
+        self.result = result
+        self.kind = np.array([_RESULT_KINDS.get(r, OTHER) for r in result], dtype=np.int8)
+        self.env = env
+        self.agent = agent
+        self.elapsed = elapsed
+        self.tokens = tokens
+        self.has_error = np.array([e is not None for e in errors], dtype=bool)
+
+
+def _as_list(column) -> list:
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+class BatchRuleBasedExtractor:
+    """
+    Vectorized RuleBasedExtractor for `size` independent sessions.
+
+    Row i of every state array is the state one RuleBasedExtractor would
+    hold. Thresholds and limits are shared by all sessions and default to
+    the scalar extractor's.
+    """
+
+    W_ENV = RuleBasedExtractor.W_ENV
+    W_AGENT = RuleBasedExtractor.W_AGENT
+    STATE_HASH_WINDOW = RuleBasedExtractor.STATE_HASH_WINDOW
+    ACTION_WINDOW = RuleBasedExtractor.ACTION_WINDOW
+    symbols: SymbolTable = ACTIONS  # Same action interning as the scalar extractor
+    LOOP_MAX_PERIOD = RuleBasedExtractor.LOOP_MAX_PERIOD
+    LOOP_NGRAM = RuleBasedExtractor.LOOP_NGRAM
+    LOOP_NOVELTY_SCALE = RuleBasedExtractor.LOOP_NOVELTY_SCALE
+    LOOP_DIFFICULTY = RuleBasedExtractor.LOOP_DIFFICULTY
+
+    def __init__(
+        self,
+        size: int,
+        time_limit: float = 300.0,
+        step_limit: int = 50,
+        progress_threshold: float = 0.05,
+        stagnation_limit: int = 5,
+    ):
+        self.size = size
+        self.time_limit = time_limit
+        self.step_limit = step_limit
+        self.progress_threshold = progress_threshold
+        self.stagnation_limit = stagnation_limit
+        self._allocate()
+
+    def _allocate(self) -> None:
+        n = self.size
+        self.step_count = np.zeros(n, dtype=np.int64)
+        self.failure_streak = np.zeros(n, dtype=np.int64)
+        self.stagnation_counter = np.zeros(n, dtype=np.int64)
+        self.current_reward = np.zeros(n, dtype=np.float64)
+        self.current_novelty = np.ones(n, dtype=np.float64)
+        self.current_difficulty = np.zeros(n, dtype=np.float64)
+        self.novelty_debt = np.zeros(n, dtype=np.float64)
+        self.signal_trust = np.ones(n, dtype=np.float64)
+        # History windows: one entry is appended per extracted step, so the
+        # number of valid slots is min(step_count, window)
+        self._action_history = np.zeros((n, self.ACTION_WINDOW), dtype=np.int64)
+        self._state_history = np.zeros((n, self.STATE_HASH_WINDOW), dtype=np.int64)
+        # Periodic loop detection (S-2): one rolling-hash detector per session
+        self.loop_period = np.zeros(n, dtype=np.int64)
+        self.steps_without_progress = np.zeros(n, dtype=np.int64)
+        self._loop_detectors = [self._new_loop_detector() for _ in range(n)]
+
+    def _new_loop_detector(self) -> PeriodDetector:
+        return PeriodDetector(self.LOOP_MAX_PERIOD, self.LOOP_NGRAM)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def reset(self, sessions=None) -> None:
+        """Reset all sessions, or only the given ones, to a fresh extractor state."""
+        if sessions is None:
+            self._allocate()
+            return
+        s = np.asarray(sessions, dtype=np.intp)
+        for name in ("step_count", "failure_streak", "stagnation_counter", "current_reward",
+                     "current_difficulty", "novelty_debt"):
+            getattr(self, name)[s] = 0
+        self.current_novelty[s] = 1.0
+        self.signal_trust[s] = 1.0
+        self._action_history[s] = 0
+        self._state_history[s] = 0
+        self.loop_period[s] = 0
+        self.steps_without_progress[s] = 0
+        for i in s.tolist():
+            self._loop_detectors[i] = self._new_loop_detector()
+
+    # --------------------------------------------------
+    # Extraction
+    # --------------------------------------------------
+
+    def extract(
+        self,
+        observations: Union[Sequence[Observation], Mapping[str, Sequence]],
+        sessions=None,
+    ) -> np.ndarray:
+        """
+        Extract one step for each given session.
+
+        Args:
+            observations: One Observation per row, or a mapping of parallel
+                          columns (action, result, env_state_delta,
+                          agent_state_delta, elapsed_time and optionally
+                          tokens_used, error).
+            sessions: Session index of each row (distinct). Defaults to
+                      every session, in order.
+
+        Returns:
+            (rows, 5) float64 array: reward, novelty, urgency, difficulty, trust.
+        """
+        rows = _Rows(observations)
+        s = self._sessions(sessions, rows.n)
+
+        self.step_count[s] += 1
+
+        # 0. State cycling detection (S-1): a repeated fingerprint means no env change
+        state_hashes = self._state_hashes(rows)
+        cycling = self._seen(self._state_history, s, state_hashes)
+        self._append(self._state_history, s, state_hashes)
+        effective_env = np.where(cycling, 0.0, rows.env)
+
+        # S-2 progress: a success that moved the environment (reported delta)
+        progress = (rows.kind == SUCCESS) & (rows.env >= self.progress_threshold)
+        self.steps_without_progress[s] = np.where(progress, 0, self.steps_without_progress[s] + 1)
+
+        # 1. Composite state delta
+        state_delta = self.W_ENV * effective_env + self.W_AGENT * rows.agent
+
+        # 2. Trust, then base signals (same order as the scalar extractor)
+        self._update_trust(s, rows, state_delta)
+        reward = self._compute_reward(s, rows, state_delta)
+        novelty = self._compute_novelty(s, rows)
+        urgency = self._compute_urgency(s, rows)
+        difficulty = self._compute_difficulty(s, rows, state_delta)
+
+        # 3. Frustration dominance. Python's float pow, not d*d / np.power:
+        #    they differ from it in the last bit for some inputs.
+        squared = np.array([d ** 2 for d in difficulty.tolist()], dtype=np.float64)
+        effective_novelty = novelty * (1.0 - squared)
+
+        # 4. Trust gating (difficulty is not gated)
+        trust = self.signal_trust[s]
+        out = np.empty((rows.n, 5), dtype=np.float64)
+        out[:, 0] = np.clip(reward * trust, -1.0, 1.0)
+        out[:, 1] = np.clip(effective_novelty * trust, 0.0, 1.0)
+        out[:, 2] = np.clip(urgency, 0.0, 1.0)
+        out[:, 3] = np.clip(difficulty, 0.0, 1.0)
+        out[:, 4] = np.clip(trust, 0.0, 1.0)
+        return out
+
+    def _sessions(self, sessions, n: int) -> np.ndarray:
+        if sessions is None:
+            if n != self.size:
+                raise ValueError(f"Expected {self.size} rows (one per session), got {n}")
+            return np.arange(n, dtype=np.intp)
+        s = np.asarray(sessions, dtype=np.intp)
+        if s.shape != (n,):
+            raise ValueError(f"Expected {n} session indices, got shape {s.shape}")
+        if n and (s.min() < 0 or s.max() >= self.size):
+            raise IndexError("session index out of range")
+        if len(np.unique(s)) != n:
+            raise ValueError("Each session may appear at most once per batch")
+        return s
+
+    # --------------------------------------------------
+    # History windows
+    # --------------------------------------------------
+
+    def _state_hashes(self, rows: _Rows) -> np.ndarray:
+        # Same fingerprint as RuleBasedExtractor._compute_state_hash, stored in
+        # the window as is (hash() fits in int64): no ID table grows with the
+        # number of distinct states, and hash collisions behave identically.
+        return np.array([
+            hash((a, r, round(d, 2)))
+            for a, r, d in zip(rows.action, rows.result, rows.env.tolist())
+        ], dtype=np.int64)
+
+    def _intern_actions(self, rows: _Rows) -> np.ndarray:
+        intern = self.symbols.intern
+        return np.array([intern(a) for a in rows.action], dtype=np.int64)
+
+    def _seen(self, history: np.ndarray, s: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Whether ids[i] is in the window of session s[i] (before this step)."""
+        window = history.shape[1]
+        filled = np.minimum(self.step_count[s] - 1, window)
+        valid = np.arange(window) < filled[:, None]
+        return ((history[s] == ids[:, None]) & valid).any(axis=1)
+
+    def _append(self, history: np.ndarray, s: np.ndarray, ids: np.ndarray) -> None:
+        history[s, (self.step_count[s] - 1) % history.shape[1]] = ids
+
+    # --------------------------------------------------
+    # Signal rules (vectorized RuleBasedExtractor methods)
+    # --------------------------------------------------
+
+    def _update_trust(self, s, rows: _Rows, state_delta) -> None:
+        thr = self.progress_threshold
+        success = rows.kind == SUCCESS
+        trust = self.signal_trust[s]
+        trust = np.where(success & (state_delta < thr), trust * 0.85, trust)
+        trust = np.where((rows.kind == FAILURE) & (rows.agent > 0.8), trust * 0.9, trust)
+        trust = np.where(success & (state_delta > thr), np.minimum(1.0, trust + 0.05), trust)
+        self.signal_trust[s] = trust
+
+    def _compute_reward(self, s, rows: _Rows, state_delta) -> np.ndarray:
+        reward = self.current_reward[s]
+        step = np.select(
+            [rows.kind == SUCCESS, rows.kind == FAILURE, rows.kind == TIMEOUT],
+            [reward + 0.3, reward - 0.5, reward - 0.8],
+            reward,
+        )
+        reward = np.where(state_delta < self.progress_threshold, reward * 0.8 - 0.05, step)
+        reward = np.clip(reward, -1.0, 1.0)
+        self.current_reward[s] = reward
+        return reward
+
+    def _compute_novelty(self, s, rows: _Rows) -> np.ndarray:
+        action_ids = self._intern_actions(rows)
+        seen = self._seen(self._action_history, s, action_ids)
+        self._append(self._action_history, s, action_ids)
+        detectors = self._loop_detectors
+        loop_period = np.array(
+            [detectors[i].push(a) for i, a in zip(s.tolist(), action_ids.tolist())], dtype=np.int64,
+        )
+        self.loop_period[s] = loop_period
+        novelty = self.current_novelty[s]
+        novelty = np.where(seen, novelty * 0.7, novelty + 0.4)
+        self.current_novelty[s] = novelty
+
+        reward = self.current_reward[s]
+        debt = self.novelty_debt[s]
+        debt = np.where((novelty > 0.5) & (reward <= 0), debt + novelty, debt)
+        debt = np.where(reward > 0.5, debt * 0.8, debt)
+        self.novelty_debt[s] = debt
+
+        novelty = np.where(
+            debt > 5.0, 0.0, np.where(debt > 3.0, novelty * 0.5, np.minimum(1.0, novelty))
+        )
+        stalled = (loop_period > 0) & (loop_period <= self.steps_without_progress[s])
+        return np.where(stalled, novelty * self.LOOP_NOVELTY_SCALE, novelty)
+
+    def _compute_urgency(self, s, rows: _Rows) -> np.ndarray:
+        if self.time_limit:
+            time_pressure = np.minimum(1.0, rows.elapsed / self.time_limit)
+        else:
+            time_pressure = np.zeros(rows.n)
+        if self.step_limit:
+            step_pressure = np.minimum(1.0, self.step_count[s] / self.step_limit)
+        else:
+            step_pressure = np.zeros(rows.n)
+        return np.maximum(time_pressure, step_pressure)
+
+    def _compute_difficulty(self, s, rows: _Rows, state_delta) -> np.ndarray:
+        streak = np.where(rows.kind != SUCCESS, self.failure_streak[s] + 1, 0)
+        stagnation = np.where(state_delta < self.progress_threshold, self.stagnation_counter[s] + 1, 0)
+        self.failure_streak[s] = streak
+        self.stagnation_counter[s] = stagnation
+
+        difficulty = np.where(streak > 0, 0.2 * streak, 0.0)
+        difficulty = np.where(stagnation >= self.stagnation_limit, difficulty + 0.5, difficulty)
+        difficulty = np.where(rows.kind == ERROR, difficulty + 0.3, difficulty)
+        loop_period = self.loop_period[s]
+        stalled = (loop_period > 0) & (loop_period <= self.steps_without_progress[s])
+        difficulty = np.where(stalled, difficulty + self.LOOP_DIFFICULTY, difficulty)
+
+        current = np.maximum(self.current_difficulty[s] * 0.9, difficulty)
+        self.current_difficulty[s] = current
+        return np.minimum(1.0, current)
+
+
+class BatchLLMAgentExtractor(BatchRuleBasedExtractor):
+    """Vectorized LLMAgentExtractor: token pressure and reasoning-theater trust decay."""
+
+    def __init__(
+        self,
+        size: int,
+        time_limit: float = 300.0,
+        step_limit: int = 50,
+        token_limit: int = 100000,
+        progress_threshold: float = 0.05,
+        stagnation_limit: int = 5,
+    ):
+        self.token_limit = token_limit
+        super().__init__(size, time_limit, step_limit, progress_threshold, stagnation_limit)
+
+    def _allocate(self) -> None:
+        super()._allocate()
+        self.tokens_accumulated = np.zeros(self.size, dtype=np.int64)
+
+    def reset(self, sessions=None) -> None:
+        super().reset(sessions)
+        if sessions is not None:
+            self.tokens_accumulated[np.asarray(sessions, dtype=np.intp)] = 0
+
+    def _compute_urgency(self, s, rows: _Rows) -> np.ndarray:
+        tokens = self.tokens_accumulated[s] + rows.tokens
+        self.tokens_accumulated[s] = tokens
+        if self.token_limit:
+            token_pressure = tokens / self.token_limit
+        else:
+            token_pressure = np.zeros(rows.n)
+        return np.maximum(super()._compute_urgency(s, rows), token_pressure)
+
+    def _update_trust(self, s, rows: _Rows, state_delta) -> None:
+        super()._update_trust(s, rows, state_delta)
+        theater = (rows.env < 0.01) & (rows.agent > 0.8)
+        self.signal_trust[s] = np.where(theater, self.signal_trust[s] * 0.9, self.signal_trust[s])
+
+
+class BatchToolAgentExtractor(BatchRuleBasedExtractor):
+    """Vectorized ToolAgentExtractor: env-change reward bonus and error difficulty spike."""
+
+    def _compute_reward(self, s, rows: _Rows, state_delta) -> np.ndarray:
+        self.current_reward[s] = np.where(
+            rows.env > 0.2, self.current_reward[s] + 0.2, self.current_reward[s]
+        )
+        return super()._compute_reward(s, rows, state_delta)
+
+    def _compute_difficulty(self, s, rows: _Rows, state_delta) -> np.ndarray:
+        difficulty = super()._compute_difficulty(s, rows, state_delta)
+        spike = (rows.kind == ERROR) | rows.has_error
+        return np.where(spike, np.maximum(difficulty, 0.6), difficulty)
@@ -0,0 +1,163 @@
+# emocore/batch_validator.py
+"""
+BatchSignalValidator: SignalValidator for many sessions at once.
+
+What BatchSignalValidator does:
+- Holds the validation state of N sessions in arrays: the last validated
+  signals, the number of validated steps, and each session's reward sign
+  flips over the oscillation window (a ring of 0/1 flags plus their
+  running count, as in SignalValidator)
+- Validates an (rows, 5) signal array (Signals field order: reward,
+  novelty, urgency, difficulty, trust) for any subset of sessions with
+  array arithmetic: range clamping, delta limiting, oscillation check
+
+What BatchSignalValidator does NOT do:
+- Change results: row i equals what one SignalValidator per session returns
+  for the same history, bit for bit, including NaN clamping
+- Partially apply a strict batch: if any row fails strict validation, the
+  ValidationError SignalValidator raises for the first failing row is
+  raised before any session's state changes
+
+Requires NumPy (the "fleet" extra).
+
+Usage:
+    extractor = BatchLLMAgentExtractor(size=1000)
+    validator = BatchSignalValidator(size=1000)
+    signals = validator.validate(extractor.extract(rows, sessions=active), sessions=active)
+"""
+import numpy as np
+
+from emocore.validator import SignalValidator, ValidationError
+
+# Strict smoothness failures are reported in this field order (see SignalValidator)
+_SMOOTH_ORDER = ((3, "Difficulty"), (0, "Reward"), (1, "Novelty"), (2, "Urgency"), (4, "Trust"))
+_RANGE_NAMES = (("Reward", "[-1, 1]"), ("Novelty", "[0, 1]"), ("Urgency", "[0, 1]"), ("Difficulty", "[0, 1]"))
+_LOW = np.array([-1.0, 0.0, 0.0, 0.0, 0.0])
+
+
+class BatchSignalValidator:
+    """
+    Vectorized SignalValidator for `size` independent sessions.
+
+    Row i of every state array is the state one SignalValidator would hold.
+    """
+
+    MAX_DELTA = SignalValidator.MAX_DELTA
+    OSCILLATION_WINDOW = SignalValidator.OSCILLATION_WINDOW
+    MAX_FLIPS = SignalValidator.MAX_FLIPS
+
+    def __init__(self, size: int, strict: bool = False):
+        self.size = size
+        self.strict = strict
+        self._allocate()
+
+    def _allocate(self) -> None:
+        n = self.size
+        self.last = np.zeros((n, 5), dtype=np.float64)
+        self.step_count = np.zeros(n, dtype=np.int64)
+        # Flag k % (window - 1): sign flip between validated rewards k and k + 1
+        self._flips = np.zeros((n, self.OSCILLATION_WINDOW - 1), dtype=np.int64)
+        self.flip_count = np.zeros(n, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def reset(self, sessions=None) -> None:
+        """Reset all sessions, or only the given ones, to a fresh validator state."""
+        if sessions is None:
+            self._allocate()
+            return
+        s = np.asarray(sessions, dtype=np.intp)
+        self.last[s] = 0.0
+        self.step_count[s] = 0
+        self._flips[s] = 0
+        self.flip_count[s] = 0
+
+    def validate(self, signals, sessions=None) -> np.ndarray:
+        """
+        Validate one step for each given session.
+
+        Args:
+            signals: (rows, 5) array in Signals field order.
+            sessions: Session index of each row (distinct). Defaults to
+                      every session, in order.
+
+        Returns:
+            (rows, 5) float64 array of validated signals.
+        """
+        raw = np.asarray(signals, dtype=np.float64)
+        if raw.ndim != 2 or raw.shape[1] != 5:
+            raise ValueError(f"Expected a (rows, 5) signal array, got shape {raw.shape}")
+        s = self._sessions(sessions, raw.shape[0])
+        strict = self.strict
+
+        # 1. Range Check & Clamping
+        # Python's max(lo, min(1.0, nan)) is 1.0; np.clip would keep the NaN
+        out = np.where(np.isnan(raw), 1.0, np.clip(raw, _LOW, 1.0))
+
+        # 2. Smoothness Check (Delta Limiting), only for sessions with a previous step
+        count = self.step_count[s]
+        has_last = count > 0
+        previous = self.last[s]
+        delta = out - previous
+        over = (np.abs(delta) > self.MAX_DELTA) & has_last[:, None]
+        if not strict and over.any():
+            out = np.where(over, previous + np.copysign(self.MAX_DELTA, delta), out)
+
+        # 3. Oscillation Check
+        reward = out[:, 0]
+        last_reward = previous[:, 0]
+        flip = (((last_reward > 0) & (reward < 0)) | ((last_reward < 0) & (reward > 0))) & has_last
+        flip = flip.astype(np.int64)
+        if strict:
+            # Negated comparisons so NaN counts as out of range, like the scalar check
+            out_of_range = ~((raw[:, :4] >= _LOW[:4]) & (raw[:, :4] <= 1.0))
+            flips = self.flip_count[s] + flip
+            oscillating = (np.minimum(count, self.OSCILLATION_WINDOW) >= 4) & (flips > self.MAX_FLIPS)
+            failing = out_of_range.any(axis=1) | over.any(axis=1) | oscillating
+            if failing.any():
+                row = int(np.argmax(failing))
+                raise _first_violation(raw[row], out_of_range[row], over[row], delta[row], flips[row])
+
+        # Update state
+        ring = self._flips.shape[1]
+        pair = count - 1  # Index of the pair (previous, this) reward
+        slot = pair % ring
+        rows = np.flatnonzero(has_last)
+        ss, slot = s[rows], slot[rows]
+        # A full window drops its oldest pair, which sits in the slot being overwritten
+        leaving = np.where(pair[rows] >= ring, self._flips[ss, slot], 0)
+        self.flip_count[ss] += flip[rows] - leaving
+        self._flips[ss, slot] = flip[rows]
+        self.last[s] = out
+        self.step_count[s] = count + 1
+        return out
+
+    def _sessions(self, sessions, n: int) -> np.ndarray:
+        if sessions is None:
+            if n != self.size:
+                raise ValueError(f"Expected {self.size} rows (one per session), got {n}")
+            return np.arange(n, dtype=np.intp)
+        s = np.asarray(sessions, dtype=np.intp)
+        if s.shape != (n,):
+            raise ValueError(f"Expected {n} session indices, got shape {s.shape}")
+        if n and (s.min() < 0 or s.max() >= self.size):
+            raise IndexError("session index out of range")
+        if len(np.unique(s)) != n:
+            raise ValueError("Each session may appear at most once per batch")
+        return s
+
+
+def _first_violation(raw, out_of_range, over, delta, flips) -> ValidationError:
+    """The error SignalValidator raises for this row (checks in its order)."""
+    if out_of_range.any():
+        violations = [
+            f"{name} {value} out of {bounds}"
+            for value, (name, bounds), failed in zip(raw.tolist(), _RANGE_NAMES, out_of_range)
+            if failed
+        ]
+        return ValidationError(f"Range violations: {violations}")
+    for column, name in _SMOOTH_ORDER:
+        if over[column]:
+            return ValidationError(f"{name} delta {float(delta[column])} > {SignalValidator.MAX_DELTA}")
+    return ValidationError(f"Reward oscillation validation failed: {int(flips)} flips in history")
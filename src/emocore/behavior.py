@@ -21,7 +21,7 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BehaviorBudget:
     """
     Immutable budget representing behavioral permission.
@@ -37,6 +37,10 @@ class BehaviorBudget:
     exploration: float
 
 
+# Budget of a HALTED session (immutable, safe to share)
+ZERO_BUDGET = BehaviorBudget(0.0, 0.0, 0.0, 0.0)
+
+
 class BehaviorGate:
     """
     NOTE: This is a downstream control primitive.
@@ -0,0 +1,181 @@
+# emocore/cancellation.py
+"""
+HaltCancellation: cancel a session's in-flight work the moment it HALTs.
+
+What HaltCancellation does:
+- Binds asyncio tasks / futures and concurrent.futures futures to one
+  agent (session). Bound work is forgotten as soon as it completes
+- Listens to the agent's engine (EmoEngine.add_halt_listener): when a step
+  enters HALTED, every bound item is cancelled right away, not when its
+  result is next observed
+- Attaches the failure to the cancellation: asyncio tasks are cancelled
+  with a HaltNotice message (a str carrying `failure` and `reason`), which
+  code inside the task can read with halt_notice(exc)
+- Cancels work bound after the HALT immediately (until the agent is reset)
+
+What HaltCancellation does NOT do:
+- Stop work that cannot be cancelled: a concurrent.futures future that is
+  already running completes (only pending ones are cancelled); an asyncio
+  task can still catch the CancelledError
+- Cancel the task whose own step caused the HALT: it receives the HALTED
+  result from that step directly. A step run on the task's loop is
+  recognized by asyncio.current_task(); a step run off the loop must
+  name its task with `with step_owner(task):` (GovernanceWorker does)
+- Reset or step the agent
+
+Thread-safety: the HALT may come from any thread (a GovernanceWorker, a
+thread-pool executor). asyncio items on another thread's loop are
+cancelled through loop.call_soon_threadsafe().
+
+Usage:
+    cancellation = HaltCancellation.of(agent)
+    task = cancellation.bind(asyncio.create_task(call_llm(prompt)))
+    ...
+    except asyncio.CancelledError as e:
+        notice = halt_notice(e)   # HaltNotice or None
+"""
+import asyncio
+import concurrent.futures
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Set, Union
+
+from emocore.agent import EmoCoreAgent
+from emocore.failures import FailureType
+
+Cancellable = Union[asyncio.Future, concurrent.futures.Future]
+
+# The task a governance step runs for, when it runs off that task's loop
+_STEP_OWNER: ContextVar[Optional[asyncio.Future]] = ContextVar("emocore_step_owner", default=None)
+
+
+@contextmanager
+def step_owner(task: Optional[asyncio.Future]) -> Iterator[None]:
+    """
+    Run governance steps on behalf of `task` (e.g. on an executor thread):
+    a HALT caused by those steps does not cancel `task` itself.
+    """
+    token = _STEP_OWNER.set(task)
+    try:
+        yield
+    finally:
+        _STEP_OWNER.reset(token)
+
+
+class HaltNotice(str):
+    """Cancellation message naming the failure that halted the session."""
+
+    failure: FailureType
+    reason: Optional[str]
+
+    def __new__(cls, failure: FailureType, reason: Optional[str]):
+        notice = super().__new__(cls, f"emocore halt: {failure.name} ({reason})")
+        notice.failure = failure
+        notice.reason = reason
+        return notice
+
+
+def halt_notice(error: BaseException) -> Optional[HaltNotice]:
+    """The HaltNotice a CancelledError was raised with, if any."""
+    args = getattr(error, "args", ())
+    return args[0] if args and isinstance(args[0], HaltNotice) else None
+
+
+class HaltCancellation:
+    """Registry of one agent's in-flight work, cancelled on HALT."""
+
+    def __init__(self, agent: EmoCoreAgent):
+        self.agent = agent
+        self.notice: Optional[HaltNotice] = None  # Latest HALT (stale once the agent is reset)
+        self.cancelled = 0                         # Items cancelled so far
+        self._items: Set[Cancellable] = set()
+        self._lock = threading.Lock()             # This registry only; never shared
+        agent.engine.add_halt_listener(self._on_halt)
+        if agent.engine.halted:
+            self._on_halt(agent.engine._failure, agent.engine._reason)
+
+    @classmethod
+    def of(cls, agent: EmoCoreAgent) -> "HaltCancellation":
+        """The agent's registry, created on first use."""
+        with agent.lock:
+            registry = getattr(agent, "_cancellation", None)
+            if registry is None:
+                registry = agent._cancellation = cls(agent)
+            return registry
+
+    def bind(self, item: Cancellable) -> Cancellable:
+        """Cancel `item` if the session halts before it completes. Returns item."""
+        with self._lock:
+            notice = self.notice
+            if notice is not None and not self.agent.engine.halted:
+                notice = self.notice = None  # The agent was reset
+            if notice is None:
+                self._items.add(item)
+        if notice is not None:
+            self._cancel(item, notice, _STEP_OWNER.get())
+        else:
+            item.add_done_callback(self._discard)
+        return item
+
+    def unbind(self, item: Cancellable) -> None:
+        with self._lock:
+            self._items.discard(item)
+
+    def close(self) -> None:
+        """Stop listening to the engine and forget every bound item."""
+        self.agent.engine.remove_halt_listener(self._on_halt)
+        with self._lock:
+            self._items.clear()
+        if getattr(self.agent, "_cancellation", None) is self:
+            del self.agent._cancellation
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _discard(self, item: Cancellable) -> None:
+        with self._lock:
+            self._items.discard(item)
+
+    def _on_halt(self, failure: FailureType, reason: Optional[str]) -> None:
+        notice = HaltNotice(failure, reason)
+        owner = _STEP_OWNER.get()  # Listeners run inside the halting step
+        with self._lock:
+            self.notice = notice
+            items, self._items = self._items, set()
+        for item in items:
+            self._cancel(item, notice, owner)
+
+    def _cancel(self, item: Cancellable, notice: HaltNotice, owner: Optional[asyncio.Future]) -> None:
+        if isinstance(item, concurrent.futures.Future):
+            if item.cancel():
+                self._count()
+            return
+        if item is owner:
+            return  # The halting step ran for this task, off its loop
+        loop = item.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            if item is asyncio.current_task(loop):
+                return  # This task's own step halted the session
+            if item.cancel(notice):
+                self._count()
+        else:
+            try:
+                loop.call_soon_threadsafe(self._cancel_on_loop, item, notice)
+            except RuntimeError:
+                # Its loop is closed, so nothing will run the item again; the
+                # halting step must not raise over it
+                pass
+
+    def _cancel_on_loop(self, item: asyncio.Future, notice: HaltNotice) -> None:
+        if item.cancel(notice):
+            self._count()
+
+    def _count(self) -> None:
+        # Halts (and their loop callbacks) can run on several threads at once
+        with self._lock:
+            self.cancelled += 1
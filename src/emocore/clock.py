@@ -0,0 +1,149 @@
+# emocore/clock.py
+"""
+Clocks: where EmoEngine gets the elapsed time (dt) of each step.
+
+What a Clock does:
+- Answers "how much time passed since the previous step?" via tick()
+- Decides whether a caller-supplied dt is honored
+
+What a Clock does NOT do:
+- Sleep or schedule anything
+- Influence pressure, governance or failure directly (dt only feeds
+  time decay and recovery, exactly as before)
+
+Clocks:
+- MonotonicClock: the caller's dt when given, otherwise the wall time
+                  (time.monotonic()) since the previous step. This is the default.
+- DeltaClock:     the caller's dt is the step's dt (default_dt when omitted).
+                  Use for offline simulation and replay of logged timings.
+- VirtualClock:   time only moves when advance() is called. Caller dt is ignored.
+                  Use for deterministic tests.
+
+Under DeltaClock and VirtualClock, recovery_delay, time_persistence_decay and
+time_exploration_decay are fully deterministic and simulations run at CPU speed.
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class Clock(ABC):
+    """
+    Base class for step clocks.
+
+    `last` is the clock reading at the previous tick, in seconds.
+    """
+
+    last: float
+
+    @abstractmethod
+    def now(self) -> float:
+        """Current reading of this clock, in seconds."""
+        pass
+
+    @abstractmethod
+    def tick(self, dt: Optional[float] = None) -> float:
+        """Mark a step boundary and return the dt attributed to that step."""
+        pass
+
+    def steady_dt(self, dt: Optional[float] = None) -> Optional[float]:
+        """
+        dt that every further back-to-back step would observe, or None if
+        that depends on real time. Used by EmoEngine.advance() to decide
+        whether a run of steps can be computed in closed form.
+        """
+        return None
+
+    def skip(self, steps: int, dt: float) -> None:
+        """Account for `steps` ticks of `dt` that were computed in closed form."""
+        pass
+
+
+class MonotonicClock(Clock):
+    """Wall-clock time. A caller-supplied dt takes precedence over the measured one."""
+
+    def __init__(self):
+        self.last = time.monotonic()
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def tick(self, dt: Optional[float] = None) -> float:
+        now = time.monotonic()
+        if dt is None:
+            dt = now - self.last
+        elif dt < 0.0:
+            raise ValueError(f"dt must be >= 0, got {dt}")
+        self.last = now
+        return dt
+
+    def steady_dt(self, dt: Optional[float] = None) -> Optional[float]:
+        return dt
+
+    def skip(self, steps: int, dt: float) -> None:
+        self.last = time.monotonic()
+
+
+class DeltaClock(Clock):
+    """
+    Caller-driven time. Each step's dt is exactly what the caller passes.
+
+    Args:
+        default_dt: dt used when the caller passes None.
+    """
+
+    def __init__(self, default_dt: float = 1.0):
+        if default_dt < 0.0:
+            raise ValueError(f"default_dt must be >= 0, got {default_dt}")
+        self.default_dt = default_dt
+        self.last = 0.0
+
+    def now(self) -> float:
+        return self.last
+
+    def tick(self, dt: Optional[float] = None) -> float:
+        if dt is None:
+            dt = self.default_dt
+        elif dt < 0.0:
+            raise ValueError(f"dt must be >= 0, got {dt}")
+        self.last += dt
+        return dt
+
+    def steady_dt(self, dt: Optional[float] = None) -> Optional[float]:
+        return self.default_dt if dt is None else dt
+
+    def skip(self, steps: int, dt: float) -> None:
+        self.last += steps * dt
+
+
+class VirtualClock(Clock):
+    """
+    Manually advanced time. Ignores caller-supplied dt.
+
+    Usage:
+        clock = VirtualClock()
+        engine = EmoEngine(profile, clock=clock)
+        clock.advance(0.5)
+        engine.step(...)   # observes dt == 0.5
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self.last = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        if seconds < 0.0:
+            raise ValueError(f"Virtual time cannot move backwards ({seconds})")
+        self._now += seconds
+
+    def tick(self, dt: Optional[float] = None) -> float:
+        elapsed = self._now - self.last
+        self.last = self._now
+        return elapsed
+
+    def steady_dt(self, dt: Optional[float] = None) -> Optional[float]:
+        # Virtual time does not move between back-to-back steps
+        return 0.0
@@ -0,0 +1,231 @@
+# emocore/compiler.py
+"""
+Profile compiler: specialized EmoEngine step routines, one per profile.
+
+What the compiler does:
+- Generates the engine's step state machine (EmoEngine._step) for ONE
+  frozen Profile, with every profile constant, governance coefficient and
+  engine constant folded in as a literal
+- Removes work that is dead for that profile: zero governance terms, the
+  stagnating branch for columns whose stagnation scale is 1.0, time decay
+  terms when the decay is 0.0, the recovery rate term when it is 0.0
+- Caches the result per profile, so engines sharing a profile share code
+
+What the compiler does NOT do:
+- Change semantics: the compiled routine performs the same floating-point
+  operations in the same order as the generic path, minus terms that are
+  exactly zero for finite inputs
+- Use engine.appraisal / engine.governance (an engine built with
+  compiled=True ignores replacements of those objects)
+- Replace step(), step_view() or advance(): they call the compiled routine
+  in place of the generic one
+
+Usage:
+    engine = EmoEngine(profile, compiled=True)
+    print(compile_profile(profile).source)   # inspect the generated code
+"""
+import weakref
+from typing import Callable
+
+from emocore.failures import FailureType
+from emocore.governance import GovernanceEngine
+from emocore.modes import Mode
+from emocore.profiles import Profile
+
+
+class CompiledProfile:
+    """
+    Specialized step routine for one profile, plus its generated source.
+
+    Holds the profile's name only: a reference to the profile itself would
+    keep its _CACHE entry alive forever.
+    """
+
+    __slots__ = ("name", "source", "step", "__weakref__")
+
+    def __init__(self, name: str, source: str, step: Callable):
+        self.name = name
+        self.source = source
+        self.step = step
+
+    def __repr__(self) -> str:
+        return f"CompiledProfile({self.name!r})"
+
+
+# Profiles are frozen and hashable: equal profiles share compiled code, and
+# an entry lives as long as its key profile instance does.
+_CACHE: "weakref.WeakKeyDictionary[Profile, CompiledProfile]" = weakref.WeakKeyDictionary()
+
+
+def compile_profile(profile: Profile) -> CompiledProfile:
+    """Return the (cached) specialized step routine for `profile`."""
+    compiled = _CACHE.get(profile)
+    if compiled is None:
+        source = _generate(profile)
+        namespace = {"Mode": Mode, "FailureType": FailureType}
+        code = compile(source, f"<emocore.compiled:{profile.name}>", "exec")
+        exec(code, namespace)
+        compiled = CompiledProfile(profile.name, source, namespace["_step"])
+        _CACHE[profile] = compiled
+    return compiled
+
+
+# --------------------------------------------------
+# Code generation
+# --------------------------------------------------
+
+_PRESSURE = ("confidence", "frustration", "curiosity", "arousal", "pressure_risk")
+
+
+def _lit(value) -> str:
+    """Source literal that evaluates to exactly `value` (repr round-trips floats)."""
+    if isinstance(value, float) and (value != value or value in (float("inf"), float("-inf"))):
+        return f"float({repr(value)!r})"
+    return repr(value)
+
+
+def _dot(coeffs, j: int) -> str:
+    """Governance column j as an unrolled sum, skipping zero coefficients."""
+    terms = [
+        f"{_lit(coeffs[5 * j + i])} * {name}"
+        for i, name in enumerate(_PRESSURE)
+        if coeffs[5 * j + i] != 0.0
+    ]
+    return " + ".join(terms) if terms else "0.0"
+
+
+def _decayed(expr: str, decay: float, time_decay: float) -> str:
+    """expr - (decay + dt * time_decay), folding terms that are exactly zero."""
+    if time_decay != 0.0:
+        return f"{expr} - ({_lit(decay)} + dt * {_lit(time_decay)})"
+    if decay != 0.0:
+        return f"{expr} - {_lit(decay)}"
+    return expr
+
+
+def _governance(coeffs, profile: Profile, columns, indent: str) -> list:
+    """Clipped governance output for the given budget columns."""
+    exprs = (
+        ("raw_effort", _dot(coeffs, 0)),
+        ("raw_risk", _dot(coeffs, 1)),
+        ("raw_exploration", _decayed(
+            f"({_dot(coeffs, 2)})", profile.exploration_decay, profile.time_exploration_decay,
+        )),
+        ("raw_persistence", _decayed(
+            f"({_dot(coeffs, 3)})", profile.persistence_decay, profile.time_persistence_decay,
+        )),
+    )
+    lines = []
+    for name, expr in (exprs[j] for j in columns):
+        lines.append(f"{indent}{name} = {expr}")
+        lines.append(
+            f"{indent}{name} = 0.0 if {name} < 0.0 else (1.0 if {name} > 1.0 else {name})"
+        )
+    return lines
+
+
+def _generate(profile: Profile) -> str:
+    from emocore.engine import EmoEngine
+
+    governance = GovernanceEngine(profile)
+    alpha = EmoEngine.BUDGET_INERTIA_ALPHA
+    keep = 1 - alpha
+    threshold = EmoEngine.RECOVERING_THRESHOLD
+
+    out = [
+        "def _step(self, reward, novelty, urgency, difficulty, dt):",
+        "    s = self._s",
+        "    dt = self.clock.tick(dt)",
+        "    self.last_dt = dt",
+        "    step_count = self.step_count = self.step_count + 1",
+        "",
+        "    # 1. Progress tracking (stagnation)",
+        "    if reward <= 0.0:",
+        "        no_progress_steps = self.no_progress_steps = self.no_progress_steps + 1",
+        "    else:",
+        "        no_progress_steps = self.no_progress_steps = 0",
+        f"    stagnating = no_progress_steps >= {_lit(profile.stagnation_window)}",
+        "",
+        "    # 2. Appraisal -> pressure accumulation",
+        "    s.confidence = confidence = s.confidence + ((reward*0.3) - (difficulty*0.1))",
+        "    s.frustration = frustration = s.frustration + ((0.0 if reward > 0 else difficulty*0.4) + (urgency*0.2))",
+        "    s.curiosity = curiosity = s.curiosity + ((novelty*0.5) - ((1.0-novelty)*0.2))",
+        "    s.arousal = arousal = s.arousal + (urgency * 0.6)",
+        "    s.pressure_risk = pressure_risk = s.pressure_risk + (-abs(reward)*0.3)",
+        "    s.state_obj = None",
+        "",
+        "    # 3. Governance -> raw behavior budget",
+    ]
+    coeffs, stagnating_coeffs = governance._coeffs, governance._stagnating_coeffs
+    # Columns whose coefficients the stagnation scales actually change
+    scaled = [j for j in range(4) if coeffs[5 * j:5 * j + 5] != stagnating_coeffs[5 * j:5 * j + 5]]
+    if scaled:
+        out.append("    if stagnating:")
+        out += _governance(stagnating_coeffs, profile, scaled, "        ")
+        out.append("    else:")
+        out += _governance(coeffs, profile, scaled, "        ")
+    out += _governance(coeffs, profile, [j for j in range(4) if j not in scaled], "    ")
+
+    recovered = "effort" if profile.recovery_rate == 0.0 else f"effort + {_lit(profile.recovery_rate)} * dt"
+    recovered_p = (
+        "persistence" if profile.recovery_rate == 0.0
+        else f"persistence + {_lit(profile.recovery_rate)} * dt"
+    )
+    out += [
+        "",
+        "    # 4. Budget inertia",
+        f"    effort = {_lit(alpha)} * s.prev_effort + {_lit(keep)} * raw_effort",
+        f"    risk = {_lit(alpha)} * s.prev_risk + {_lit(keep)} * raw_risk",
+        f"    exploration = {_lit(alpha)} * s.prev_exploration + {_lit(keep)} * raw_exploration",
+        f"    persistence = {_lit(alpha)} * s.prev_persistence + {_lit(keep)} * raw_persistence",
+        "",
+        "    # 5.-7. Mode, risk freeze, bounded recovery",
+        f"    if effort < {_lit(threshold)} or persistence < {_lit(threshold)}:",
+        "        mode = Mode.RECOVERING",
+        "        risk = s.frozen_risk",
+        f"        if dt >= {_lit(profile.recovery_delay)}:",
+        f"            effort = min(s.stable_effort, {_lit(profile.recovery_cap)}, {recovered})",
+        f"            persistence = min(s.stable_persistence, {_lit(profile.recovery_cap)}, {recovered_p})",
+        "    else:",
+        "        mode = Mode.IDLE",
+        "        s.stable_effort = effort",
+        "        s.stable_risk = risk",
+        "        s.stable_exploration = exploration",
+        "        s.stable_persistence = persistence",
+        "",
+        "    # 8. Tracking state for next step",
+        "    s.effort = s.prev_effort = effort",
+        "    s.risk = s.prev_risk = s.frozen_risk = risk",
+        "    s.exploration = s.prev_exploration = exploration",
+        "    s.persistence = s.prev_persistence = persistence",
+        "    s.budget_obj = None",
+        "",
+        "    # 9. Failure checks (ordered, terminal)",
+        f"    if exploration >= {_lit(profile.max_exploration)}:",
+        "        failure = FailureType.SAFETY",
+        "        reason = 'exploration_exceeded'",
+        f"    elif risk >= {_lit(profile.max_risk)}:",
+        "        failure = FailureType.OVERRISK",
+        "        reason = 'risk_exceeded'",
+        f"    elif effort <= {_lit(profile.exhaustion_threshold)}:",
+        "        failure = FailureType.EXHAUSTION",
+        "        reason = 'exhaustion'",
+        f"    elif stagnating and effort <= {_lit(profile.stagnation_effort_floor)}:",
+        "        failure = FailureType.STAGNATION",
+        "        reason = 'stagnation'",
+        f"    elif step_count >= {_lit(profile.max_steps)}:",
+        "        failure = FailureType.EXTERNAL",
+        "        reason = 'max_steps'",
+        "    else:",
+        "        return mode",
+        "",
+        "    # 10. Terminal state transition",
+        "    self._halted = True",
+        "    self._failure = failure",
+        "    self._reason = reason",
+        "    if self._halt_listeners:",
+        "        self._notify_halt()",
+        "    return Mode.HALTED",
+        "",
+    ]
+    return "\n".join(out)
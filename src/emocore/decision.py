@@ -0,0 +1,59 @@
+# emocore/decision.py
+"""
+Compact decision codes returned by EmoEngine.step_decision().
+
+What a decision code is:
+- One small int: the step's Mode in the low bits and its FailureType above
+- The same enum values EmoFleet stores in its mode / failure arrays
+
+What a decision code is NOT:
+- A budget (fetch it with EmoEngine.current_budget() when needed)
+- A different state machine: step_decision() runs exactly what step() runs
+
+Layout:
+    code = Mode.value | (FailureType.value << MODE_BITS)
+
+Usage:
+    code = engine.step_decision(reward, novelty, urgency)
+    if code == CONTINUE:
+        ...                                   # IDLE, keep going
+    elif is_halted(code):
+        print(failure_of(code))
+"""
+from emocore.failures import FailureType
+from emocore.modes import Mode
+
+MODE_BITS = 2
+MODE_MASK = (1 << MODE_BITS) - 1
+
+
+def encode(mode: Mode, failure: FailureType = FailureType.NONE) -> int:
+    return mode.value | (failure.value << MODE_BITS)
+
+
+# Codes of a running session (no failure)
+CONTINUE = encode(Mode.IDLE)
+RECOVERING = encode(Mode.RECOVERING)
+
+# Codes of a halted session, one per failure type
+HALTED_CODES = {failure: encode(Mode.HALTED, failure) for failure in FailureType}
+
+_MODES = {mode.value: mode for mode in Mode}
+_FAILURES = {failure.value: failure for failure in FailureType}
+
+
+def mode_of(code: int) -> Mode:
+    return _MODES[code & MODE_MASK]
+
+
+def failure_of(code: int) -> FailureType:
+    return _FAILURES[code >> MODE_BITS]
+
+
+def is_halted(code: int) -> bool:
+    return (code & MODE_MASK) == Mode.HALTED.value
+
+
+def may_continue(code: int) -> bool:
+    """True unless the session is halted (RECOVERING may still act, with reduced budget)."""
+    return (code & MODE_MASK) != Mode.HALTED.value
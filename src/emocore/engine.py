@@ -2,14 +2,101 @@
 import os 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import time
+from functools import lru_cache
+from types import MethodType
+from typing import Callable, Optional
 from emocore.appraisal import AppraisalEngine
 from emocore.governance import GovernanceEngine
 from emocore.state import PressureState
-from emocore.behavior import BehaviorBudget
+from emocore.behavior import BehaviorBudget, ZERO_BUDGET
 from emocore.failures import FailureType
 from emocore.modes import Mode
-from emocore.result import EngineResult
+from emocore.result import EngineResult, AdvanceResult, StepView
+from emocore.trajectory import InertiaTrajectory, regime_span, clipped_line
+from emocore.clock import Clock, MonotonicClock
+from emocore.compiler import compile_profile
+from emocore.decision import CONTINUE, RECOVERING, HALTED_CODES
+
+# Appraisal and governance hold no per-engine state (only profile-derived
+# coefficients), so engines share them: one AppraisalEngine, and one
+# GovernanceEngine per distinct profile (profiles are frozen and hashable).
+# The governance cache is a bounded LRU keyed by profile value: its values
+# reference their profile, so weak keys would never be collected.
+_APPRAISAL = AppraisalEngine()
+_GOVERNANCE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_GOVERNANCE_CACHE_SIZE)
+def _shared_governance(profile) -> GovernanceEngine:
+    return GovernanceEngine(profile)
+
+
+def _governance_for(profile) -> GovernanceEngine:
+    try:
+        return _shared_governance(profile)
+    except TypeError:
+        return GovernanceEngine(profile)  # Unhashable profile type: not shared
+
+
+class _EngineState:
+    """
+    Mutable scalar state of one EmoEngine.
+
+    Holds plain floats so a step updates them in place instead of building
+    PressureState / BehaviorBudget objects. The immutable views are cached in
+    state_obj / budget_obj and dropped whenever the scalars change.
+    """
+
+    __slots__ = (
+        # Pressure (PressureState axes; `pressure_risk` is PressureState.risk)
+        "confidence", "frustration", "curiosity", "arousal", "pressure_risk",
+        # Current budget
+        "effort", "risk", "exploration", "persistence",
+        # Previous budget (inertia)
+        "prev_effort", "prev_risk", "prev_exploration", "prev_persistence",
+        # Stable budget: last non-RECOVERING, non-HALTED budget
+        # Used to bound recovery (effort/persistence cannot exceed pre-failure levels)
+        "stable_effort", "stable_risk", "stable_exploration", "stable_persistence",
+        # Risk tracking: for freezing during RECOVERING
+        "frozen_risk",
+        # Cached immutable views
+        "state_obj", "budget_obj",
+    )
+
+    def __init__(self):
+        self.confidence = self.frustration = self.curiosity = 0.0
+        self.arousal = self.pressure_risk = 0.0
+        self.reset_budget()
+        self.frozen_risk = 0.0
+        self.state_obj = None
+
+    def reset_budget(self) -> None:
+        """Full-capacity budget, also used as previous and stable budget."""
+        self.effort = self.prev_effort = self.stable_effort = 1.0
+        self.risk = self.prev_risk = self.stable_risk = 0.0
+        self.exploration = self.prev_exploration = self.stable_exploration = 0.0
+        self.persistence = self.prev_persistence = self.stable_persistence = 1.0
+        self.budget_obj = None
+
+    def pressure(self) -> tuple:
+        return (self.confidence, self.frustration, self.curiosity, self.arousal, self.pressure_risk)
+
+    def copy(self) -> "_EngineState":
+        other = _EngineState.__new__(_EngineState)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+    def values(self) -> tuple:
+        """All scalars (cached views excluded)."""
+        return tuple(getattr(self, name) for name in self.__slots__[:-2])
+
+    def __eq__(self, other):
+        if not isinstance(other, _EngineState):
+            return NotImplemented
+        return self.values() == other.values()
+
+    __hash__ = None
 
 
 class EmoEngine:
@@ -27,6 +114,18 @@ class EmoEngine:
     
     There is NO auto-recovery from HALTED. The session must be restarted
     to resume operation. This is a safety invariant, not a limitation.
+    
+    Time Semantics:
+    ---------------
+    The engine reads dt from its Clock (see emocore.clock). The default
+    MonotonicClock honors the caller's dt and measures wall time when it
+    is None; DeltaClock honors it; VirtualClock moves only when advanced.
+    
+    Compiled Profiles:
+    ------------------
+    With compiled=True the step state machine is replaced by a routine
+    specialized for the profile (see emocore.compiler), shared by all
+    engines with that profile. Results are identical to the generic path.
     """
     
     # Budget inertia constant: controls smoothing across steps
@@ -34,52 +133,103 @@ class EmoEngine:
     # Range: [0.6, 0.9], using 0.8 as balanced default
     BUDGET_INERTIA_ALPHA = 0.8
     
-    def __init__(self, profile):
+    # Mode threshold: effort or persistence below this => RECOVERING
+    RECOVERING_THRESHOLD = 0.3
+    
+    def __init__(self, profile, clock: Optional[Clock] = None, compiled: bool = False):
         self.profile = profile
+        self.clock = clock if clock is not None else MonotonicClock()
+        if compiled:
+            # Instance attribute shadows the generic _step method
+            self._step = MethodType(compile_profile(profile).step, self)
 
-        # Persistent internal state
-        self.state = PressureState()
-        self.budget = BehaviorBudget(
-            effort=1.0,
-            risk=0.0,
-            persistence=1.0,
-            exploration=0.0,
-        )
+        # Persistent internal state (pressure, budget, inertia tracking)
+        self._s = _EngineState()
 
-        self.appraisal = AppraisalEngine()
-        self.governance = GovernanceEngine(profile)
+        # Stateless: shared by every engine (of the same profile)
+        self.appraisal = _APPRAISAL
+        self.governance = _governance_for(profile)
 
         self.step_count = 0
         self.no_progress_steps = 0
-        self.last_step_time = time.monotonic()
+        self.last_dt = 0.0
 
         # Terminal failure state
         self._halted = False
         self._failure = FailureType.NONE
         self._reason = None
-        
-        # Budget inertia: track previous budget for smoothing
-        self._previous_budget = self.budget
-        
-        # Risk tracking: for freezing during RECOVERING
-        self._previous_risk = 0.0
-        
-        # Stable budget snapshot: last non-RECOVERING, non-HALTED budget
-        # Used to bound recovery (effort/persistence cannot exceed pre-failure levels)
-        self._stable_budget = self.budget
+        # Called as listener(failure, reason) when the engine enters HALTED
+        self._halt_listeners: list = []
+
+        # Reused by step_view()
+        self._view = StepView()
+
+    @property
+    def last_step_time(self) -> float:
+        """Clock reading at the previous step (kept for backward compatibility)."""
+        return self.clock.last
+
+    @last_step_time.setter
+    def last_step_time(self, value: float) -> None:
+        self.clock.last = value
+
+    @property
+    def halted(self) -> bool:
+        """Whether the session is HALTED (terminal until reset())."""
+        return self._halted
+
+    @property
+    def state(self) -> PressureState:
+        """Current pressure as an immutable PressureState (built on access)."""
+        s = self._s
+        if s.state_obj is None:
+            s.state_obj = PressureState(*s.pressure())
+        return s.state_obj
+
+    @state.setter
+    def state(self, value: PressureState) -> None:
+        s = self._s
+        s.confidence = value.confidence
+        s.frustration = value.frustration
+        s.curiosity = value.curiosity
+        s.arousal = value.arousal
+        s.pressure_risk = value.risk
+        s.state_obj = value
+
+    @property
+    def budget(self) -> BehaviorBudget:
+        """Current budget as an immutable BehaviorBudget (built on access)."""
+        s = self._s
+        if s.budget_obj is None:
+            s.budget_obj = BehaviorBudget(
+                effort=s.effort,
+                risk=s.risk,
+                persistence=s.persistence,
+                exploration=s.exploration,
+            )
+        return s.budget_obj
+
+    @budget.setter
+    def budget(self, value: BehaviorBudget) -> None:
+        s = self._s
+        s.effort = value.effort
+        s.risk = value.risk
+        s.exploration = value.exploration
+        s.persistence = value.persistence
+        s.budget_obj = value
 
     def step(
-        self, 
-        reward: float, 
-        novelty: float, 
-        urgency: float, 
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
         difficulty: float = 0.0,
         trust: float = 1.0,
-        dt: float = 1.0
+        dt: Optional[float] = None
     ) -> EngineResult:
         """
         Execute one step of the emotional engine.
-        
+
         Post-Failure Semantics:
         ----------------------
         If the engine is HALTED, this method returns immediately with:
@@ -87,39 +237,151 @@ class EmoEngine:
         - halted=True
         - The failure type and reason that caused the halt
         - mode=Mode.HALTED
-        
+
         No state evolution, pressure accumulation, governance, or recovery
         occurs after HALT. This is terminal for the session.
-        
+
         Args:
             reward: Reward signal from the environment
             novelty: Novelty signal indicating new information
             urgency: Urgency signal indicating time pressure
             difficulty: Evidence of control loss [0, 1]
             trust: Credibility of inputs [0, 1]
-            dt: Time delta for processing temporal effects
-            
+            dt: Time delta for processing temporal effects. Resolved by the
+                engine's Clock: honored by DeltaClock and MonotonicClock
+                (wall time when None), ignored by VirtualClock.
+
         Returns:
-            EngineResult containing current state, budget, mode, and failure info
+            EngineResult containing current state, budget, mode, and failure info.
+            Its state and pressure_log are built on first access.
         """
         if self._halted:
-            return EngineResult(
-                state=self.state,
-                budget=BehaviorBudget(0.0, 0.0, 0.0, 0.0),
-                halted=True,
-                failure=self._failure,
-                reason=self._reason,
-                mode=Mode.HALTED,
+            return EngineResult.lazy(
+                self._s.pressure(), None, ZERO_BUDGET,
+                True, self._failure, self._reason, Mode.HALTED,
             )
 
-        now = time.monotonic()
-        dt = now - self.last_step_time
-        self.last_step_time = now
+        mode = self._step(reward, novelty, urgency, difficulty, dt)
+
+        return EngineResult.lazy(
+            self._s.pressure(),
+            trust,
+            self.budget if mode is not Mode.HALTED else ZERO_BUDGET,
+            self._halted,
+            self._failure,
+            self._reason,
+            mode,
+        )
+
+    def step_view(
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
+        difficulty: float = 0.0,
+        trust: float = 1.0,
+        dt: Optional[float] = None
+    ) -> StepView:
+        """
+        Low-allocation variant of step().
+
+        Runs exactly the same state machine but returns this engine's single
+        reusable StepView instead of a new EngineResult. The view is
+        overwritten by the next step_view() call; use view.freeze() to keep
+        an immutable result.
+        """
+        view = self._view
+        s = self._s
+        if self._halted:
+            trust = None  # Matches step(): no pressure_log after HALT
+            mode = Mode.HALTED
+        else:
+            mode = self._step(reward, novelty, urgency, difficulty, dt)
+
+        if mode is Mode.HALTED:
+            view.effort = view.risk = view.exploration = view.persistence = 0.0
+        else:
+            view.effort = s.effort
+            view.risk = s.risk
+            view.exploration = s.exploration
+            view.persistence = s.persistence
+        view.halted = self._halted
+        view.failure = self._failure
+        view.reason = self._reason
+        view.mode = mode
+        view.step_count = self.step_count
+        view._confidence = s.confidence
+        view._frustration = s.frustration
+        view._curiosity = s.curiosity
+        view._arousal = s.arousal
+        view._risk = s.pressure_risk
+        view._trust = trust
+        return view
+
+    def step_decision(
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
+        difficulty: float = 0.0,
+        trust: float = 1.0,
+        dt: Optional[float] = None
+    ) -> int:
+        """
+        Decision-only variant of step().
+
+        Advances the engine exactly like step() (same state machine, so the
+        two can be mixed freely) but returns an int decision code instead of
+        an EngineResult: CONTINUE, RECOVERING or a HALTED code carrying the
+        failure type (see emocore.decision). trust only feeds pressure_log
+        and is accepted for signature compatibility.
+
+        Use current_budget() to fetch the budget when it is actually needed.
+        """
+        if self._halted:
+            return HALTED_CODES[self._failure]
+
+        mode = self._step(reward, novelty, urgency, difficulty, dt)
+        if mode is Mode.IDLE:
+            return CONTINUE
+        if mode is Mode.RECOVERING:
+            return RECOVERING
+        return HALTED_CODES[self._failure]
+
+    def current_budget(self) -> BehaviorBudget:
+        """Budget reported for the latest step (zeroed after HALT), as in step()."""
+        if self._halted:
+            return ZERO_BUDGET
+        return self.budget
+
+    def budget_values(self) -> tuple:
+        """current_budget() as a plain (effort, risk, exploration, persistence) tuple."""
+        if self._halted:
+            return 0.0, 0.0, 0.0, 0.0
+        s = self._s
+        return s.effort, s.risk, s.exploration, s.persistence
+
+    def _step(
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
+        difficulty: float,
+        dt: Optional[float],
+    ) -> Mode:
+        """
+        The step state machine.
+
+        Shared by step(), step_view() and step_decision(). Mutates the scalar
+        engine state in place and returns this step's mode (Mode.HALTED if a
+        failure fired). Must not be called when halted.
+        """
+        s = self._s
+        profile = self.profile
+        dt = self.clock.tick(dt)
+        self.last_dt = dt
         self.step_count += 1
-        halted = False
-        failure = FailureType.NONE
-        reason = None
-        
+
         # --------------------------------------------------
         # 1. Progress tracking (stagnation)
         #    BOUNDARY: Engine DETECTS stagnation.
@@ -131,127 +393,85 @@ class EmoEngine:
         else:
             self.no_progress_steps = 0
 
-        stagnating = self.no_progress_steps >= self.profile.stagnation_window
+        stagnating = self.no_progress_steps >= profile.stagnation_window
 
         # --------------------------------------------------
         # 2. Appraisal → Pressure accumulation
         # --------------------------------------------------
-        delta = self.appraisal.compute(
-            reward=reward,
-            novelty=novelty,
-            urgency=urgency,
-            difficulty=difficulty,
+        d_conf, d_frus, d_cur, d_aro, d_risk = self.appraisal.compute_values(
+            reward, novelty, urgency, difficulty,
         )
-        self.state = self.state.integrate(delta)
+        s.confidence += d_conf
+        s.frustration += d_frus
+        s.curiosity += d_cur
+        s.arousal += d_aro
+        s.pressure_risk += d_risk
+        s.state_obj = None
 
         # --------------------------------------------------
         # 3. Governance → Raw behavior budget (stateless)
         # --------------------------------------------------
-        raw_budget = self.governance.compute(
-            state=self.state,
-            stagnating=stagnating,
-            dt=dt,
+        raw_effort, raw_risk, raw_exploration, raw_persistence = self.governance.compute_values(
+            s.confidence,
+            s.frustration,
+            s.curiosity,
+            s.arousal,
+            s.pressure_risk,
+            stagnating,
+            dt,
         )
 
         # --------------------------------------------------
-        # 4. Budget Inertia (smoothing across steps)
-        #    new_budget = α * previous + (1 - α) * raw
-        #    This is control stability, NOT learning.
+        # 4.-7. Inertia, mode, risk freeze, bounded recovery
         # --------------------------------------------------
-        alpha = self.BUDGET_INERTIA_ALPHA
-        self.budget = BehaviorBudget(
-            effort=alpha * self._previous_budget.effort + (1 - alpha) * raw_budget.effort,
-            risk=alpha * self._previous_budget.risk + (1 - alpha) * raw_budget.risk,
-            exploration=alpha * self._previous_budget.exploration + (1 - alpha) * raw_budget.exploration,
-            persistence=alpha * self._previous_budget.persistence + (1 - alpha) * raw_budget.persistence,
+        effort, risk, exploration, persistence, mode = self._regulate(
+            raw_effort, raw_risk, raw_exploration, raw_persistence, dt
         )
-
-        # --------------------------------------------------
-        # 5. Mode determination (BEFORE recovery)
-        #    Mode is derived from current budget state.
-        # --------------------------------------------------
-        if self.budget.effort < 0.3 or self.budget.persistence < 0.3:
-            mode = Mode.RECOVERING
-        else:
-            mode = Mode.IDLE
-
-        # --------------------------------------------------
-        # 6. Risk freezing during RECOVERING
-        #    INVARIANT: Risk does NOT change during RECOVERING.
-        #    This overrides BOTH governance output AND inertia.
-        #    Prevents upward drift toward OVERRISK during recovery.
-        # --------------------------------------------------
-        if mode == Mode.RECOVERING:
-            self.budget = BehaviorBudget(
-                effort=self.budget.effort,
-                risk=self._previous_risk,  # Freeze risk to previous value
-                exploration=self.budget.exploration,
-                persistence=self.budget.persistence,
-            )
-
-        # --------------------------------------------------
-        # 7. Recovery (ONLY when mode == RECOVERING)
-        #    INVARIANT: Recovery occurs ONLY in RECOVERING mode.
-        #    INVARIANT: Recovered budget ≤ last stable (non-RECOVERING) budget.
-        # --------------------------------------------------
-        # Recovery semantics:
-        # - Recovery occurs only in RECOVERING mode
-        # - Recovery affects effort and persistence only
-        # - Risk and exploration must never increase during recovery
-        # - Recovery is bounded by pre-failure stable budget
-        if mode == Mode.RECOVERING and dt >= self.profile.recovery_delay:
-            self.budget = BehaviorBudget(
-                effort=min(
-                    self._stable_budget.effort,  # Bound by pre-failure level
-                    self.profile.recovery_cap,
-                    self.budget.effort + self.profile.recovery_rate * dt
-                ),
-                persistence=min(
-                    self._stable_budget.persistence,  # Bound by pre-failure level
-                    self.profile.recovery_cap,
-                    self.budget.persistence + self.profile.recovery_rate * dt
-                ),
-                risk=self.budget.risk,  # Already frozen above
-                exploration=self.budget.exploration,
-            )
+        s.effort = effort
+        s.risk = risk
+        s.exploration = exploration
+        s.persistence = persistence
+        s.budget_obj = None
 
         # --------------------------------------------------
         # 8. Update tracking state for next step
         # --------------------------------------------------
         # Update previous budget for inertia (AFTER all modifications)
-        self._previous_budget = self.budget
-        
+        s.prev_effort = effort
+        s.prev_risk = risk
+        s.prev_exploration = exploration
+        s.prev_persistence = persistence
+
         # Update previous risk for freezing (use current budget's risk)
-        self._previous_risk = self.budget.risk
-        
+        s.frozen_risk = risk
+
         # Update stable budget snapshot ONLY when in IDLE (normal operation)
-        if mode == Mode.IDLE:
-            self._stable_budget = self.budget
+        if mode is Mode.IDLE:
+            s.stable_effort = effort
+            s.stable_risk = risk
+            s.stable_exploration = exploration
+            s.stable_persistence = persistence
 
         # --------------------------------------------------
         # 9. Failure checks (ordered, terminal)
         # --------------------------------------------------
-        if self.budget.exploration >= self.profile.max_exploration:
-            halted = True
+        if exploration >= profile.max_exploration:
             failure = FailureType.SAFETY
             reason = "exploration_exceeded"
 
-        elif self.budget.risk >= self.profile.max_risk:
-            halted = True
+        elif risk >= profile.max_risk:
             failure = FailureType.OVERRISK
             reason = "risk_exceeded"
 
-        elif self.budget.effort <= self.profile.exhaustion_threshold:
-            halted = True
+        elif effort <= profile.exhaustion_threshold:
             failure = FailureType.EXHAUSTION
             reason = "exhaustion"
 
-        elif stagnating and self.budget.effort <= self.profile.stagnation_effort_floor:
-            halted = True
+        elif stagnating and effort <= profile.stagnation_effort_floor:
             failure = FailureType.STAGNATION
             reason = "stagnation"
 
-        elif self.step_count >= self.profile.max_steps:
+        elif self.step_count >= profile.max_steps:
             # EXTERNAL failure semantics:
             # --------------------------
             # This is a SAFETY FUSE, not emotional regulation.
@@ -259,10 +479,12 @@ class EmoEngine:
             # - It is NOT learned or adaptive
             # - It is a hard external limit to prevent runaway execution
             # - It is distinguishable from governance failures by FailureType.EXTERNAL
-            halted = True
             failure = FailureType.EXTERNAL
             reason = "max_steps"
 
+        else:
+            return mode
+
         # --------------------------------------------------
         # 10. Terminal state transition
         # --------------------------------------------------
@@ -272,29 +494,386 @@ class EmoEngine:
         # - Pressure does not accumulate
         # - Governance and recovery no longer apply
         # - Budget remains permanently zeroed
-        if halted:
-            self._halted = True
-            self._failure = failure
-            self._reason = reason
+        self._halted = True
+        self._failure = failure
+        self._reason = reason
+        if self._halt_listeners:
+            self._notify_halt()
+        return Mode.HALTED
+
+    def add_halt_listener(self, listener: Callable[[FailureType, str], None]) -> None:
+        """
+        Call listener(failure, reason) whenever this engine enters HALTED.
+        
+        Listeners run synchronously inside the halting step (after the
+        terminal state is set, before the step returns) and must not step
+        this engine. Forks do not inherit listeners.
+        """
+        self._halt_listeners.append(listener)
+
+    def remove_halt_listener(self, listener: Callable[[FailureType, str], None]) -> None:
+        self._halt_listeners.remove(listener)
+
+    def _notify_halt(self) -> None:
+        for listener in list(self._halt_listeners):
+            listener(self._failure, self._reason)
+
+    def _regulate(
+        self,
+        raw_effort: float,
+        raw_risk: float,
+        raw_exploration: float,
+        raw_persistence: float,
+        dt: float,
+    ):
+        """
+        Turn raw governance output into this step's budget and mode.
+
+        Pure with respect to engine state: reads the previous/stable budget
+        and previous risk, mutates nothing.
+        Returns (effort, risk, exploration, persistence, mode).
+        """
+        s = self._s
+
+        # --------------------------------------------------
+        # 4. Budget Inertia (smoothing across steps)
+        #    new_budget = α * previous + (1 - α) * raw
+        #    This is control stability, NOT learning.
+        # --------------------------------------------------
+        alpha = self.BUDGET_INERTIA_ALPHA
+        effort = alpha * s.prev_effort + (1 - alpha) * raw_effort
+        risk = alpha * s.prev_risk + (1 - alpha) * raw_risk
+        exploration = alpha * s.prev_exploration + (1 - alpha) * raw_exploration
+        persistence = alpha * s.prev_persistence + (1 - alpha) * raw_persistence
+
+        # --------------------------------------------------
+        # 5. Mode determination (BEFORE recovery)
+        #    Mode is derived from current budget state.
+        # --------------------------------------------------
+        if (effort < self.RECOVERING_THRESHOLD
+                or persistence < self.RECOVERING_THRESHOLD):
+            mode = Mode.RECOVERING
+        else:
+            return effort, risk, exploration, persistence, Mode.IDLE
+
+        # --------------------------------------------------
+        # 6. Risk freezing during RECOVERING
+        #    INVARIANT: Risk does NOT change during RECOVERING.
+        #    This overrides BOTH governance output AND inertia.
+        #    Prevents upward drift toward OVERRISK during recovery.
+        # --------------------------------------------------
+        risk = s.frozen_risk  # Freeze risk to previous value
+
+        # --------------------------------------------------
+        # 7. Recovery (ONLY when mode == RECOVERING)
+        #    INVARIANT: Recovery occurs ONLY in RECOVERING mode.
+        #    INVARIANT: Recovered budget ≤ last stable (non-RECOVERING) budget.
+        # --------------------------------------------------
+        # Recovery semantics:
+        # - Recovery occurs only in RECOVERING mode
+        # - Recovery affects effort and persistence only
+        # - Risk and exploration must never increase during recovery
+        # - Recovery is bounded by pre-failure stable budget
+        profile = self.profile
+        if dt >= profile.recovery_delay:
+            effort = min(
+                s.stable_effort,  # Bound by pre-failure level
+                profile.recovery_cap,
+                effort + profile.recovery_rate * dt
+            )
+            persistence = min(
+                s.stable_persistence,  # Bound by pre-failure level
+                profile.recovery_cap,
+                persistence + profile.recovery_rate * dt
+            )
+
+        return effort, risk, exploration, persistence, mode
+
+    # --------------------------------------------------
+    # Fast-forward under constant signals
+    # --------------------------------------------------
+
+    # Shortest run worth computing in closed form
+    MIN_JUMP_STEPS = 4
+    
+    # Closed-form jumps stop this many steps before any predicted boundary,
+    # and treat values within JUMP_TOLERANCE of a threshold as crossing it.
+    # The boundary itself is always crossed by a regular step().
+    JUMP_MARGIN_STEPS = 2
+    JUMP_TOLERANCE = 1e-9
+
+    def advance(self, signals, n: int, dt: Optional[float] = None) -> AdvanceResult:
+        """
+        Advance the engine by n steps under constant signals.
+        
+        Equivalent to calling step() n times with the same signals and dt,
+        stopping early at HALT. Runs of IDLE steps in which no mode change,
+        clip-bound crossing, stagnation onset or failure can occur are
+        computed in closed form (see emocore.trajectory), so the cost is
+        proportional to the number of such boundaries, not to n.
+        
+        Closed-form jumps require a clock with a steady per-step dt
+        (DeltaClock, VirtualClock, MonotonicClock with an explicit dt).
+        With MonotonicClock and dt=None every step runs through step().
+        
+        Guarantees vs n sequential steps:
+        - step_count, halt step and failure type are identical
+        - budgets and pressure agree up to floating-point rounding
+        
+        Args:
+            signals: Signals-like object (reward, novelty, urgency, difficulty, trust)
+            n: Number of steps to advance (>= 0)
+            dt: Per-step dt, resolved by the clock as in step()
+            
+        Returns:
+            AdvanceResult with the last EngineResult, steps executed and the
+            step_count at which HALT happened (if it did).
+        """
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+
+        start = self.step_count
+        result = None
+        halt_step = None
+        remaining = n
+
+        while remaining > 0 and not self._halted:
+            plan = None
+            # The first step always runs normally: it consumes any time that
+            # elapsed on the clock before this call.
+            if result is not None and remaining >= self.MIN_JUMP_STEPS:
+                steady = self.clock.steady_dt(dt)
+                if steady is not None:
+                    plan = self._plan_jump(signals, steady, remaining)
+
+            if plan is not None:
+                result = self._apply_jump(signals, steady, *plan)
+                remaining -= plan[0]
+            else:
+                result = self.step(
+                    signals.reward,
+                    signals.novelty,
+                    signals.urgency,
+                    signals.difficulty,
+                    signals.trust,
+                    dt,
+                )
+                remaining -= 1
+                if result.halted:
+                    halt_step = self.step_count
+
+        if result is None:
+            # n == 0, or already halted: report without evolving
+            result = self._snapshot(signals.trust)
+
+        return AdvanceResult(
+            result=result,
+            steps=self.step_count - start,
+            halt_step=halt_step,
+        )
+
+    def _plan_jump(self, signals, dt: float, remaining: int):
+        """
+        Find how many IDLE steps can be applied in closed form.
+        
+        Returns (steps, trajectories, mode) or None if the run is too short.
+        trajectories is None when the budget is an exact fixed point.
+        """
+        profile = self.profile
+        progress = signals.reward > 0.0
+        if progress:
+            stagnating = 0 >= profile.stagnation_window
+            limit = remaining
+        else:
+            stagnating = self.no_progress_steps + 1 >= profile.stagnation_window
+            limit = remaining
+            if not stagnating:
+                # Stop before the step at which stagnation starts
+                limit = min(limit, profile.stagnation_window - self.no_progress_steps - 1)
+        # Stop before the EXTERNAL fuse step
+        limit = min(limit, profile.max_steps - self.step_count - 1)
+        if limit < self.MIN_JUMP_STEPS:
+            return None
+
+        delta = self.appraisal.compute_values(
+            signals.reward, signals.novelty, signals.urgency, signals.difficulty,
+        )
+        s = self._s
+        base = self.governance.unclipped_values(*s.pressure(), stagnating, dt)
+        slope = self.governance.unclipped_values(*delta, stagnating, None)
+
+        # Raw governance must stay inside one clip regime per dimension
+        for a, b in zip(base, slope):
+            span = regime_span(a, b)
+            if span != float("inf"):
+                limit = min(limit, int(span) - self.JUMP_MARGIN_STEPS)
+        if limit < self.MIN_JUMP_STEPS:
+            return None
+
+        lines = [clipped_line(a, b) for a, b in zip(base, slope)]
+
+        if all(B == 0.0 for _, B in lines):
+            # Raw governance is constant over the run. If one more step maps
+            # the budget onto itself exactly (an IDLE inertia fixed point, or
+            # a RECOVERING cycle pinned by the recovery bound), every step of
+            # the run is identical and only the limits above apply.
+            *budget, mode = self._regulate(*(A for A, _ in lines), dt)
+            if budget == [s.effort, s.risk, s.exploration, s.persistence]:
+                if self._fails(*budget, stagnating):
+                    return None
+                return limit, None, mode
+
+        alpha = self.BUDGET_INERTIA_ALPHA
+        b0 = (s.prev_effort, s.prev_risk, s.prev_exploration, s.prev_persistence)
+        trajectories = tuple(
+            InertiaTrajectory(b0[i], A, B, alpha) for i, (A, B) in enumerate(lines)
+        )
+
+        # Closed form only covers IDLE steps: stop before RECOVERING or failure
+        tol = self.JUMP_TOLERANCE
+        effort_floor = max(self.RECOVERING_THRESHOLD, profile.exhaustion_threshold)
+        if stagnating:
+            effort_floor = max(effort_floor, profile.stagnation_effort_floor)
+        checks = (
+            (0, lambda v: v < effort_floor + tol),                     # RECOVERING / EXHAUSTION / STAGNATION
+            (1, lambda v: v >= profile.max_risk - tol),                # OVERRISK
+            (2, lambda v: v >= profile.max_exploration - tol),         # SAFETY
+            (3, lambda v: v < self.RECOVERING_THRESHOLD + tol),        # RECOVERING
+        )
+        for i, bad in checks:
+            first = trajectories[i].first_step(bad, 1, limit)
+            if first is not None:
+                limit = min(limit, first - 1 - self.JUMP_MARGIN_STEPS)
+                if limit < self.MIN_JUMP_STEPS:
+                    return None
+        return limit, trajectories, Mode.IDLE
+
+    def _fails(
+        self,
+        effort: float,
+        risk: float,
+        exploration: float,
+        persistence: float,
+        stagnating: bool,
+    ) -> bool:
+        """Whether the ordered failure checks would fire for this budget (step count aside)."""
+        profile = self.profile
+        return (
+            exploration >= profile.max_exploration
+            or risk >= profile.max_risk
+            or effort <= profile.exhaustion_threshold
+            or (stagnating and effort <= profile.stagnation_effort_floor)
+        )
+
+    def _apply_jump(self, signals, dt: float, steps: int, trajectories, mode: Mode) -> EngineResult:
+        """Apply `steps` identical-mode steps at once (see _plan_jump)."""
+        d_conf, d_frus, d_cur, d_aro, d_risk = self.appraisal.compute_values(
+            signals.reward, signals.novelty, signals.urgency, signals.difficulty,
+        )
+        s = self._s
+        s.confidence += steps * d_conf
+        s.frustration += steps * d_frus
+        s.curiosity += steps * d_cur
+        s.arousal += steps * d_aro
+        s.pressure_risk += steps * d_risk
+        s.state_obj = None
+
+        self.step_count += steps
+        if signals.reward > 0.0:
+            self.no_progress_steps = 0
+        else:
+            self.no_progress_steps += steps
+
+        if trajectories is not None:
+            s.effort, s.risk, s.exploration, s.persistence = (t.at(steps) for t in trajectories)
+            s.budget_obj = None
+
+        s.prev_effort = s.effort
+        s.prev_risk = s.risk
+        s.prev_exploration = s.exploration
+        s.prev_persistence = s.persistence
+        s.frozen_risk = s.risk
+        if mode is Mode.IDLE:
+            s.stable_effort = s.effort
+            s.stable_risk = s.risk
+            s.stable_exploration = s.exploration
+            s.stable_persistence = s.persistence
+        self.clock.skip(steps, dt)
+
+        return self._snapshot(signals.trust, mode)
+
+    def _snapshot(self, trust: float, mode: Optional[Mode] = None, result_cls=EngineResult):
+        """
+        Result for the current state without evolving it.
+        
+        result_cls is EngineResult or another LazyPressureResult (the
+        interface builds StepResult directly).
+        """
+        s = self._s
+        if self._halted:
+            budget = ZERO_BUDGET
             mode = Mode.HALTED
+        else:
+            budget = self.budget
+            if mode is None:
+                mode = (
+                    Mode.RECOVERING
+                    if s.effort < self.RECOVERING_THRESHOLD
+                    or s.persistence < self.RECOVERING_THRESHOLD
+                    else Mode.IDLE
+                )
+        return result_cls.lazy(
+            s.pressure(), trust, budget, self._halted, self._failure, self._reason, mode,
+        )
 
-        return EngineResult(
-            state=self.state,
-            budget=self.budget if not halted else BehaviorBudget(0.0, 0.0, 0.0, 0.0),
-            halted=self._halted,
-            failure=self._failure,
-            reason=self._reason,
-            mode=mode,
-            pressure_log={
-                "confidence": self.state.confidence,
-                "frustration": self.state.frustration,
-                "curiosity": self.state.curiosity,
-                "arousal": self.state.arousal,
-                "risk": self.state.risk,
-                "trust": trust,  # First-class observability
-            },
+    # --------------------------------------------------
+    # Checkpoints (forecasting and what-if simulation)
+    # --------------------------------------------------
+
+    def checkpoint(self) -> tuple:
+        """
+        Capture the evolving state as an opaque tuple.
+        
+        Cheap: one flat copy of the scalar state; everything else captured
+        is immutable.
+        """
+        return (
+            self._s.copy(),
+            self.step_count,
+            self.no_progress_steps,
+            self._halted,
+            self._failure,
+            self._reason,
         )
 
+    def fork(self, checkpoint: tuple, clock: Optional[Clock] = None) -> "EmoEngine":
+        """
+        New engine with the same profile, restored from a checkpoint.
+        
+        The fork shares the (stateless) appraisal and governance objects and
+        never affects this engine.
+        """
+        other = EmoEngine.__new__(EmoEngine)
+        other.profile = self.profile
+        other.clock = clock if clock is not None else MonotonicClock()
+        other.appraisal = self.appraisal
+        other.governance = self.governance
+        other.last_dt = 0.0
+        other._view = StepView()
+        other._halt_listeners = []
+        if "_step" in self.__dict__:
+            other._step = MethodType(self._step.__func__, other)
+        (
+            state,
+            other.step_count,
+            other.no_progress_steps,
+            other._halted,
+            other._failure,
+            other._reason,
+        ) = checkpoint
+        other._s = state.copy()
+        return other
+
     # Minimum steps before reset is allowed (anti-spam)
     RESET_COOLDOWN_STEPS = 5
     
@@ -329,14 +908,7 @@ class EmoEngine:
         self.step_count = 0
         
         # Reset budget to IDLE state (full capacity)
-        self.budget = BehaviorBudget(
-            effort=1.0,
-            risk=0.0,
-            persistence=1.0,
-            exploration=0.0
-        )
-        self._previous_budget = self.budget
-        self._stable_budget = self.budget
+        self._s.reset_budget()
         
         # We generally do NOT reset accumulated pressure state (self.state)
         # because the emotional context should persist. The 'reset' gives
@@ -1,14 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import math
-from collections import deque
-
-from typing import Dict, List, Optional
-import math
-from collections import deque
 
 from emocore.signals import Signals
 from emocore.observation import Observation
+from emocore.symbols import ACTIONS, CountedWindow, SymbolTable
+from emocore.loops import PeriodDetector
 
 
 class SignalExtractor(ABC):
@@ -24,6 +21,15 @@ class SignalExtractor(ABC):
     def extract(self, observation: Observation) -> Signals:
         """Convert a single observation into control signals."""
         pass
+
+    def extract_values(self, observation: Observation) -> Tuple[float, float, float, float, float]:
+        """
+        extract() as a raw (reward, novelty, urgency, difficulty, trust) tuple.
+        
+        Subclasses may override this to skip building Signals.
+        """
+        s = self.extract(observation)
+        return s.reward, s.novelty, s.urgency, s.difficulty, s.trust
     
     @abstractmethod
     def reset(self) -> None:
@@ -46,6 +52,21 @@ class RuleBasedExtractor(SignalExtractor):
     W_ENV = 0.7
     W_AGENT = 0.3
     STATE_HASH_WINDOW = 10  # S-1: How many steps back to check for cycling
+    ACTION_WINDOW = 20      # How many past actions count as "repeated"
+    
+    # S-2: Periodic loops (see emocore.loops). A confirmed loop of period
+    # >= 2 that made no progress over its last period (no success that moved
+    # the environment) scales novelty down and adds a difficulty penalty.
+    # Productive periodic workflows (read -> write -> read ...) are not penalized.
+    LOOP_MAX_PERIOD = 256
+    LOOP_NGRAM = 4
+    LOOP_NOVELTY_SCALE = 0.5
+    LOOP_DIFFICULTY = 0.3
+    
+    # Action names are interned to small ints (see emocore.symbols); history
+    # windows are counted ring buffers, so membership is O(1) for any window
+    # length. Assign a SymbolTable per instance to scope interning.
+    symbols: SymbolTable = ACTIONS
     
     def __init__(
         self, 
@@ -65,12 +86,17 @@ class RuleBasedExtractor(SignalExtractor):
         self.start_time = 0.0
         
         # State tracking
-        self.action_history: deque = deque(maxlen=20)
+        self.action_history = CountedWindow(self.ACTION_WINDOW)  # Interned action IDs
         self.failure_streak = 0
         self.stagnation_counter = 0
         
         # State Cycling Detection (S-1 Anti-Churn)
-        self.state_hash_history: deque = deque(maxlen=self.STATE_HASH_WINDOW)
+        self.state_hash_history = CountedWindow(self.STATE_HASH_WINDOW)
+        
+        # Periodic loop detection (S-2): loop_period is 0 unless a loop is confirmed
+        self.loop_detector = PeriodDetector(self.LOOP_MAX_PERIOD, self.LOOP_NGRAM)
+        self.loop_period = 0
+        self.steps_without_progress = 0  # Steps since a success moved the environment
         
         # Signal persistence (signals change slowly)
         self.current_reward = 0.0
@@ -84,6 +110,9 @@ class RuleBasedExtractor(SignalExtractor):
         self.signal_trust = 1.0
 
     def extract(self, observation: Observation) -> Signals:
+        return Signals(*self.extract_values(observation))
+
+    def extract_values(self, observation: Observation) -> Tuple[float, float, float, float, float]:
         self.step_count += 1
         
         # 0. State Cycling Detection (S-1 Invariant)
@@ -96,6 +125,13 @@ class RuleBasedExtractor(SignalExtractor):
         
         self.state_hash_history.append(state_hash)
         
+        # S-2 progress: the reported env delta, not the S-1 effective one (a
+        # short productive cycle repeats its fingerprint every period)
+        if observation.result == 'success' and observation.env_state_delta >= self.progress_threshold:
+            self.steps_without_progress = 0
+        else:
+            self.steps_without_progress += 1
+        
         # 1. Compute Composite State Delta (using effective env delta)
         state_delta = (
             self.W_ENV * effective_env_delta + 
@@ -122,12 +158,12 @@ class RuleBasedExtractor(SignalExtractor):
         final_novelty = effective_novelty * self.signal_trust
         final_difficulty = difficulty  # Difficulty is NOT gated by trust (safety brake)
         
-        return Signals(
-            reward=max(-1.0, min(1.0, final_reward)),
-            novelty=max(0.0, min(1.0, final_novelty)),
-            urgency=max(0.0, min(1.0, urgency)),
-            difficulty=max(0.0, min(1.0, final_difficulty)),
-            trust=max(0.0, min(1.0, self.signal_trust))
+        return (
+            max(-1.0, min(1.0, final_reward)),                 # reward
+            max(0.0, min(1.0, final_novelty)),                 # novelty
+            max(0.0, min(1.0, urgency)),                       # urgency
+            max(0.0, min(1.0, final_difficulty)),              # difficulty
+            max(0.0, min(1.0, self.signal_trust)),             # trust
         )
 
     def _compute_reward(self, obs: Observation, state_delta: float) -> float:
@@ -151,12 +187,14 @@ class RuleBasedExtractor(SignalExtractor):
 
     def _compute_novelty(self, obs: Observation, state_delta: float) -> float:
         # Novelty based on action uniqueness
-        if obs.action in self.action_history:
+        action = self.symbols.intern(obs.action)
+        if action in self.action_history:
             self.current_novelty *= 0.7  # Decay on repetition
         else:
             self.current_novelty += 0.4  # Boost on new action
             
-        self.action_history.append(obs.action)
+        self.action_history.append(action)
+        self.loop_period = self.loop_detector.push(action)
         
         # Novelty Debt Logic (Spec N-5)
         # Accumulate debt if novelty is high but reward is non-positive
@@ -169,11 +207,20 @@ class RuleBasedExtractor(SignalExtractor):
             
         # Suppress if debt too high
         if self.novelty_debt > 5.0:
-            return 0.0  # Exploration theater detected
+            novelty = 0.0  # Exploration theater detected
         elif self.novelty_debt > 3.0:
-            return self.current_novelty * 0.5
+            novelty = self.current_novelty * 0.5
+        else:
+            novelty = min(1.0, self.current_novelty)
             
-        return min(1.0, self.current_novelty)
+        # S-2: Actions inside a confirmed, unproductive loop are not new
+        if self._loop_stalled():
+            novelty *= self.LOOP_NOVELTY_SCALE
+        return novelty
+
+    def _loop_stalled(self) -> bool:
+        """S-2: a loop is confirmed and no step of its last period made progress."""
+        return 0 < self.loop_period <= self.steps_without_progress
 
     def _compute_urgency(self, obs: Observation) -> float:
         # Monotonic increase based on time or steps
@@ -208,6 +255,10 @@ class RuleBasedExtractor(SignalExtractor):
         if obs.result == 'error':
             difficulty += 0.3
             
+        # S-2: Periodic loop penalty (loop_period set by _compute_novelty this step)
+        if self._loop_stalled():
+            difficulty += self.LOOP_DIFFICULTY
+            
         self.current_difficulty = max(self.current_difficulty * 0.9, difficulty)
         return min(1.0, self.current_difficulty)
 
@@ -0,0 +1,194 @@
+# emocore/fingerprint.py
+"""
+Text fingerprints: near-duplicate detection for LLM outputs.
+
+What this module does:
+- Sketches a response with one-permutation MinHash over word 3-gram
+  shingles (64 bins), so two sketches estimate the Jaccard similarity of
+  the two responses' shingle sets
+- Indexes a session's recent sketches with LSH banding (16 bands of 4
+  bins): a new response is compared only against recent responses that
+  share at least one band, not against all of them
+- Reports, per response, the similarity to the closest recent response and
+  to the previous one, and a near-duplicate cluster label
+
+What this module does NOT do:
+- Understand text: paraphrases that keep wording (reordered sentences,
+  small edits, repeated boilerplate) are caught, re-worded ones are not
+- Grow: an index keeps at most `capacity` sketches; memory is fixed
+- Guarantee exact similarities: they are MinHash estimates, and responses
+  below ~0.5 similarity may not become LSH candidates at all (reported as
+  dissimilar)
+
+Deterministic: shingles are hashed with CRC-32, not Python's salted hash().
+
+Usage:
+    index = TextFingerprintIndex()
+    match = index.add(response_text)
+    match.novelty, match.delta, match.cluster
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from zlib import crc32
+
+BINS = 64                            # Power of two: a hash's low bits pick its bin
+BAND_ROWS = 4
+_BIN_BITS = BINS.bit_length() - 1
+_BIN_MASK = BINS - 1
+
+# ASCII punctuation / whitespace -> space; letters, digits, '_' and
+# non-ASCII (UTF-8) bytes are word bytes
+_SEPARATORS = bytes(
+    b if (b >= 0x80 or chr(b).isalnum() or b == 0x5F) else 0x20 for b in range(256)
+)
+_JOIN = b" ".join
+
+Sketch = Tuple[Optional[int], ...]
+
+
+def normalize(text: str) -> bytes:
+    """`text` lower-cased as UTF-8 bytes, every separator turned into a space."""
+    return text.lower().encode("utf-8").translate(_SEPARATORS)
+
+
+def shingle_hashes(text: str) -> Set[int]:
+    """CRC-32 hashes of the word 3-grams of `text` (case-insensitive)."""
+    words = normalize(text).split()
+    if len(words) < 3:
+        return {crc32(_JOIN(words))} if words else set()  # Short texts: one shingle
+    # Every step runs in C: zip -> join -> crc32
+    return set(map(crc32, map(_JOIN, zip(words, words[1:], words[2:]))))
+
+
+def sketch(text: str) -> Sketch:
+    """One-permutation MinHash: the minimum hash per bin (None for empty bins)."""
+    # Descending order: the last (smallest) value written to a bin wins
+    mins = {h & _BIN_MASK: h >> _BIN_BITS for h in sorted(shingle_hashes(text), reverse=True)}
+    return tuple(map(mins.get, range(BINS)))
+
+
+def similarity(a: Sketch, b: Sketch) -> float:
+    """Estimated Jaccard similarity of two sketches (1.0 for two empty texts)."""
+    shared = used = 0
+    for x, y in zip(a, b):
+        if x is None and y is None:
+            continue
+        used += 1
+        if x == y:
+            shared += 1
+    return shared / used if used else 1.0
+
+
+@dataclass(frozen=True)
+class TextMatch:
+    """
+    Fingerprint of one response against the session's recent responses.
+
+    similarity: estimated Jaccard similarity to the closest recent response
+    previous_similarity: the same, against the immediately preceding response
+    novelty: 1 - similarity (nothing like it recently -> 1.0)
+    delta: 1 - previous_similarity (how much the output changed this step)
+    cluster: near-duplicate label; responses at or above the duplicate
+             threshold share the label of the response they repeat
+    duplicate: similarity >= the index's duplicate threshold
+    """
+    similarity: float
+    previous_similarity: float
+    novelty: float
+    delta: float
+    cluster: int
+    duplicate: bool
+
+
+class TextFingerprintIndex:
+    """
+    LSH index over the last `capacity` response sketches of one session.
+
+    Cluster labels cycle through `labels` values, so a label can only be
+    reused after that many distinct clusters (bounded symbol growth when
+    labels are folded into action names).
+    """
+
+    def __init__(self, capacity: int = 64, duplicate_threshold: float = 0.8, labels: int = 4096):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.duplicate_threshold = duplicate_threshold
+        self.labels = labels
+        self._sketches: List[Optional[Sketch]] = [None] * capacity
+        self._clusters: List[int] = [0] * capacity
+        self._buckets: Dict[Tuple[int, Sketch], Set[int]] = {}
+        self._next = 0
+        self._previous: Optional[int] = None
+        self._cluster_counter = 0
+
+    def __len__(self) -> int:
+        return sum(s is not None for s in self._sketches)
+
+    def add(self, text: str) -> TextMatch:
+        """Fingerprint `text`, match it against recent responses, then index it."""
+        sig = sketch(text)
+        keys = _band_keys(sig)
+
+        # 1. Candidates: recent responses sharing at least one band
+        candidates = set()
+        buckets = self._buckets
+        for key in keys:
+            slots = buckets.get(key)
+            if slots:
+                candidates |= slots
+        previous = self._previous
+        if previous is not None:
+            candidates.add(previous)
+
+        best, best_slot, previous_sim = 0.0, None, 0.0
+        for slot in candidates:
+            sim = similarity(sig, self._sketches[slot])
+            if sim > best:
+                best, best_slot = sim, slot
+            if slot == previous:
+                previous_sim = sim
+
+        duplicate = best_slot is not None and best >= self.duplicate_threshold
+        if duplicate:
+            cluster = self._clusters[best_slot]
+        else:
+            cluster = self._cluster_counter
+            self._cluster_counter = (self._cluster_counter + 1) % self.labels
+
+        # 2. Insert, evicting the oldest sketch
+        slot = self._next
+        old = self._sketches[slot]
+        if old is not None:
+            for key in _band_keys(old):
+                slots = buckets[key]
+                slots.discard(slot)
+                if not slots:
+                    del buckets[key]
+        self._sketches[slot] = sig
+        self._clusters[slot] = cluster
+        for key in keys:
+            buckets.setdefault(key, set()).add(slot)
+        self._previous = slot
+        self._next = (slot + 1) % self.capacity
+
+        return TextMatch(
+            similarity=best,
+            previous_similarity=previous_sim,
+            novelty=1.0 - best,
+            delta=1.0 - previous_sim,
+            cluster=cluster,
+            duplicate=duplicate,
+        )
+
+    def reset(self) -> None:
+        self.__init__(self.capacity, self.duplicate_threshold, self.labels)
+
+
+def _band_keys(sig: Sketch) -> List[Tuple[int, Sketch]]:
+    keys = []
+    for band in range(BINS // BAND_ROWS):
+        rows = sig[band * BAND_ROWS:(band + 1) * BAND_ROWS]
+        if rows.count(None) != BAND_ROWS:
+            keys.append((band, rows))
+    return keys
@@ -0,0 +1,336 @@
+# emocore/fleet.py
+"""
+EmoFleet: Struct-of-arrays engine that steps many sessions at once.
+
+What EmoFleet does:
+- Holds the per-session engine state of N sessions in contiguous NumPy arrays
+- Advances every live session with one vectorized call per step
+- Reproduces EmoEngine.step semantics exactly (inertia, risk freeze,
+  bounded recovery, ordered failure checks, terminal HALT)
+- Supports a different Profile per session via a profile parameter table
+
+What EmoFleet does NOT do:
+- Build EngineResult / BehaviorBudget objects per session (it returns arrays)
+- Read the wall clock (the caller supplies dt, per session or shared)
+- Extract or validate signals (that's Extractor / Validator's job)
+
+Array layout:
+- pressure: (N, 5) in canonical axis order
+  (confidence, frustration, curiosity, arousal, risk)
+- budget arrays: (N, 4) in governance column order
+  (effort, risk, exploration, persistence)
+- failure / mode: int8 codes equal to FailureType.value / Mode.value
+
+State arrays are only updated in place, so a fleet can run over arrays it
+does not own (EmoFleet.over(), e.g. a shard of emocore.shared_fleet).
+"""
+from dataclasses import dataclass, fields
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from emocore.behavior import BehaviorBudget
+from emocore.engine import EmoEngine
+from emocore.failures import FailureType
+from emocore.governance import GovernanceEngine
+from emocore.modes import Mode
+from emocore.profiles import Profile
+
+
+# Budget column indices (governance output order)
+EFFORT, RISK, EXPLORATION, PERSISTENCE = 0, 1, 2, 3
+
+# Per-session state arrays, in the order EmoFleet.over() binds them
+STATE_FIELDS = (
+    "pressure", "budget", "previous_budget", "stable_budget", "previous_risk",
+    "step_count", "no_progress_steps", "halted", "failure", "mode",
+)
+
+# Failure reasons, identical to the strings EmoEngine reports
+FAILURE_REASONS = {
+    FailureType.SAFETY: "exploration_exceeded",
+    FailureType.OVERRISK: "risk_exceeded",
+    FailureType.EXHAUSTION: "exhaustion",
+    FailureType.STAGNATION: "stagnation",
+    FailureType.EXTERNAL: "max_steps",
+}
+
+
+class ProfileTable:
+    """
+    Column-oriented view of a set of profiles.
+
+    Each Profile field becomes one array of length N (one entry per session),
+    gathered from the distinct profiles through `index`. Profiles stay frozen;
+    the table is built once and never mutated.
+    """
+
+    def __init__(self, profiles: Sequence[Profile], index: np.ndarray):
+        self.profiles = tuple(profiles)
+        self.index = np.asarray(index, dtype=np.intp)
+        for f in fields(Profile):
+            if f.name == "name":
+                continue
+            values = np.array([getattr(p, f.name) for p in self.profiles], dtype=np.float64)
+            setattr(self, f.name, values[self.index])
+
+    @classmethod
+    def build(cls, profiles: Union[Profile, Sequence[Profile]], size: Optional[int] = None) -> "ProfileTable":
+        """Build a table from one shared profile or one profile per session."""
+        if isinstance(profiles, Profile):
+            if size is None:
+                raise ValueError("size is required when a single profile is shared")
+            return cls([profiles], np.zeros(size, dtype=np.intp))
+
+        profiles = list(profiles)
+        if size is not None and size != len(profiles):
+            raise ValueError(f"Expected {size} profiles, got {len(profiles)}")
+
+        unique = {}
+        index = np.empty(len(profiles), dtype=np.intp)
+        for i, p in enumerate(profiles):
+            index[i] = unique.setdefault(p, len(unique))
+        return cls(list(unique), index)
+
+    def profile_of(self, session: int) -> Profile:
+        return self.profiles[self.index[session]]
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    """
+    Result of one EmoFleet step, one entry per session.
+
+    Arrays are fresh copies; mutating them does not affect the fleet.
+    Halted sessions report a zeroed budget and Mode.HALTED, exactly like
+    EngineResult does for a single engine.
+    """
+    budget: np.ndarray    # (N, 4) effort, risk, exploration, persistence
+    halted: np.ndarray    # (N,) bool
+    failure: np.ndarray   # (N,) int8, FailureType.value
+    mode: np.ndarray      # (N,) int8, Mode.value
+    stepped: np.ndarray   # (N,) bool, sessions that evolved during this call
+
+
+class EmoFleet:
+    """
+    Vectorized EmoEngine for N independent sessions.
+
+    Each row of every state array is the state one EmoEngine would hold:
+    pressure, budget, previous budget, stable budget, frozen risk,
+    no_progress_steps, step_count and the terminal halt flag. A step over
+    the fleet is equivalent to calling EmoEngine.step on every live session
+    with the same signals and dt.
+
+    Post-Failure Semantics:
+    -----------------------
+    HALTED is TERMINAL per session. Halted rows are masked out of every
+    update: their state does not evolve and their budget is reported as zero.
+    """
+
+    BUDGET_INERTIA_ALPHA = EmoEngine.BUDGET_INERTIA_ALPHA
+    RECOVERING_THRESHOLD = EmoEngine.RECOVERING_THRESHOLD
+
+    def __init__(self, profiles: Union[Profile, Sequence[Profile]], size: Optional[int] = None):
+        self._configure(profiles, size)
+        n = self.size
+
+        # Persistent internal state
+        self.pressure = np.zeros((n, 5), dtype=np.float64)
+        self.budget = np.tile(np.array([1.0, 0.0, 0.0, 1.0]), (n, 1))
+        self.previous_budget = self.budget.copy()
+        self.stable_budget = self.budget.copy()
+        self.previous_risk = np.zeros(n, dtype=np.float64)
+
+        self.step_count = np.zeros(n, dtype=np.int64)
+        self.no_progress_steps = np.zeros(n, dtype=np.int64)
+
+        # Terminal failure state
+        self.halted = np.zeros(n, dtype=bool)
+        self.failure = np.full(n, FailureType.NONE.value, dtype=np.int8)
+        self.mode = np.full(n, Mode.IDLE.value, dtype=np.int8)
+
+    @classmethod
+    def over(cls, profiles: Union[Profile, Sequence[Profile]], state) -> "EmoFleet":
+        """
+        Fleet whose state lives in existing arrays.
+
+        `state[name]` must give an array of the fleet's shape and dtype for
+        every name in STATE_FIELDS (a structured array works, including a
+        strided view). The fleet updates those arrays in place; their
+        contents are taken as the sessions' current state.
+        """
+        fleet = cls.__new__(cls)
+        fleet._configure(profiles, len(state["halted"]))
+        for name in STATE_FIELDS:
+            setattr(fleet, name, state[name])
+        return fleet
+
+    def _configure(self, profiles: Union[Profile, Sequence[Profile]], size: Optional[int]) -> None:
+        self.profiles = ProfileTable.build(profiles, size)
+        n = len(self.profiles.index)
+        self.size = n
+
+        # Fused governance matrix (W - V), used as (N, 5) @ (5, 4)
+        self._M = np.array(GovernanceEngine.M, dtype=np.float64)
+
+        # Per-session column scales, with stagnation folded in (as GovernanceEngine does)
+        p = self.profiles
+        self._scale = np.stack(
+            [p.effort_scale, p.risk_scale, p.exploration_scale, p.persistence_scale], axis=1
+        )
+        self._stagnating_scale = self._scale.copy()
+        self._stagnating_scale[:, EFFORT] *= p.stagnation_effort_scale
+        self._stagnating_scale[:, PERSISTENCE] *= p.stagnation_persistence_scale
+
+    def __len__(self) -> int:
+        return self.size
+
+    def step(
+        self,
+        reward,
+        novelty,
+        urgency,
+        difficulty=0.0,
+        trust=1.0,
+        dt=1.0,
+    ) -> FleetResult:
+        """
+        Advance every live session by one step.
+
+        Args:
+            reward, novelty, urgency, difficulty: Scalars or (N,) arrays.
+            trust: Accepted for signature parity with EmoEngine.step; like the
+                   engine, governance does not consume it.
+            dt: Scalar or (N,) array of elapsed time per session.
+
+        Returns:
+            FleetResult with per-session budget, halt, failure and mode arrays.
+        """
+        live = self._advance(reward, novelty, urgency, difficulty, dt)
+        out_budget = np.where(self.halted[:, None], 0.0, self.budget)
+        return FleetResult(
+            budget=out_budget,
+            halted=self.halted.copy(),
+            failure=self.failure.copy(),
+            mode=self.mode.copy(),
+            stepped=live,
+        )
+
+    def _advance(self, reward, novelty, urgency, difficulty, dt) -> np.ndarray:
+        """step() without building a FleetResult. Returns the live mask."""
+        n = self.size
+        live = ~self.halted
+        reward = np.broadcast_to(np.asarray(reward, dtype=np.float64), (n,))
+        novelty = np.broadcast_to(np.asarray(novelty, dtype=np.float64), (n,))
+        urgency = np.broadcast_to(np.asarray(urgency, dtype=np.float64), (n,))
+        difficulty = np.broadcast_to(np.asarray(difficulty, dtype=np.float64), (n,))
+        dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), (n,))
+        p = self.profiles
+
+        self.step_count[live] += 1
+
+        # 1. Progress tracking (stagnation)
+        progress = reward > 0.0
+        self.no_progress_steps[...] = np.where(
+            live, np.where(progress, 0, self.no_progress_steps + 1), self.no_progress_steps
+        )
+        stagnating = self.no_progress_steps >= p.stagnation_window
+
+        # 2. Appraisal -> Pressure accumulation (AppraisalEngine coefficients)
+        delta = np.empty((n, 5), dtype=np.float64)
+        delta[:, 0] = (reward * 0.3) - (difficulty * 0.1)
+        delta[:, 1] = np.where(progress, 0.0, difficulty * 0.4) + (urgency * 0.2)
+        delta[:, 2] = (novelty * 0.5) - ((1.0 - novelty) * 0.2)
+        delta[:, 3] = urgency * 0.6
+        delta[:, 4] = -np.abs(reward) * 0.3
+        self.pressure[live] += delta[live]
+
+        # 3. Governance -> Raw behavior budget
+        s = self.pressure
+        g = s @ self._M
+        g *= np.where(stagnating[:, None], self._stagnating_scale, self._scale)
+        g[:, EXPLORATION] -= p.exploration_decay + dt * p.time_exploration_decay
+        g[:, PERSISTENCE] -= p.persistence_decay + dt * p.time_persistence_decay
+        np.clip(g, 0.0, 1.0, out=g)
+
+        # 4. Budget inertia
+        alpha = self.BUDGET_INERTIA_ALPHA
+        budget = alpha * self.previous_budget + (1 - alpha) * g
+
+        # 5. Mode determination (BEFORE recovery)
+        recovering = (budget[:, EFFORT] < self.RECOVERING_THRESHOLD) | (
+            budget[:, PERSISTENCE] < self.RECOVERING_THRESHOLD
+        )
+
+        # 6. Risk freezing during RECOVERING
+        budget[:, RISK] = np.where(recovering, self.previous_risk, budget[:, RISK])
+
+        # 7. Bounded recovery (ONLY when RECOVERING and dt >= recovery_delay)
+        recover = recovering & (dt >= p.recovery_delay)
+        for col in (EFFORT, PERSISTENCE):
+            recovered = np.minimum(
+                np.minimum(self.stable_budget[:, col], p.recovery_cap),
+                budget[:, col] + p.recovery_rate * dt,
+            )
+            budget[:, col] = np.where(recover, recovered, budget[:, col])
+
+        # 8. Update tracking state for live sessions only
+        self.budget[live] = budget[live]
+        self.previous_budget[live] = budget[live]
+        self.previous_risk[live] = budget[live, RISK]
+        idle = live & ~recovering
+        self.stable_budget[idle] = budget[idle]
+
+        # 9. Failure checks (ordered, terminal)
+        b = self.budget
+        failure = np.select(
+            [
+                b[:, EXPLORATION] >= p.max_exploration,
+                b[:, RISK] >= p.max_risk,
+                b[:, EFFORT] <= p.exhaustion_threshold,
+                stagnating & (b[:, EFFORT] <= p.stagnation_effort_floor),
+                self.step_count >= p.max_steps,
+            ],
+            [
+                FailureType.SAFETY.value,
+                FailureType.OVERRISK.value,
+                FailureType.EXHAUSTION.value,
+                FailureType.STAGNATION.value,
+                FailureType.EXTERNAL.value,
+            ],
+            default=FailureType.NONE.value,
+        ).astype(np.int8)
+
+        # 10. Terminal state transition
+        newly_halted = live & (failure != FailureType.NONE.value)
+        self.halted |= newly_halted
+        self.failure[newly_halted] = failure[newly_halted]
+        self.mode[live] = np.where(recovering[live], Mode.RECOVERING.value, Mode.IDLE.value)
+        self.mode[self.halted] = Mode.HALTED.value
+        return live
+
+    # --------------------------------------------------
+    # Per-session views (allocate objects; not for the hot path)
+    # --------------------------------------------------
+
+    def session_budget(self, session: int) -> BehaviorBudget:
+        """BehaviorBudget of one session, zeroed if it is halted."""
+        if self.halted[session]:
+            return BehaviorBudget(0.0, 0.0, 0.0, 0.0)
+        b = self.budget[session]
+        return BehaviorBudget(
+            effort=float(b[EFFORT]),
+            risk=float(b[RISK]),
+            persistence=float(b[PERSISTENCE]),
+            exploration=float(b[EXPLORATION]),
+        )
+
+    def session_failure(self, session: int) -> FailureType:
+        return FailureType(int(self.failure[session]))
+
+    def session_mode(self, session: int) -> Mode:
+        return Mode(int(self.mode[session]))
+
+    def session_reason(self, session: int) -> Optional[str]:
+        return FAILURE_REASONS.get(self.session_failure(session))
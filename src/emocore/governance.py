@@ -3,7 +3,7 @@
 GovernanceEngine: Translates pressure state into behavioral permission.
 
 What GovernanceEngine does:
-- Converts PressureState into BehaviorBudget via matrix multiplication
+- Converts PressureState into BehaviorBudget via a fused (W - V) matrix product
 - Applies profile-based scaling and decay
 - Responds to stagnation signals from Engine
 - Clips output to [0, 1] range
@@ -18,28 +18,36 @@ Assumptions:
 - PressureState has exactly 5 canonical axes in order: confidence, frustration, curiosity, arousal, risk
 - BehaviorBudget has exactly 4 dimensions: effort, risk, exploration, persistence
 - W and V matrices are fixed for the prototype
+- Pure Python: the core package does not require NumPy
 """
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import numpy as np
-from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from emocore.behavior import BehaviorBudget
 from emocore.state import PressureState
 
 
+def _fuse(W, V):
+    """Fused governance matrix M = W - V (same row/column layout as W and V)."""
+    return tuple(
+        tuple(w - v for w, v in zip(w_row, v_row))
+        for w_row, v_row in zip(W, V)
+    )
+
+
 class GovernanceEngine:
     """
     Stateless governance engine that computes behavioral permission from pressure.
     
     The governance equation is:
-        g = W.T @ s - V.T @ s
+        g = W.T @ s - V.T @ s = (W - V).T @ s = M.T @ s
     
     Where:
     - s is the pressure state vector [confidence, frustration, curiosity, arousal, risk]
     - W is the enabling matrix (positive pressure → positive budget)
     - V is the suppressive matrix (frustration suppresses all dimensions)
+    - M is the fused matrix W - V, precomputed once
     - g is the raw governance output [effort, risk, exploration, persistence]
     
     This is NOT learning. The matrices are fixed.
@@ -50,81 +58,161 @@ class GovernanceEngine:
     - Engine DETECTS stagnation and passes flag to governance
     - Governance RESPONDS to stagnation by scaling effort/persistence
     - Profiles TUNE the response via scaling and decay parameters
+
+    Kernel:
+    The profile is frozen, so everything that does not depend on pressure or
+    dt is folded once in __init__: M's columns are pre-multiplied by the
+    profile scale (and, for the stagnating variant, the stagnation scale),
+    and step decays become per-dimension constants. compute_values() is then
+    20 unrolled multiply-adds in plain Python. No NumPy is involved.
     """
     
     # Enabling matrix (pressures → governance)
     # Rows: pressure axes (confidence, frustration, curiosity, arousal, risk)
     # Cols: budget dimensions (effort, risk, exploration, persistence)
-    W = np.array([
-        [0.6, 0.3, 0.2, 0.5],  # confidence
-        [0.0, 0.0, 0.0, 0.0],  # frustration (no enabling)
-        [0.2, 0.1, 0.7, 0.1],  # curiosity
-        [0.3, 0.2, 0.1, 0.2],  # arousal
-        [0.1, 0.5, 0.3, 0.1],  # risk
-    ])
+    W = (
+        (0.6, 0.3, 0.2, 0.5),  # confidence
+        (0.0, 0.0, 0.0, 0.0),  # frustration (no enabling)
+        (0.2, 0.1, 0.7, 0.1),  # curiosity
+        (0.3, 0.2, 0.1, 0.2),  # arousal
+        (0.1, 0.5, 0.3, 0.1),  # risk
+    )
 
     # Suppressive matrix (only frustration suppresses)
     # Frustration suppresses all budget dimensions
-    V = np.array([
-        [0.0, 0.0, 0.0, 0.0],  # confidence
-        [0.7, 0.9, 0.9, 0.8],  # frustration suppresses all
-        [0.0, 0.0, 0.0, 0.0],  # curiosity
-        [0.0, 0.0, 0.0, 0.0],  # arousal
-        [0.0, 0.0, 0.0, 0.0],  # risk
-    ])
+    V = (
+        (0.0, 0.0, 0.0, 0.0),  # confidence
+        (0.7, 0.9, 0.9, 0.8),  # frustration suppresses all
+        (0.0, 0.0, 0.0, 0.0),  # curiosity
+        (0.0, 0.0, 0.0, 0.0),  # arousal
+        (0.0, 0.0, 0.0, 0.0),  # risk
+    )
+
+    # Fused matrix, computed once for all profiles
+    M = _fuse(W, V)
 
     def __init__(self, profile=None):
         self.profile = profile
 
+        if profile:
+            scales = (
+                profile.effort_scale,
+                profile.risk_scale,
+                profile.exploration_scale,
+                profile.persistence_scale,
+            )
+            stagnation_scales = (
+                profile.stagnation_effort_scale,
+                1.0,
+                1.0,
+                profile.stagnation_persistence_scale,
+            )
+            self._exploration_decay = profile.exploration_decay
+            self._persistence_decay = profile.persistence_decay
+            self._time_exploration_decay = profile.time_exploration_decay
+            self._time_persistence_decay = profile.time_persistence_decay
+        else:
+            scales = (1.0, 1.0, 1.0, 1.0)
+            stagnation_scales = (1.0, 1.0, 1.0, 1.0)
+            self._exploration_decay = 0.0
+            self._persistence_decay = 0.0
+            self._time_exploration_decay = 0.0
+            self._time_persistence_decay = 0.0
+
+        # Flattened column-major coefficients: 4 columns x 5 pressure axes
+        self._coeffs = self._fold(scales)
+        self._stagnating_coeffs = self._fold(
+            tuple(k * q for k, q in zip(scales, stagnation_scales))
+        )
+
+    @classmethod
+    def _fold(cls, column_scales) -> Tuple[float, ...]:
+        return tuple(
+            cls.M[i][j] * column_scales[j]
+            for j in range(4)
+            for i in range(5)
+        )
+
+    def compute_values(
+        self,
+        confidence: float,
+        frustration: float,
+        curiosity: float,
+        arousal: float,
+        risk: float,
+        stagnating: bool = False,
+        dt: float = 0.0,
+    ) -> Tuple[float, float, float, float]:
+        """
+        Scalar governance kernel.
+
+        Returns:
+            (effort, risk, exploration, persistence), each clipped to [0, 1].
+        """
+        (e0, e1, e2, e3, e4,
+         r0, r1, r2, r3, r4,
+         x0, x1, x2, x3, x4,
+         p0, p1, p2, p3, p4) = self._stagnating_coeffs if stagnating else self._coeffs
+
+        effort = e0 * confidence + e1 * frustration + e2 * curiosity + e3 * arousal + e4 * risk
+        risk_ = r0 * confidence + r1 * frustration + r2 * curiosity + r3 * arousal + r4 * risk
+        exploration = (
+            x0 * confidence + x1 * frustration + x2 * curiosity + x3 * arousal + x4 * risk
+            - (self._exploration_decay + dt * self._time_exploration_decay)
+        )
+        persistence = (
+            p0 * confidence + p1 * frustration + p2 * curiosity + p3 * arousal + p4 * risk
+            - (self._persistence_decay + dt * self._time_persistence_decay)
+        )
+
+        # Clip to [0, 1]
+        return (
+            0.0 if effort < 0.0 else (1.0 if effort > 1.0 else effort),
+            0.0 if risk_ < 0.0 else (1.0 if risk_ > 1.0 else risk_),
+            0.0 if exploration < 0.0 else (1.0 if exploration > 1.0 else exploration),
+            0.0 if persistence < 0.0 else (1.0 if persistence > 1.0 else persistence),
+        )
+
+    def unclipped_values(
+        self,
+        confidence: float,
+        frustration: float,
+        curiosity: float,
+        arousal: float,
+        risk: float,
+        stagnating: bool = False,
+        dt: Optional[float] = 0.0,
+    ) -> Tuple[float, float, float, float]:
+        """
+        Governance output BEFORE clipping, used for trajectory analysis.
+
+        The map is affine in pressure, so evaluating it on a pressure delta
+        with dt=None (no decay term) gives the per-step slope of each dimension.
+        """
+        c = self._stagnating_coeffs if stagnating else self._coeffs
+        values = [
+            c[5 * j] * confidence + c[5 * j + 1] * frustration + c[5 * j + 2] * curiosity
+            + c[5 * j + 3] * arousal + c[5 * j + 4] * risk
+            for j in range(4)
+        ]
+        if dt is not None:
+            values[2] -= self._exploration_decay + dt * self._time_exploration_decay
+            values[3] -= self._persistence_decay + dt * self._time_persistence_decay
+        return values[0], values[1], values[2], values[3]
+
     def compute(self, state: PressureState, stagnating: bool = False, dt: float = 0.0) -> BehaviorBudget:
-        s = np.array([
+        effort, risk, exploration, persistence = self.compute_values(
             state.confidence,
             state.frustration,
             state.curiosity,
             state.arousal,
             state.risk,
-        ])
-
-        g = self.W.T @ s - self.V.T @ s
-
-        # 1. Stagnation Scaling (Before Profile Scaling? Or After? 
-        # User said: "Stagnation is engine policy... applies to BehaviorBudget".
-        # But now "Governance scales...". 
-        # Usually suppression happens early or late.
-        # Let's apply it to the raw matrix output 'g' for consistency, 
-        # OR apply it to the final budget values.
-        # The previous Engine implementation applied it to the BehaviorBudget logic.
-        # Let's do it on 'g' to keep matrix operations together, or keep it explicit?
-        # User said: "Stagnation handling... Governance starts reacting to stagnating".
-        # Let's apply it to 'g' indices corresponding to Effort(0) and Persistence(3).
-        if stagnating and self.profile:
-            g[0] *= self.profile.stagnation_effort_scale
-            g[3] *= self.profile.stagnation_persistence_scale
-
-        # 2. Profile Scaling
-        if self.profile:
-            g[0] *= self.profile.effort_scale
-            g[1] *= self.profile.risk_scale
-            g[2] *= self.profile.exploration_scale
-            g[3] *= self.profile.persistence_scale
-
-        # 3. Decay (Time + Step)
-        # Decay is subtracted. 
-        # Previous engine logic: max(0, val - decay - dt*time_decay)
-        # We apply this to `g`.
-        if self.profile:
-            decay_expl = self.profile.exploration_decay + dt * self.profile.time_exploration_decay
-            decay_pers = self.profile.persistence_decay + dt * self.profile.time_persistence_decay
-            
-            g[2] -= decay_expl
-            g[3] -= decay_pers
-
-        # 4. Clip
-        g = np.clip(g, 0.0, 1.0)
-
+            stagnating,
+            dt,
+        )
         return BehaviorBudget(
-            effort=float(g[0]),
-            risk=float(g[1]),
-            exploration=float(g[2]),
-            persistence=float(g[3]),
+            effort=effort,
+            risk=risk,
+            exploration=exploration,
+            persistence=persistence,
         )
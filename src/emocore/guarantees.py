@@ -17,11 +17,15 @@ Guarantees do NOT:
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from dataclasses import dataclass
-from typing import Mapping, Optional, Dict
-from emocore.behavior import BehaviorBudget
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Dict, TYPE_CHECKING
+from emocore.behavior import BehaviorBudget, ZERO_BUDGET
 from emocore.modes import Mode
 from emocore.failures import FailureType
+from emocore.result import LazyPressureResult, PRESSURE_AXES, lazy_views
+
+if TYPE_CHECKING:
+    from emocore.horizon import HorizonForecast
 
 
 # Type alias for external pressure snapshot
@@ -29,13 +33,17 @@ from emocore.failures import FailureType
 PressureSnapshot = Mapping[str, float]
 
 
-@dataclass(frozen=True)
-class StepResult:
+@lazy_views
+@dataclass(frozen=True, slots=True)
+class StepResult(LazyPressureResult):
     """
     Immutable result exposed by the public interface.
     
     NOTE: state is a PressureSnapshot (Mapping[str, float]), NOT a PressureState.
     PressureState is internal to core. The interface exposes a dict snapshot.
+    
+    state and pressure_log are built on first access when the result comes
+    from the engine (see from_engine).
     """
     state: PressureSnapshot  # Dict snapshot, not PressureState
     budget: BehaviorBudget
@@ -44,6 +52,30 @@ class StepResult:
     reason: str | None
     mode: Mode
     pressure_log: Optional[Dict[str, float]] = None  # Observability for debugging
+    # Lazy steps-to-halt forecast (opt-in). Not compared or repr'd: forecasts
+    # compare by identity and rendering one would run its simulation
+    horizon: Optional["HorizonForecast"] = field(default=None, compare=False, repr=False)
+
+    def _init_extra(self) -> None:
+        object.__setattr__(self, "horizon", None)
+
+    def _make_state(self, pressure) -> PressureSnapshot:
+        return dict(zip(PRESSURE_AXES, pressure))
+
+    @classmethod
+    def from_engine(cls, res, horizon: Optional["HorizonForecast"] = None) -> "StepResult":
+        """StepResult for an EngineResult, sharing its pressure without copying it."""
+        pressure = res._pressure
+        if pressure is None:
+            st = res.state
+            pressure = (st.confidence, st.frustration, st.curiosity, st.arousal, st.risk)
+        result = cls.lazy(
+            pressure, res._trust, res.budget, res.halted, res.failure, res.reason, res.mode,
+        )
+        # Share the engine result's pressure_log if it was already built
+        result._views[1].__set__(result, res._views[1].__get__(res))
+        object.__setattr__(result, "horizon", horizon)
+        return result
 
 
 class GuaranteeEnforcer:
@@ -60,35 +92,35 @@ class GuaranteeEnforcer:
     """
 
     def enforce(self, result: StepResult) -> StepResult:
-        # HARD guarantee: budget bounded to [0.0, 1.0]
-        b = result.budget
-        safe_budget = BehaviorBudget(
-            effort=min(max(b.effort, 0.0), 1.0),
-            risk=min(max(b.risk, 0.0), 1.0),
-            exploration=min(max(b.exploration, 0.0), 1.0),
-            persistence=min(max(b.persistence, 0.0), 1.0),
-        )
-
+        """
+        Return a result satisfying the invariants.
+        
+        A result that already complies is returned as is (it is immutable);
+        otherwise a copy with the offending fields fixed is returned.
+        """
         if result.halted:
             # HARD guarantee: halted => zero budget, mode == HALTED
             # PRESERVE failure and reason (do NOT erase)
-            return StepResult(
-                state=result.state,
-                budget=BehaviorBudget(0.0, 0.0, 0.0, 0.0),
-                halted=True,
-                failure=result.failure,  # Preserved
-                reason=result.reason,     # Preserved (may be None, that's OK)
-                mode=Mode.HALTED,         # INVARIANT: halted => HALTED
-                pressure_log=result.pressure_log,  # Preserved
+            if result.mode is Mode.HALTED and result.budget == ZERO_BUDGET:
+                return result
+            return result._replace(
+                budget=ZERO_BUDGET,
+                mode=Mode.HALTED,  # INVARIANT: halted => HALTED
             )
 
         # Not halted: clamp budget only, preserve ALL other fields
-        return StepResult(
-            state=result.state,
-            budget=safe_budget,
-            halted=False,
-            failure=result.failure,  # Preserved (not erased to NONE)
-            reason=result.reason,    # Preserved (not erased to None)
-            mode=result.mode,        # Preserved (not overridden)
-            pressure_log=result.pressure_log,  # Preserved
+        # (failure and reason are not erased, mode is not overridden)
+        b = result.budget
+        if (0.0 <= b.effort <= 1.0 and 0.0 <= b.risk <= 1.0
+                and 0.0 <= b.exploration <= 1.0 and 0.0 <= b.persistence <= 1.0):
+            return result
+
+        # HARD guarantee: budget bounded to [0.0, 1.0]
+        return result._replace(
+            budget=BehaviorBudget(
+                effort=min(max(b.effort, 0.0), 1.0),
+                risk=min(max(b.risk, 0.0), 1.0),
+                exploration=min(max(b.exploration, 0.0), 1.0),
+                persistence=min(max(b.persistence, 0.0), 1.0),
+            ),
         )
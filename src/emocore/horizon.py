@@ -0,0 +1,109 @@
+# emocore/horizon.py
+"""
+HorizonForecast: how many steps until HALT if the current signals persist.
+
+What HorizonForecast does:
+- Captures a checkpoint of the engine right after a step (one flat copy
+  of its scalar state)
+- On first access, forks the engine from that checkpoint and fast-forwards
+  it with EmoEngine.advance() under the same signals and dt
+- Reports the predicted halt step, failure type, and the counter-based
+  distances to the stagnation window and the max_steps fuse
+
+What HorizonForecast does NOT do:
+- Influence the engine (the fork is discarded)
+- Predict signal changes (it assumes the last signals repeat)
+- Run anything until a field is read
+
+Semantics:
+- Distances count future steps: steps_to_halt == 1 means the very next
+  step would halt. A halted engine reports 0 and its actual failure.
+"""
+from typing import Optional
+
+from emocore.clock import DeltaClock
+from emocore.failures import FailureType
+
+
+class HorizonForecast:
+    """
+    Lazy steps-to-halt forecast attached to a StepResult.
+
+    Construction only stores a checkpoint; the simulation runs once, on the
+    first access to steps_to_halt or failure.
+    """
+
+    __slots__ = ("_engine", "_checkpoint", "_signals", "_dt", "_steps_to_halt", "_failure")
+
+    def __init__(self, engine, signals, dt: Optional[float] = None):
+        self._engine = engine
+        self._checkpoint = engine.checkpoint()
+        self._signals = signals
+        self._dt = engine.last_dt if dt is None else dt
+        self._steps_to_halt = None
+        self._failure = None
+
+    # --------------------------------------------------
+    # Counter-based distances (no simulation)
+    # --------------------------------------------------
+
+    @property
+    def step_count(self) -> int:
+        """Engine step_count at the time of the forecast."""
+        return self._checkpoint[1]
+
+    @property
+    def steps_to_external(self) -> int:
+        """Steps until the max_steps fuse (EXTERNAL) fires."""
+        return max(0, self._engine.profile.max_steps - self.step_count)
+
+    @property
+    def steps_to_stagnating(self) -> Optional[int]:
+        """
+        Steps until the engine reports stagnating, or None if the current
+        reward counts as progress (the counter would keep resetting).
+        """
+        if self._signals.reward > 0.0:
+            return None
+        no_progress_steps = self._checkpoint[2]
+        return max(0, self._engine.profile.stagnation_window - no_progress_steps)
+
+    # --------------------------------------------------
+    # Simulated halt (computed lazily)
+    # --------------------------------------------------
+
+    @property
+    def steps_to_halt(self) -> int:
+        """Future steps until HALT (0 if already halted)."""
+        if self._steps_to_halt is None:
+            self._run()
+        return self._steps_to_halt
+
+    @property
+    def failure(self) -> FailureType:
+        """Failure type the engine is predicted to halt with."""
+        if self._failure is None:
+            self._run()
+        return self._failure
+
+    def _run(self) -> None:
+        if self._checkpoint[3]:
+            self._steps_to_halt = 0
+            self._failure = self._checkpoint[4]
+            return
+
+        shadow = self._engine.fork(self._checkpoint, clock=DeltaClock(default_dt=self._dt))
+        # EXTERNAL bounds the horizon: the engine always halts by max_steps
+        out = shadow.advance(self._signals, self.steps_to_external)
+        if out.halt_step is None:
+            self._steps_to_halt = out.steps
+            self._failure = FailureType.EXTERNAL
+        else:
+            self._steps_to_halt = out.halt_step - self.step_count
+            self._failure = out.result.failure
+
+    def __repr__(self) -> str:
+        return (
+            f"HorizonForecast(step_count={self.step_count}, "
+            f"steps_to_halt={self.steps_to_halt}, failure={self.failure})"
+        )
@@ -1,57 +1,203 @@
 # emocore/interface.py
 
-from dataclasses import dataclass, asdict
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Protocol, Sequence, Tuple, Union
 import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from emocore.agent import EmoCoreAgent
 from emocore.observation import Observation
-from emocore.extractor import SignalExtractor, RuleBasedExtractor
+from emocore.extractor import SignalExtractor
 from emocore.validator import SignalValidator
+from emocore.session import GovernedSession
 from emocore.guarantees import (
     GuaranteeEnforcer,
     StepResult,
 )
 from emocore.signals import Signals
+from emocore.horizon import HorizonForecast
 from emocore.failures import FailureType
 from emocore.modes import Mode
+from emocore.decision import is_halted, mode_of
+from emocore.result import StreamSummary, StepTable
 
 
+# Stateless: one instance serves every call
+_ENFORCER = GuaranteeEnforcer()
 
-def step(agent: EmoCoreAgent, signals: Signals) -> StepResult:
+
+class SignalArray(Protocol):
+    """
+    (N, 5) array of signal rows, e.g. a NumPy array. Only duck-typed on
+    ndim / shape / slicing / tolist(): the core does not require NumPy.
+    """
+
+    ndim: int
+    shape: Tuple[int, ...]
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: Any) -> Any: ...
+
+
+def step(
+    agent: EmoCoreAgent,
+    signals: Signals,
+    dt: Optional[float] = None,
+    forecast: Optional[bool] = None,
+) -> StepResult:
     """
     Canonical public interface.
     Pure function: no mutation of inputs.
+
+    dt is passed through to the engine's Clock (see emocore.clock).
+    forecast attaches a lazy HorizonForecast to the result; it defaults to
+    the agent's `forecast` setting.
     """
 
-    res = agent.step(
-        reward=signals.reward,
-        novelty=signals.novelty,
-        urgency=signals.urgency,
-        difficulty=signals.difficulty,
-        trust=signals.trust,
-    )
+    forecast = agent.forecast if forecast is None else forecast
+    # The forecast checkpoints the state this step produced: take it under
+    # the same lock hold as the step (the agent lock is re-entrant)
+    with agent.lock:
+        res = agent.step(
+            reward=signals.reward,
+            novelty=signals.novelty,
+            urgency=signals.urgency,
+            difficulty=signals.difficulty,
+            trust=signals.trust,
+            dt=dt,
+        )
+        horizon = HorizonForecast(agent.engine, signals) if forecast else None
 
-    # EngineResult → StepResult
-    result = StepResult(
-        state=asdict(res.state), # Snapshot dict for the interface
-        budget=res.budget,
-        halted=res.halted,
-        failure=res.failure,
-        reason=res.reason,
-        mode=res.mode,
-        pressure_log=res.pressure_log,  # Pass through from engine
-    )
+    # EngineResult → StepResult (state snapshot dict is built on access)
+    result = StepResult.from_engine(res, horizon=horizon)
 
     # Enforce guarantees (clamp, override if halted)
-    return GuaranteeEnforcer().enforce(result)
+    return _ENFORCER.enforce(result)
+
+
+# Array rows converted to Python floats per chunk (bounds work past a HALT)
+_ARRAY_CHUNK = 1024
+
+
+def _signal_rows(signals) -> Iterator[tuple]:
+    """
+    (reward, novelty, urgency, difficulty, trust) per element, pulled lazily.
+
+    Accepts an iterable of Signals or a 2-D array-like with 5 columns in
+    Signals field order (duck-typed: NumPy is not required by the core).
+    """
+    if getattr(signals, "ndim", None) is not None:
+        if signals.ndim != 2 or signals.shape[1] != 5:
+            raise ValueError(
+                f"Signal arrays must have shape (N, 5), got {tuple(signals.shape)}"
+            )
+        for start in range(0, len(signals), _ARRAY_CHUNK):
+            yield from signals[start:start + _ARRAY_CHUNK].tolist()
+        return
+
+    for s in signals:
+        yield s.reward, s.novelty, s.urgency, s.difficulty, s.trust
+
+
+def step_many(
+    agent: EmoCoreAgent,
+    signals: Union[Iterable[Signals], SignalArray],
+    dt: Optional[float] = None,
+    forecast: Optional[bool] = None,
+    summary: bool = False,
+) -> Union[Iterator[StepResult], StreamSummary]:
+    """
+    Step the agent over a stream of signals.
+
+    Equivalent to calling step() once per element, but with the per-call
+    overhead hoisted out of the loop. Input is pulled one element at a time
+    and never past the step that HALTs the session; an agent that is
+    already halted consumes nothing.
+
+    Args:
+        agent: The EmoCore agent instance.
+        signals: Iterable / generator of Signals, or an (N, 5) array with
+                 columns (reward, novelty, urgency, difficulty, trust).
+        dt: Per-step time delta, passed through to the engine's Clock.
+        forecast: Attach a lazy HorizonForecast (defaults to agent.forecast).
+        summary: Return only a StreamSummary (final result, steps, halt index)
+                 instead of a generator. Intermediate steps then skip result
+                 construction entirely.
+
+    Returns:
+        A generator of StepResult (the last one yielded is the halting step,
+        if any), or a StreamSummary when summary=True.
+    """
+    forecast = agent.forecast if forecast is None else forecast
+    if summary:
+        return _step_summary(agent, signals, dt, forecast)
+    return _step_stream(agent, signals, dt, forecast)
+
+
+def _step_stream(agent, signals, dt, forecast) -> Iterator[StepResult]:
+    engine = agent.engine
+    if engine.halted:
+        return
+    step_decision = engine.step_decision
+    snapshot = engine._snapshot
+    enforce = _ENFORCER.enforce
+    lock = agent.lock
+    for row in _signal_rows(signals):
+        # Same state machine as step(); the StepResult is built directly
+        # from the engine state instead of going through an EngineResult.
+        # The lock is held per step, never across a yield.
+        with lock:
+            code = step_decision(*row, dt)
+            result = snapshot(row[4], mode_of(code), StepResult)
+            if forecast:
+                result = result._replace(horizon=HorizonForecast(engine, Signals(*row)))
+        result = enforce(result)
+        yield result
+        if result.halted:
+            return
+
+
+def _step_summary(agent, signals, dt, forecast) -> StreamSummary:
+    with agent.lock:
+        return _summarize(agent, signals, dt, forecast)
+
+
+def _summarize(agent, signals, dt, forecast) -> StreamSummary:
+    engine = agent.engine
+    if engine.halted:
+        return StreamSummary(result=None, steps=0)
+
+    step_decision = engine.step_decision
+    steps = 0
+    row = None
+    code = None
+    for row in _signal_rows(signals):
+        code = step_decision(*row, dt)
+        steps += 1
+        if is_halted(code):
+            break
+
+    if row is None:
+        return StreamSummary(result=None, steps=0)
+
+    # Same result step() would have returned for the last element
+    result = engine._snapshot(row[4], mode_of(code), StepResult)
+    if forecast:
+        result = result._replace(horizon=HorizonForecast(engine, Signals(*row)))
+    return StreamSummary(
+        result=_ENFORCER.enforce(result),
+        steps=steps,
+        halt_index=steps - 1 if engine.halted else None,
+    )
 
 
 def observe(
     agent: EmoCoreAgent, 
     observation: Observation,
     extractor: SignalExtractor | None = None,
-    validator: SignalValidator | None = None
+    validator: SignalValidator | None = None,
+    dt: Optional[float] = None,
+    forecast: Optional[bool] = None,
 ) -> StepResult:
     """
     Primary API for Signal Specification v0.x (Path B).
@@ -65,26 +211,157 @@ def observe(
         observation: The behavioral evidence via an Adapter.
         extractor: Optional custom extractor. Defaults to RuleBasedExtractor.
         validator: Optional custom validator. Defaults to SignalValidator(strict=False).
+        dt: Optional step time delta, passed through to the engine's Clock.
+        forecast: Attach a lazy HorizonForecast (defaults to agent.forecast).
         
     Returns:
         StepResult: The governance decision (halted, mode, etc.)
     """
-    # 1. Select Extractor (maintain state across calls)
-    if extractor is None:
-        if not hasattr(agent, '_extractor'):
-            agent._extractor = RuleBasedExtractor()
-        extractor = agent._extractor
-
-    # 2. Extract Signals (Heuristic Layer)
-    signals = extractor.extract(observation)
+    # Extractor -> Validator -> Engine, wired once per agent (see emocore.session)
+    session = GovernedSession.of(agent, extractor, validator)
+    return session.observe(observation, dt=dt, forecast=forecast)
+
+
+# Columns of a columnar observation batch; optional ones fall back to the
+# Observation defaults when absent.
+OBSERVATION_COLUMNS = (
+    "action", "result", "env_state_delta", "agent_state_delta", "elapsed_time",
+)
+OPTIONAL_OBSERVATION_COLUMNS = ("tokens_used", "error")
+
+
+def _observation_rows(observations) -> Iterator[Observation]:
+    """
+    Observations pulled lazily from a sequence / iterable of Observation, or
+    from a mapping of parallel columns (lists or arrays, see OBSERVATION_COLUMNS).
+    """
+    if not isinstance(observations, Mapping):
+        yield from observations
+        return
+
+    missing = [name for name in OBSERVATION_COLUMNS if name not in observations]
+    if missing:
+        raise ValueError(f"Columnar observations are missing columns: {missing}")
+    names = OBSERVATION_COLUMNS + tuple(
+        name for name in OPTIONAL_OBSERVATION_COLUMNS if name in observations
+    )
+    columns = [observations[name] for name in names]
+    n = len(columns[0])
+    for name, column in zip(names, columns):
+        if len(column) != n:
+            raise ValueError(f"Column {name!r} has {len(column)} rows, expected {n}")
+
+    for start in range(0, n, _ARRAY_CHUNK):
+        stop = start + _ARRAY_CHUNK
+        # Array columns become Python scalars once per chunk
+        chunk = [
+            column[start:stop].tolist() if hasattr(column, "tolist") else column[start:stop]
+            for column in columns
+        ]
+        if len(names) == len(OBSERVATION_COLUMNS):
+            for action, result, env, agent_delta, elapsed in zip(*chunk):
+                yield Observation(action, result, env, agent_delta, elapsed)
+        else:
+            for row in zip(*chunk):
+                yield Observation(**dict(zip(names, row)))
+
+
+def observe_batch(
+    agent: EmoCoreAgent,
+    observations: Union[Sequence[Observation], Iterable[Observation], Mapping[str, Sequence]],
+    extractor: SignalExtractor | None = None,
+    validator: SignalValidator | None = None,
+    dt: Optional[float] = None,
+    forecast: Optional[bool] = None,
+    table: bool = False,
+) -> Union[List[StepResult], StepTable]:
+    """
+    observe() over many observations in one pass.
     
-    # 3. Validate Signals (Deterministic Layer)
-    if validator is None:
-        if not hasattr(agent, '_validator'):
-            agent._validator = SignalValidator(strict=False)
-        validator = agent._validator
+    Extractor and validator are selected once per batch (with the same
+    defaults and agent-owned state as observe()), and governance runs
+    through the engine's decision path. Rows are processed in order and
+    processing stops at the row that HALTs the session; an agent that is
+    already halted processes nothing.
     
-    signals = validator.validate(signals)
+    Args:
+        agent: The EmoCore agent instance.
+        observations: Observations (list / iterable), or a mapping of
+                      parallel columns: action, result, env_state_delta,
+                      agent_state_delta, elapsed_time and optionally
+                      tokens_used, error.
+        extractor: Optional custom extractor. Defaults to the agent's RuleBasedExtractor.
+        validator: Optional custom validator. Defaults to the agent's SignalValidator.
+        dt: Optional per-step time delta, passed through to the engine's Clock.
+        forecast: Attach a lazy HorizonForecast to each StepResult
+                  (defaults to agent.forecast; ignored when table=True).
+        table: Return a compact StepTable instead of one StepResult per row.
     
-    # 4. Governance (Deterministic Layer)
-    return step(agent, signals)
+    Returns:
+        List of StepResult (one per processed row, identical to calling
+        observe() row by row), or a StepTable.
+    """
+    session = GovernedSession.of(agent, extractor, validator)
+    with agent.lock:
+        return _observe_rows(session, observations, dt, forecast, table)
+
+
+def _observe_rows(session, observations, dt, forecast, table):
+    agent = session.agent
+    engine = agent.engine
+    if table:
+        return _observe_table(session, _observation_rows(observations), dt)
+
+    forecast = agent.forecast if forecast is None else forecast
+    results = []
+    if engine.halted:
+        return results
+    extract, validate = session._extract, session._validate
+    step_decision = engine.step_decision
+    snapshot = engine._snapshot
+    enforce = _ENFORCER.enforce
+    for observation in _observation_rows(observations):
+        values = validate(*extract(observation))
+        code = step_decision(*values, dt)
+        result = snapshot(values[4], mode_of(code), StepResult)
+        if forecast:
+            result = result._replace(horizon=HorizonForecast(engine, Signals(*values)))
+        results.append(enforce(result))
+        if result.halted:
+            break
+    return results
+
+
+def _observe_table(session, rows, dt) -> StepTable:
+    engine = session.engine
+    out = StepTable()
+    if engine.halted:
+        return out
+
+    step_decision = engine.step_decision
+    budget_values = engine.budget_values
+    codes = out.codes.append
+    efforts = out.effort.append
+    risks = out.risk.append
+    explorations = out.exploration.append
+    persistences = out.persistence.append
+    extract, validate = session._extract, session._validate
+    trust = None
+    code = None
+    for observation in rows:
+        reward, novelty, urgency, difficulty, trust = validate(*extract(observation))
+        code = step_decision(reward, novelty, urgency, difficulty, trust, dt)
+        effort, risk, exploration, persistence = budget_values()
+        codes(code)
+        # HARD guarantee: budget bounded to [0.0, 1.0] (as GuaranteeEnforcer)
+        efforts(min(max(effort, 0.0), 1.0))
+        risks(min(max(risk, 0.0), 1.0))
+        explorations(min(max(exploration, 0.0), 1.0))
+        persistences(min(max(persistence, 0.0), 1.0))
+        if is_halted(code):
+            out.halt_index = len(out.codes) - 1
+            break
+
+    if code is not None:
+        out.result = _ENFORCER.enforce(engine._snapshot(trust, mode_of(code), StepResult))
+    return out
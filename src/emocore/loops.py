@@ -0,0 +1,101 @@
+# emocore/loops.py
+"""
+PeriodDetector: long-horizon periodic loop detection over action IDs.
+
+What PeriodDetector does:
+- Watches a stream of (interned) action IDs and reports the period p of a
+  repeating action subsequence, e.g. search -> read -> summarize -> search
+  ... has period 3, however many steps the loop has been running
+- Keeps a polynomial rolling hash of the last `ngram` actions and, for each
+  n-gram hash, the step it was last seen at. The distance to the previous
+  occurrence is a candidate period; a candidate is confirmed once it has
+  held for p consecutive steps (the loop has repeated in full)
+- Runs in O(1) time per step and O(max_period + ngram) memory: n-gram
+  entries older than max_period steps are evicted as the window slides
+
+What PeriodDetector does NOT do:
+- Look at results or deltas (only the action sequence)
+- Report period-1 repetition by default (the extractor's action window
+  already covers an action repeated back to back)
+- Guarantee the fundamental period when an n-gram occurs twice inside one
+  cycle; a larger ngram makes that less likely
+
+Semantics (S-2, see SIGNAL_SPECIFICATION.md):
+    period == 0  -> no loop confirmed at this step
+    period == p  -> the last p + ngram actions repeat with period p
+"""
+from typing import Dict, List
+
+
+# Rolling hash parameters: Mersenne prime modulus, fixed base (deterministic)
+_MOD = (1 << 61) - 1
+_BASE = 1_000_003
+
+
+class PeriodDetector:
+    """Rolling n-gram hash loop detector for one action stream."""
+
+    __slots__ = ("max_period", "ngram", "min_period", "period", "steps",
+                 "_power", "_hash", "_actions", "_last_seen", "_hashes", "_lag", "_run")
+
+    def __init__(self, max_period: int = 256, ngram: int = 4, min_period: int = 2):
+        if ngram < 1 or max_period < 1:
+            raise ValueError("ngram and max_period must be positive")
+        self.max_period = max_period
+        self.ngram = ngram
+        self.min_period = min_period
+        self.period = 0
+        self.steps = 0
+        # BASE^(ngram-1): weight of the action leaving the n-gram
+        self._power = pow(_BASE, ngram - 1, _MOD)
+        self._hash = 0
+        self._actions: List[int] = [0] * ngram
+        self._last_seen: Dict[int, int] = {}
+        # Hash recorded at each of the last max_period steps (for eviction)
+        self._hashes: List[int] = [-1] * (max_period + 1)
+        self._lag = 0
+        self._run = 0
+
+    def push(self, action: int) -> int:
+        """Add the next action ID; return the confirmed period (0 if none)."""
+        slot = self.steps % self.ngram
+        # Roll: drop the oldest action, shift, add the new one (IDs offset by
+        # one so that action 0 still moves the hash)
+        h = ((self._hash - self._actions[slot] * self._power) * _BASE + action + 1) % _MOD
+        self._hash = h
+        self._actions[slot] = action + 1
+        self.steps = step = self.steps + 1
+        if step < self.ngram:
+            return 0  # First n-gram not complete yet
+
+        last_seen = self._last_seen
+        previous = last_seen.get(h)
+        lag = step - previous if previous is not None else 0
+
+        # Slide the window: forget the n-gram recorded max_period + 1 steps ago
+        ring = self._hashes
+        pos = step % len(ring)
+        old = ring[pos]
+        if old != -1 and last_seen.get(old) == step - len(ring):
+            del last_seen[old]
+        ring[pos] = h
+        last_seen[h] = step
+
+        if self.min_period <= lag <= self.max_period:
+            if lag == self._lag:
+                self._run += 1
+            else:
+                self._lag = lag
+                self._run = 1
+        else:
+            self._lag = 0
+            self._run = 0
+
+        self.period = self._lag if self._run >= self._lag > 0 else 0
+        return self.period
+
+    def reset(self) -> None:
+        self.__init__(self.max_period, self.ngram, self.min_period)
+
+    def __repr__(self) -> str:
+        return f"PeriodDetector(period={self.period}, steps={self.steps}, max_period={self.max_period})"
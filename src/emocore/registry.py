@@ -0,0 +1,214 @@
+# emocore/registry.py
+"""
+SessionRegistry: governed sessions keyed by ID (conversation, tenant).
+
+What SessionRegistry does:
+- Stripes sessions across `shards` independent shards, each with its own
+  lock and LRU-ordered table: threads looking up different sessions
+  mostly take different locks
+- Creates a session lazily on first get(key), from the registry's
+  profile (or a factory(key), e.g. one restoring persisted state).
+  Creation runs under the shard lock, so a key never gets two agents
+- Evicts idle sessions:
+  - TTL: a session not looked up for `ttl` seconds. Expired sessions at
+    the cold end of a shard are evicted whenever that shard is used, and
+    sweep() evicts them everywhere
+  - LRU: once a shard holds ceil(max_sessions / shards) sessions, adding
+    one evicts that shard's least recently used session
+- Calls on_evict(key, agent, reason) for every eviction (reason "ttl" or
+  "lru"), before the shard serves that key again: the callback can
+  persist agent.engine.checkpoint() and the factory restore it
+
+What SessionRegistry does NOT do:
+- Run a background thread: call sweep() periodically if sessions must
+  be evicted while their shard is idle
+- Keep a global LRU order: LRU is per shard (shards are filled evenly by
+  key hash, so the bound is approximate)
+- Lock the sessions it returns: pass thread_safe=True (or a factory
+  building thread-safe agents) if one session is used from several threads
+
+The eviction callback runs under its shard's lock: keep it short (or
+hand the state off), and do not use the registry from inside it.
+
+Usage:
+    registry = SessionRegistry(PROFILES[ProfileType.BALANCED], ttl=900.0,
+                               max_sessions=1_000_000, on_evict=persist)
+    result = registry.session(conversation_id).observe(observation)
+"""
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import Clock, MonotonicClock
+from emocore.profiles import Profile, PROFILES, ProfileType
+from emocore.session import GovernedSession
+
+EvictionCallback = Callable[[Hashable, EmoCoreAgent, str], None]
+
+# Eviction reasons passed to on_evict
+TTL = "ttl"
+LRU = "lru"
+
+
+class _Entry:
+    __slots__ = ("agent", "stamp")
+
+    def __init__(self, agent: EmoCoreAgent, stamp: float):
+        self.agent = agent
+        self.stamp = stamp  # Last lookup, on the registry's clock
+
+
+class _Shard:
+    __slots__ = ("lock", "entries", "evictions")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()  # Coldest first
+        self.evictions = {TTL: 0, LRU: 0}
+
+
+class SessionRegistry:
+    """
+    Sharded, lazily populated map of key -> EmoCoreAgent with TTL / LRU eviction.
+
+    Args:
+        profile: Profile of sessions created by the default factory.
+        shards: Number of lock shards.
+        ttl: Idle seconds before a session is evicted (None: never).
+        max_sessions: Approximate capacity, enforced per shard (None: unbounded).
+        on_evict: Called as on_evict(key, agent, reason) for each eviction.
+        factory: Called as factory(key) to create a session (default:
+                 EmoCoreAgent(profile, thread_safe=thread_safe)).
+        clock: Time source for TTL (MonotonicClock by default).
+        thread_safe: Passed to the agents the default factory creates.
+    """
+
+    def __init__(
+        self,
+        profile: Profile = PROFILES[ProfileType.BALANCED],
+        shards: int = 64,
+        ttl: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        on_evict: Optional[EvictionCallback] = None,
+        factory: Optional[Callable[[Hashable], EmoCoreAgent]] = None,
+        clock: Optional[Clock] = None,
+        thread_safe: bool = False,
+    ):
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        if ttl is not None and ttl <= 0.0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError(f"max_sessions must be >= 1, got {max_sessions}")
+        self.profile = profile
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.on_evict = on_evict
+        self.clock = clock if clock is not None else MonotonicClock()
+        if factory is None:
+            factory = lambda key: EmoCoreAgent(profile, thread_safe=thread_safe)
+        self._factory = factory
+        self._shards = [_Shard() for _ in range(shards)]
+        self._shard_capacity = None if max_sessions is None else math.ceil(max_sessions / shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    @property
+    def evictions(self) -> dict:
+        """Evictions so far, by reason."""
+        return {reason: sum(shard.evictions[reason] for shard in self._shards) for reason in (TTL, LRU)}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._shard(key).entries
+
+    # --------------------------------------------------
+    # Lookup
+    # --------------------------------------------------
+
+    def get(self, key: Hashable) -> EmoCoreAgent:
+        """The session for `key`, created if absent (or expired)."""
+        shard = self._shard(key)
+        ttl = self.ttl
+        with shard.lock:
+            now = self.clock.now()  # Under the lock: stamps stay ordered within a shard
+            entries = shard.entries
+            entry = entries.get(key)
+            if entry is not None:
+                if ttl is None or now - entry.stamp <= ttl:
+                    entry.stamp = now
+                    entries.move_to_end(key)
+                    return entry.agent
+                del entries[key]
+                self._evicted(shard, key, entry.agent, TTL)
+            if ttl is not None:
+                self._expire(shard, now)
+            capacity = self._shard_capacity
+            if capacity is not None:
+                while len(entries) >= capacity:
+                    cold, entry = entries.popitem(last=False)
+                    self._evicted(shard, cold, entry.agent, LRU)
+            agent = self._factory(key)
+            entries[key] = _Entry(agent, now)
+            return agent
+
+    def session(self, key: Hashable) -> GovernedSession:
+        """GovernedSession over get(key) (cached on the agent)."""
+        return GovernedSession.of(self.get(key))
+
+    def peek(self, key: Hashable) -> Optional[EmoCoreAgent]:
+        """The session for `key` if registered; neither creates nor refreshes it."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            return None if entry is None else entry.agent
+
+    def remove(self, key: Hashable) -> Optional[EmoCoreAgent]:
+        """Unregister `key` without calling on_evict. Returns its session, if any."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.pop(key, None)
+            return None if entry is None else entry.agent
+
+    # --------------------------------------------------
+    # Eviction
+    # --------------------------------------------------
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Evict every session idle for longer than ttl. Returns the count."""
+        if self.ttl is None:
+            return 0
+        if now is None:
+            now = self.clock.now()
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                evicted += self._expire(shard, now)
+        return evicted
+
+    def _expire(self, shard: _Shard, now: float) -> int:
+        # Caller holds the shard lock. Entries are in lookup order: stop at the first live one
+        entries = shard.entries
+        deadline = now - self.ttl
+        evicted = 0
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if entry.stamp >= deadline:
+                break
+            del entries[key]
+            self._evicted(shard, key, entry.agent, TTL)
+            evicted += 1
+        return evicted
+
+    def _evicted(self, shard: _Shard, key: Hashable, agent: EmoCoreAgent, reason: str) -> None:
+        shard.evictions[reason] += 1
+        if self.on_evict is not None:
+            self.on_evict(key, agent, reason)
+
+    def _shard(self, key: Hashable) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __repr__(self) -> str:
+        return f"SessionRegistry(sessions={len(self)}, shards={len(self._shards)}, ttl={self.ttl})"
@@ -2,25 +2,325 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, fields, FrozenInstanceError
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
 
 from emocore.behavior import BehaviorBudget
+from emocore.decision import mode_of, failure_of
 from emocore.failures import FailureType
 from emocore.modes import Mode
+from emocore.state import PressureState
 
+if TYPE_CHECKING:
+    from emocore.guarantees import StepResult
 
-@dataclass(frozen=True)
-class EngineResult:
+
+PRESSURE_AXES = ("confidence", "frustration", "curiosity", "arousal", "risk")
+
+
+class LazyPressureResult(ABC):
+    """
+    Base for frozen, slotted dataclass results whose pressure views are
+    built on access.
+
+    The engine hands over the raw pressure tuple (and trust) through lazy();
+    the `state` and `pressure_log` fields are materialized the first time
+    they are read and cached in their slots. Results built with explicit
+    `state` / `pressure_log` values are plain frozen dataclasses.
+
+    Subclasses are declared as @lazy_views @dataclass(frozen=True, slots=True)
+    with `state` and `pressure_log` fields, so is_dataclass(), fields(),
+    asdict() and replace() work as on any frozen dataclass.
+    """
+
+    __slots__ = ("_pressure", "_trust")
+
+    def __post_init__(self):
+        _set = object.__setattr__
+        _set(self, "_pressure", None)
+        _set(self, "_trust", None)
+
+    @classmethod
+    def lazy(
+        cls,
+        pressure: Tuple[float, float, float, float, float],
+        trust: Optional[float],
+        budget: BehaviorBudget,
+        halted: bool,
+        failure: FailureType,
+        reason: Optional[str],
+        mode: Mode,
+    ):
+        """
+        Build a result from a raw pressure tuple without materializing views.
+
+        trust=None means the result carries no pressure_log.
+        """
+        self = cls.__new__(cls)
+        _set = object.__setattr__
+        _set(self, "budget", budget)
+        _set(self, "halted", halted)
+        _set(self, "failure", failure)
+        _set(self, "reason", reason)
+        _set(self, "mode", mode)
+        _set(self, "_pressure", pressure)
+        _set(self, "_trust", trust)
+        state_slot, log_slot = cls._views
+        state_slot.__set__(self, None)
+        log_slot.__set__(self, None)
+        self._init_extra()
+        return self
+
+    def _init_extra(self) -> None:
+        """Hook for subclasses with additional fields."""
+        pass
+
+    @abstractmethod
+    def _make_state(self, pressure):
+        """The `state` view for a raw pressure tuple."""
+        pass
+
+    def _replace(self, **changes):
+        """dataclasses.replace() that leaves unread views lazy."""
+        cls = self.__class__
+        other = cls.__new__(cls)
+        for name, slot in cls._slots.items():
+            slot.__set__(other, changes[name] if name in changes else slot.__get__(self))
+        return other
+
+    def __setstate__(self, state):
+        # Pickles carry the materialized fields only
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        LazyPressureResult.__post_init__(self)
+
+    # Replace the generated frozen __setattr__ / __delattr__, which fail with
+    # TypeError for non-field names on slotted classes before Python 3.12
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+
+def lazy_views(cls):
+    """
+    Class decorator for LazyPressureResult dataclasses: turns the `state`
+    and `pressure_log` slots into views built from the raw pressure on
+    first read. Apply on top of @dataclass(frozen=True, slots=True).
+    """
+    state_slot = cls.__dict__["state"]
+    log_slot = cls.__dict__["pressure_log"]
+
+    def state(self):
+        value = state_slot.__get__(self)
+        if value is None and self._pressure is not None:
+            value = self._make_state(self._pressure)
+            state_slot.__set__(self, value)
+        return value
+
+    def pressure_log(self) -> Optional[Dict[str, float]]:
+        value = log_slot.__get__(self)
+        if value is None and self._trust is not None:
+            value = dict(zip(PRESSURE_AXES, self._pressure))
+            value["trust"] = self._trust  # First-class observability
+            log_slot.__set__(self, value)
+        return value
+
+    slots = {}
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            slots[name] = klass.__dict__[name]
+    cls._slots = slots
+    cls._views = (state_slot, log_slot)
+    cls.state = property(state, state_slot.__set__)
+    cls.pressure_log = property(pressure_log, log_slot.__set__)
+    cls.__setstate__ = LazyPressureResult.__setstate__
+    cls.__setattr__ = LazyPressureResult.__setattr__
+    cls.__delattr__ = LazyPressureResult.__delattr__
+    return cls
+
+
+@lazy_views
+@dataclass(frozen=True, slots=True)
+class EngineResult(LazyPressureResult):
     """
     Immutable result of a single EmoEngine step.
     This is the ONLY thing allowed to cross engine boundaries.
+
+    state is a PressureState and pressure_log a dict snapshot of the current
+    pressure values (plus trust); both are built on first access.
     """
 
-    state: Optional[object]
+    state: Optional[PressureState]
     budget: BehaviorBudget
     halted: bool
     failure: FailureType
     reason: Optional[str]
     mode: Mode
     pressure_log: Optional[Dict[str, float]] = None  # Snapshot of current pressure values
+
+    def _make_state(self, pressure):
+        return PressureState(*pressure)
+
+
+class StepView:
+    """
+    Reusable, mutable view of the latest EmoEngine.step_view() call.
+
+    What StepView does:
+    - Exposes the step outcome as plain attributes (budget floats, halted,
+      failure, reason, mode, step_count) without allocating anything
+    - Builds budget / state / pressure_log objects only when they are read
+
+    What StepView does NOT do:
+    - Stay valid across steps: each engine owns ONE view and overwrites it
+      on every step_view() call. Call freeze() to keep a result.
+    """
+
+    __slots__ = ("effort", "risk", "exploration", "persistence",
+                 "halted", "failure", "reason", "mode", "step_count",
+                 "_confidence", "_frustration", "_curiosity", "_arousal", "_risk",
+                 "_trust")
+
+    def __init__(self):
+        self.effort = 1.0
+        self.risk = 0.0
+        self.exploration = 0.0
+        self.persistence = 1.0
+        self.halted = False
+        self.failure = FailureType.NONE
+        self.reason = None
+        self.mode = Mode.IDLE
+        self.step_count = 0
+        self._confidence = 0.0
+        self._frustration = 0.0
+        self._curiosity = 0.0
+        self._arousal = 0.0
+        self._risk = 0.0
+        self._trust = None
+
+    @property
+    def budget(self) -> BehaviorBudget:
+        return BehaviorBudget(
+            effort=self.effort,
+            risk=self.risk,
+            persistence=self.persistence,
+            exploration=self.exploration,
+        )
+
+    @property
+    def state(self) -> PressureState:
+        return PressureState(
+            self._confidence, self._frustration, self._curiosity, self._arousal, self._risk
+        )
+
+    @property
+    def pressure_log(self) -> Optional[Dict[str, float]]:
+        if self._trust is None:
+            return None
+        log = dict(zip(PRESSURE_AXES, (
+            self._confidence, self._frustration, self._curiosity, self._arousal, self._risk
+        )))
+        log["trust"] = self._trust
+        return log
+
+    def freeze(self) -> EngineResult:
+        """Immutable EngineResult equal to what step() would have returned."""
+        return EngineResult.lazy(
+            (self._confidence, self._frustration, self._curiosity, self._arousal, self._risk),
+            self._trust,
+            self.budget,
+            self.halted,
+            self.failure,
+            self.reason,
+            self.mode,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"StepView(step_count={self.step_count}, effort={self.effort!r}, "
+            f"risk={self.risk!r}, exploration={self.exploration!r}, "
+            f"persistence={self.persistence!r}, halted={self.halted}, mode={self.mode})"
+        )
+
+
+@dataclass(frozen=True)
+class AdvanceResult:
+    """
+    Result of EmoEngine.advance(): n steps under constant signals.
+
+    result is what the last executed step returned. steps counts the steps
+    that actually evolved the engine (fewer than requested if it halted).
+    halt_step is the engine step_count at which HALT happened during this
+    call, or None if the engine did not halt.
+    """
+
+    result: EngineResult
+    steps: int
+    halt_step: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class StreamSummary:
+    """
+    Result of interface.step_many(..., summary=True).
+
+    result is the StepResult of the last consumed element (None if nothing
+    was consumed). steps counts consumed elements. halt_index is the
+    0-based index of the element whose step halted the session, or None.
+    """
+
+    result: Optional["StepResult"]
+    steps: int
+    halt_index: Optional[int] = None
+
+
+class StepTable:
+    """
+    Compact per-row results of interface.observe_batch(..., table=True).
+
+    Columns are stdlib arrays (one entry per processed row), so a table of
+    millions of rows costs a few bytes per row and converts to NumPy
+    without copying (numpy.asarray(table.effort)).
+
+    Columns:
+    - codes: decision codes (see emocore.decision)
+    - effort, risk, exploration, persistence: budget after guarantees
+
+    result is the full StepResult of the last processed row (None if no
+    row was processed); halt_index is the row that halted the session.
+    """
+
+    __slots__ = ("codes", "effort", "risk", "exploration", "persistence", "result", "halt_index")
+
+    def __init__(self):
+        self.codes = array("b")
+        self.effort = array("d")
+        self.risk = array("d")
+        self.exploration = array("d")
+        self.persistence = array("d")
+        self.result: Optional["StepResult"] = None
+        self.halt_index: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def mode(self, row: int) -> Mode:
+        return mode_of(self.codes[row])
+
+    def failure(self, row: int) -> FailureType:
+        return failure_of(self.codes[row])
+
+    def budget(self, row: int) -> BehaviorBudget:
+        return BehaviorBudget(
+            effort=self.effort[row],
+            risk=self.risk[row],
+            persistence=self.persistence[row],
+            exploration=self.exploration[row],
+        )
+
+    def __repr__(self) -> str:
+        return f"StepTable(rows={len(self)}, halt_index={self.halt_index})"
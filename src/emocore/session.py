@@ -0,0 +1,248 @@
+# emocore/session.py
+"""
+GovernedSession: one governed agent loop as a single object.
+
+What GovernedSession does:
+- Owns the three stages of the observe() pipeline: a SignalExtractor
+  (default RuleBasedExtractor), a SignalValidator and an EmoEngine (through
+  an EmoCoreAgent)
+- Resolves the wiring once: the stage methods are bound at construction,
+  so observe() is a straight call chain with no lookups or defaults
+- Passes raw (reward, novelty, urgency, difficulty, trust) floats between
+  the stages; no Signals object is built unless a forecast needs one
+
+What GovernedSession does NOT do:
+- Change results: observe() returns exactly what interface.observe()
+  returns for the same extractor, validator and agent
+- Share stage state across sessions (each session owns its extractor
+  history, validator history and engine)
+
+Sessions over an existing agent:
+    GovernedSession.of(agent) reuses the agent's own extractor / validator
+    (the ones interface.observe() keeps on the agent) and is cached on the
+    agent, so observe(), observe_batch(), the adapters and the session all
+    advance the same pipeline state.
+
+Usage:
+    session = GovernedSession(PROFILES[ProfileType.BALANCED])
+    result = session.observe(observation)
+    if result.halted:
+        ...
+"""
+import copy
+from typing import Callable, Optional, Tuple
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import Clock
+from emocore.decision import mode_of
+from emocore.extractor import SignalExtractor, RuleBasedExtractor
+from emocore.guarantees import GuaranteeEnforcer, StepResult
+from emocore.horizon import HorizonForecast
+from emocore.observation import Observation
+from emocore.profiles import Profile, PROFILES, ProfileType
+from emocore.signals import Signals
+from emocore.validator import SignalValidator
+
+Values = Tuple[float, float, float, float, float]
+
+# Stateless: one instance serves every session
+_ENFORCER = GuaranteeEnforcer()
+
+
+def _values(signals: Signals) -> Values:
+    return signals.reward, signals.novelty, signals.urgency, signals.difficulty, signals.trust
+
+
+def _raw_method(obj, name: str, raw_name: str) -> Optional[Callable]:
+    """
+    obj's raw-float method, or None when the most derived class that defines
+    either method only defines the Signals one (a subclass overriding extract()
+    or validate() must keep being honored).
+    """
+    for klass in type(obj).__mro__:
+        attrs = vars(klass)
+        if raw_name in attrs:
+            return getattr(obj, raw_name)
+        if name in attrs:
+            return None
+    return None
+
+
+def extract_values_of(extractor: SignalExtractor) -> Callable[[Observation], Values]:
+    """Observation -> raw signal tuple, for any extractor."""
+    raw = _raw_method(extractor, "extract", "extract_values")
+    if raw is not None:
+        return raw
+    extract = extractor.extract
+    return lambda observation: _values(extract(observation))
+
+
+def validate_values_of(validator: SignalValidator) -> Callable[..., Values]:
+    """Raw signal floats -> validated raw tuple, for any validator."""
+    raw = _raw_method(validator, "validate", "validate_values")
+    if raw is not None:
+        return raw
+    validate = validator.validate
+
+    def validate_values(reward, novelty, urgency, difficulty=0.0, trust=1.0):
+        return _values(validate(Signals(reward, novelty, urgency, difficulty, trust)))
+
+    return validate_values
+
+
+class GovernedSession:
+    """
+    Extractor -> Validator -> Engine, fused into one observe() call.
+
+    Construct a fresh session from a profile, or wrap an existing agent
+    with GovernedSession.of(agent).
+    """
+
+    def __init__(
+        self,
+        profile: Profile = PROFILES[ProfileType.BALANCED],
+        extractor: Optional[SignalExtractor] = None,
+        validator: Optional[SignalValidator] = None,
+        clock: Optional[Clock] = None,
+        forecast: bool = False,
+        compiled: bool = False,
+        thread_safe: bool = False,
+    ):
+        agent = EmoCoreAgent(profile, clock=clock, forecast=forecast, compiled=compiled,
+                             thread_safe=thread_safe)
+        agent._extractor = RuleBasedExtractor() if extractor is None else extractor
+        agent._validator = SignalValidator(strict=False) if validator is None else validator
+        self._bind(agent, agent._extractor, agent._validator)
+        agent._session = self
+
+    @classmethod
+    def of(
+        cls,
+        agent: EmoCoreAgent,
+        extractor: Optional[SignalExtractor] = None,
+        validator: Optional[SignalValidator] = None,
+        default_extractor: Callable[[], SignalExtractor] = RuleBasedExtractor,
+    ) -> "GovernedSession":
+        """
+        Session over `agent`.
+
+        Missing stages are the agent's own extractor / validator, created on
+        first use (default_extractor() / SignalValidator(strict=False)) and
+        kept on the agent, as interface.observe() does. A session using only
+        agent-owned stages is cached on the agent; explicit stages give a
+        one-off session that still steps the agent's engine.
+        """
+        with agent.lock:
+            return cls._of(agent, extractor, validator, default_extractor)
+
+    @classmethod
+    def _of(cls, agent, extractor, validator, default_extractor) -> "GovernedSession":
+        if extractor is None:
+            if not hasattr(agent, '_extractor'):
+                agent._extractor = default_extractor()
+            extractor = agent._extractor
+        if validator is None:
+            if not hasattr(agent, '_validator'):
+                agent._validator = SignalValidator(strict=False)
+            validator = agent._validator
+
+        session = getattr(agent, '_session', None)
+        if session is not None and session.extractor is extractor and session.validator is validator:
+            return session
+
+        session = cls.__new__(cls)
+        session._bind(agent, extractor, validator)
+        if (extractor is getattr(agent, '_extractor', None)
+                and validator is getattr(agent, '_validator', None)):
+            agent._session = session
+        return session
+
+    def _bind(self, agent: EmoCoreAgent, extractor: SignalExtractor, validator: SignalValidator) -> None:
+        self.agent = agent
+        self.engine = agent.engine
+        self.extractor = extractor
+        self.validator = validator
+        # Hot path, resolved once
+        self._extract = extract_values_of(extractor)
+        self._validate = validate_values_of(validator)
+        self._step_decision = self.engine.step_decision
+        self._snapshot = self.engine._snapshot
+        self._thread_safe = agent.thread_safe
+
+    # --------------------------------------------------
+    # Hot path
+    # --------------------------------------------------
+
+    def observe(
+        self,
+        observation: Observation,
+        dt: Optional[float] = None,
+        forecast: Optional[bool] = None,
+    ) -> StepResult:
+        """
+        Extract, validate and govern one observation.
+
+        dt is passed through to the engine's Clock; forecast attaches a lazy
+        HorizonForecast (defaults to the agent's `forecast` setting).
+        """
+        if self._thread_safe:
+            with self.agent.lock:
+                return self._observe(observation, dt, forecast)
+        return self._observe(observation, dt, forecast)
+
+    def _observe(self, observation, dt, forecast) -> StepResult:
+        reward, novelty, urgency, difficulty, trust = self._validate(*self._extract(observation))
+        code = self._step_decision(reward, novelty, urgency, difficulty, trust, dt)
+        result = self._snapshot(trust, mode_of(code), StepResult)
+        if self.agent.forecast if forecast is None else forecast:
+            result = result._replace(horizon=HorizonForecast(
+                self.engine, Signals(reward, novelty, urgency, difficulty, trust),
+            ))
+        return _ENFORCER.enforce(result)
+
+    def observe_decision(self, observation: Observation, dt: Optional[float] = None) -> int:
+        """observe() returning only the decision code (see emocore.decision)."""
+        if self._thread_safe:
+            with self.agent.lock:
+                return self._step_decision(*self._validate(*self._extract(observation)), dt)
+        return self._step_decision(*self._validate(*self._extract(observation)), dt)
+
+    def probe(self, observation: Observation, dt: Optional[float] = None) -> int:
+        """
+        Decision code observe() WOULD return for `observation`, without
+        changing the session: the step runs on copies of the extractor and
+        validator and on a fork of the engine (with a copy of its clock).
+        """
+        engine = self.engine
+        with self.agent.lock:
+            fork = engine.fork(engine.checkpoint(), clock=copy.copy(engine.clock))
+            extract = extract_values_of(copy.deepcopy(self.extractor))
+            validate = validate_values_of(copy.deepcopy(self.validator))
+        return fork.step_decision(*validate(*extract(observation)), dt)
+
+    # --------------------------------------------------
+    # Session state
+    # --------------------------------------------------
+
+    @property
+    def halted(self) -> bool:
+        return self.engine.halted
+
+    @property
+    def step_count(self) -> int:
+        return self.engine.step_count
+
+    def current_budget(self):
+        """Budget of the latest step (zeroed after HALT)."""
+        return self.agent.current_budget()
+
+    def reset(self, reason: str) -> None:
+        """Reset the engine from a HALTED state. See EmoEngine.reset for semantics."""
+        self.agent.reset(reason)
+
+    def __repr__(self) -> str:
+        return (
+            f"GovernedSession(profile={self.engine.profile.name!r}, "
+            f"extractor={type(self.extractor).__name__}, steps={self.step_count}, "
+            f"halted={self.halted})"
+        )
@@ -0,0 +1,395 @@
+# emocore/shared_fleet.py
+"""
+Multi-process fleet governance over shared-memory state.
+
+What this module provides:
+- SharedFleet: the state of N sessions in one multiprocessing.shared_memory
+  block, one fixed-size record per session (RECORD), plus an (N, 5)
+  signal table. Any process can attach by name and read budgets, modes
+  and halt flags in place, with no copy or RPC
+- FleetGovernor: splits the sessions into contiguous shards and starts
+  one worker process per shard. Each worker runs the EmoFleet step on its
+  own slice of the shared records (EmoFleet.over), so shards step in
+  parallel without sharing a GIL
+
+Semantics:
+- One writer per shard: only the worker that owns a shard writes its
+  records. Other processes write only the signal table and halt requests
+- Halts are terminal. request_halt() sets the session's halt_request
+  byte, which is only ever set, never cleared. The owning worker folds
+  requests into `halted` (FailureType.EXTERNAL) at its next step. Readers
+  should use is_halted(), which counts a request as a halt at once
+- Each step is bracketed by the shard's sequence counter (odd while it is
+  being written). snapshot() and budget() retry until they read a session
+  between steps, so a budget never mixes two steps. The raw views
+  (`records`, `budgets`...) are zero-copy but may be read mid-step
+
+What this module does NOT do:
+- Build StepResults, or extract / validate signals: producers write
+  (reward, novelty, urgency, difficulty, dt) rows into `signals`
+- Reset sessions: HALTED stays HALTED for the fleet's lifetime
+- Guarantee cross-field consistency on weakly ordered CPUs. The sequence
+  counter relies on stores becoming visible in program order (x86-64)
+
+Requires NumPy (the "fleet" extra).
+
+Usage:
+    with FleetGovernor(PROFILES[ProfileType.BALANCED], size=200_000, workers=8) as governor:
+        governor.step(reward, novelty, urgency, difficulty, dt=0.1)
+        halted = governor.fleet.is_halted(session)
+
+    # Any other process on the host:
+    fleet = SharedFleet.attach(name)
+    fleet.budget(session)
+"""
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from emocore.behavior import BehaviorBudget, ZERO_BUDGET
+from emocore.failures import FailureType
+from emocore.fleet import EmoFleet, FAILURE_REASONS, EFFORT, RISK, EXPLORATION, PERSISTENCE
+from emocore.modes import Mode
+from emocore.profiles import Profile
+
+# One session's record (EmoFleet state plus its halt request), 8-byte aligned
+RECORD = np.dtype([
+    ("pressure", np.float64, (5,)),
+    ("budget", np.float64, (4,)),
+    ("previous_budget", np.float64, (4,)),
+    ("stable_budget", np.float64, (4,)),
+    ("previous_risk", np.float64),
+    ("step_count", np.int64),
+    ("no_progress_steps", np.int64),
+    ("halted", np.bool_),
+    ("failure", np.int8),
+    ("mode", np.int8),
+    ("halt_request", np.bool_),
+], align=True)
+
+# Signal table columns
+REWARD, NOVELTY, URGENCY, DIFFICULTY, DT = 0, 1, 2, 3, 4
+
+_HEADER = np.dtype([("magic", "S8"), ("size", np.int64), ("shards", np.int64), ("record_size", np.int64)])
+_MAGIC = b"EMOFLEET"
+_ALIGN = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _layout(size: int, shards: int) -> Tuple[int, int, int, int]:
+    """Offsets of the sequence counters, records and signals, and the total size."""
+    seq = _aligned(_HEADER.itemsize)
+    records = _aligned(seq + 8 * shards)
+    signals = _aligned(records + RECORD.itemsize * size)
+    return seq, records, signals, signals + 8 * 5 * size
+
+
+class SharedFleet:
+    """
+    Fleet state in shared memory: N records, N signal rows, one sequence
+    counter per shard.
+
+    Create with SharedFleet.create(); attach from other processes with
+    SharedFleet.attach(name). Every process calls close(); the creator
+    also calls unlink() once every process is done.
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        header = np.ndarray((), dtype=_HEADER, buffer=shm.buf)
+        if bytes(header["magic"]) != _MAGIC or int(header["record_size"]) != RECORD.itemsize:
+            raise ValueError(f"{shm.name!r} is not an emocore shared fleet of this version")
+        self.size = int(header["size"])
+        self.shards = int(header["shards"])
+        seq, records, signals, _ = _layout(self.size, self.shards)
+        self._seq = np.ndarray((self.shards,), dtype=np.int64, buffer=shm.buf, offset=seq)
+        self.records = np.ndarray((self.size,), dtype=RECORD, buffer=shm.buf, offset=records)
+        self.signals = np.ndarray((self.size, 5), dtype=np.float64, buffer=shm.buf, offset=signals)
+
+    @classmethod
+    def create(cls, size: int, shards: int = 1, name: Optional[str] = None) -> "SharedFleet":
+        """Allocate a fleet of `size` fresh sessions split into `shards` shards."""
+        if size < 1 or not 1 <= shards <= size:
+            raise ValueError(f"need size >= 1 and 1 <= shards <= size, got {size}, {shards}")
+        shm = SharedMemory(name=name, create=True, size=_layout(size, shards)[3])
+        header = np.ndarray((), dtype=_HEADER, buffer=shm.buf)
+        header["magic"], header["size"], header["shards"], header["record_size"] = (
+            _MAGIC, size, shards, RECORD.itemsize,
+        )
+        fleet = cls(shm, owner=True)
+        fleet._seq[:] = 0
+        records = fleet.records
+        records[:] = np.zeros((), dtype=RECORD)
+        fresh = np.array([1.0, 0.0, 0.0, 1.0])  # Same start as EmoFleet / EmoEngine
+        records["budget"] = records["previous_budget"] = records["stable_budget"] = fresh
+        records["failure"] = FailureType.NONE.value
+        records["mode"] = Mode.IDLE.value
+        fleet.signals[:] = 0.0
+        fleet.signals[:, DT] = 1.0
+        return fleet
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFleet":
+        """Map an existing fleet (any process on the host)."""
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=name, track=False)
+        else:
+            shm = SharedMemory(name=name)
+            if multiprocessing.parent_process() is None:
+                # An unrelated process's tracker would unlink the block at its exit.
+                # Children share their parent's tracker, where the name is already known
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return self.size
+
+    # --------------------------------------------------
+    # Shards
+    # --------------------------------------------------
+
+    def bounds(self, shard: int) -> Tuple[int, int]:
+        """[start, stop) session range of a shard."""
+        return shard * self.size // self.shards, (shard + 1) * self.size // self.shards
+
+    def shard_of(self, session: int) -> int:
+        return ((session + 1) * self.shards - 1) // self.size
+
+    # --------------------------------------------------
+    # Zero-copy views (may be read mid-step)
+    # --------------------------------------------------
+
+    @property
+    def budgets(self) -> np.ndarray:
+        """(N, 4) last budgets, not zeroed for halted sessions."""
+        return self.records["budget"]
+
+    @property
+    def halted(self) -> np.ndarray:
+        """(N,) halts applied by the owning workers (see is_halted())."""
+        return self.records["halted"]
+
+    @property
+    def halt_requests(self) -> np.ndarray:
+        return self.records["halt_request"]
+
+    # --------------------------------------------------
+    # Per-session reads and halt requests
+    # --------------------------------------------------
+
+    def is_halted(self, session: int) -> bool:
+        """True once the session halted or a halt was requested; never reverts."""
+        record = self.records[session]
+        return bool(record["halt_request"] or record["halted"])
+
+    def request_halt(self, session: int) -> None:
+        """Halt a session (any process; applied at its shard's next step)."""
+        self.records["halt_request"][session] = True
+
+    def snapshot(self, session: int) -> np.void:
+        """Copy of one session's record, taken between two steps of its shard."""
+        seq = self._seq
+        shard = self.shard_of(session)
+        while True:
+            before = int(seq[shard])
+            if before & 1:
+                time.sleep(0)  # Its shard is stepping
+                continue
+            record = self.records[session].copy()
+            if int(seq[shard]) == before:
+                return record
+
+    def budget(self, session: int) -> BehaviorBudget:
+        """BehaviorBudget of one session, zeroed if it is halted."""
+        record = self.snapshot(session)
+        if record["halted"] or record["halt_request"]:
+            return ZERO_BUDGET
+        b = record["budget"]
+        return BehaviorBudget(
+            effort=float(b[EFFORT]),
+            risk=float(b[RISK]),
+            persistence=float(b[PERSISTENCE]),
+            exploration=float(b[EXPLORATION]),
+        )
+
+    def mode(self, session: int) -> Mode:
+        return Mode.HALTED if self.is_halted(session) else Mode(int(self.records["mode"][session]))
+
+    def failure(self, session: int) -> FailureType:
+        record = self.snapshot(session)
+        if record["halt_request"] and not record["halted"]:
+            return FailureType.EXTERNAL  # Requested, not yet applied
+        return FailureType(int(record["failure"]))
+
+    def reason(self, session: int) -> Optional[str]:
+        record = self.snapshot(session)
+        if record["halt_request"] and int(record["failure"]) in (FailureType.NONE.value, FailureType.EXTERNAL.value):
+            return "halt_requested"
+        return FAILURE_REASONS.get(FailureType(int(record["failure"])))
+
+    # --------------------------------------------------
+    # Lifetime
+    # --------------------------------------------------
+
+    def close(self) -> None:
+        # Views must go before the mapping can be closed
+        self._seq = self.records = self.signals = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+def _step_shard(fleet: SharedFleet, shard: int, engine: EmoFleet, start: int, stop: int) -> None:
+    """Fold halt requests, then step the shard (its sequence counter is odd meanwhile)."""
+    seq = fleet._seq
+    seq[shard] += 1
+    try:
+        records = fleet.records[start:stop]
+        requested = records["halt_request"] & ~records["halted"]
+        if requested.any():
+            records["halted"][requested] = True
+            records["failure"][requested] = FailureType.EXTERNAL.value
+            records["mode"][requested] = Mode.HALTED.value
+        signals = fleet.signals[start:stop]
+        engine._advance(signals[:, REWARD], signals[:, NOVELTY], signals[:, URGENCY],
+                        signals[:, DIFFICULTY], signals[:, DT])
+    finally:
+        seq[shard] += 1
+
+
+def _worker(name: str, shard: int, profiles, conn) -> None:
+    fleet = SharedFleet.attach(name)
+    start, stop = fleet.bounds(shard)
+    engine = EmoFleet.over(profiles, fleet.records[start:stop])
+    try:
+        while conn.recv():
+            try:
+                _step_shard(fleet, shard, engine, start, stop)
+            except Exception as e:  # Reported to the governor's step()
+                conn.send(e)
+            else:
+                conn.send(None)
+    finally:
+        del engine
+        fleet.close()
+        conn.close()
+
+
+class FleetGovernor:
+    """
+    Steps a SharedFleet with one worker process per shard.
+
+    Args:
+        profiles: One shared Profile, or one per session.
+        size: Number of sessions (required with a single profile).
+        workers: Worker processes, one shard each (default: os.cpu_count()).
+        name: Shared memory block name (default: generated).
+        mp_context: multiprocessing context used to start the workers.
+    """
+
+    def __init__(
+        self,
+        profiles: Union[Profile, Sequence[Profile]],
+        size: Optional[int] = None,
+        workers: Optional[int] = None,
+        name: Optional[str] = None,
+        mp_context=None,
+    ):
+        if isinstance(profiles, Profile):
+            if size is None:
+                raise ValueError("size is required when a single profile is shared")
+        else:
+            profiles = list(profiles)
+            if size is not None and size != len(profiles):
+                raise ValueError(f"Expected {size} profiles, got {len(profiles)}")
+            size = len(profiles)
+        workers = min(workers or os.cpu_count() or 1, size)
+        self.fleet = SharedFleet.create(size, shards=workers, name=name)
+        context = mp_context if mp_context is not None else multiprocessing.get_context()
+        self._connections = []
+        self._processes = []
+        try:
+            for shard in range(workers):
+                start, stop = self.fleet.bounds(shard)
+                shard_profiles = profiles if isinstance(profiles, Profile) else profiles[start:stop]
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=_worker, args=(self.fleet.name, shard, shard_profiles, child),
+                    name=f"emocore-fleet-{shard}", daemon=True,
+                )
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def workers(self) -> int:
+        return len(self._processes)
+
+    def step(self, reward=None, novelty=None, urgency=None, difficulty=None, dt=None) -> None:
+        """
+        Advance every live session by one step, all shards in parallel.
+
+        Each argument is a scalar or (N,) array written into the signal
+        table first; None keeps the column as producers left it.
+        """
+        signals = self.fleet.signals
+        for column, value in ((REWARD, reward), (NOVELTY, novelty), (URGENCY, urgency),
+                              (DIFFICULTY, difficulty), (DT, dt)):
+            if value is not None:
+                signals[:, column] = value
+        for conn in self._connections:
+            conn.send(True)
+        errors = [conn.recv() for conn in self._connections]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def halt(self, session: int) -> None:
+        self.fleet.request_halt(session)
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory."""
+        for conn in self._connections:
+            try:
+                conn.send(False)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+        self._processes = []
+        if self.fleet.records is not None:
+            try:
+                self.fleet.close()
+            except BufferError:
+                pass  # Views still held by the caller keep the mapping alive
+            self.fleet.unlink()
+
+    def __enter__(self) -> "FleetGovernor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
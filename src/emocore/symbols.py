@@ -0,0 +1,124 @@
+# emocore/symbols.py
+"""
+Symbol interning and windowed history for the extractors.
+
+What this module provides:
+- SymbolTable: interns action strings (any hashable) to small, dense
+  integer IDs. One shared table (ACTIONS) serves every extractor by
+  default, so an action costs one dict lookup and a small int thereafter
+- CountedWindow: the last `maxlen` items as a ring buffer plus a counted
+  multiset. append() and `in` are O(1) whatever the window length, so
+  history windows can hold thousands of entries at no per-step cost
+
+What this module does NOT do:
+- Forget symbols: a table grows with the number of DISTINCT actions seen
+  (not with steps). Give an extractor its own table to scope that growth
+- Change extraction semantics: a CountedWindow answers membership exactly
+  like a deque(maxlen=...) scan over the same items
+"""
+import threading
+from typing import Dict, Hashable, Iterator, List, Optional
+
+
+class SymbolTable:
+    """Two-way mapping between symbols and dense integer IDs (0, 1, 2, ...)."""
+
+    def __init__(self):
+        self._ids: Dict[Hashable, int] = {}
+        self._symbols: List[Hashable] = []
+        self._lock = threading.Lock()
+
+    def intern(self, symbol: Hashable) -> int:
+        """ID of `symbol`, assigning the next free one on first sight."""
+        sid = self._ids.get(symbol)
+        if sid is None:
+            with self._lock:
+                sid = self._ids.get(symbol)
+                if sid is None:
+                    sid = len(self._symbols)
+                    self._symbols.append(symbol)
+                    self._ids[symbol] = sid
+        return sid
+
+    def symbol(self, sid: int) -> Hashable:
+        """Inverse of intern()."""
+        return self._symbols[sid]
+
+    def __contains__(self, symbol: Hashable) -> bool:
+        return symbol in self._ids
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __deepcopy__(self, memo) -> "SymbolTable":
+        # Tables are shared, append-only registries: copies of an extractor
+        # keep interning into the same table
+        return self
+
+    def __repr__(self) -> str:
+        return f"SymbolTable(symbols={len(self)})"
+
+
+# Shared default table for action names
+ACTIONS = SymbolTable()
+
+
+class CountedWindow:
+    """
+    Sliding window over the last `maxlen` appended items with O(1) membership.
+
+    Behaves like deque(maxlen=maxlen) for append / in / len / iteration
+    (oldest first).
+    """
+
+    __slots__ = ("maxlen", "_ring", "_counts", "_next", "_size")
+
+    def __init__(self, maxlen: int):
+        if maxlen <= 0:
+            raise ValueError(f"maxlen must be positive, got {maxlen}")
+        self.maxlen = maxlen
+        self._ring: List[Optional[Hashable]] = [None] * maxlen
+        self._counts: Dict[Hashable, int] = {}
+        self._next = 0
+        self._size = 0
+
+    def append(self, item: Hashable) -> None:
+        pos = self._next
+        counts = self._counts
+        if self._size == self.maxlen:
+            # Evict the oldest entry (the slot about to be overwritten)
+            old = self._ring[pos]
+            remaining = counts[old] - 1
+            if remaining:
+                counts[old] = remaining
+            else:
+                del counts[old]
+        else:
+            self._size += 1
+        self._ring[pos] = item
+        counts[item] = counts.get(item, 0) + 1
+        self._next = pos + 1 if pos + 1 < self.maxlen else 0
+
+    def count(self, item: Hashable) -> int:
+        return self._counts.get(item, 0)
+
+    def clear(self) -> None:
+        self._ring = [None] * self.maxlen
+        self._counts.clear()
+        self._next = 0
+        self._size = 0
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._counts
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        start = self._next if self._size == self.maxlen else 0
+        ring = self._ring
+        for i in range(self._size):
+            yield ring[(start + i) % self.maxlen]
+
+    def __repr__(self) -> str:
+        return f"CountedWindow({list(self)!r}, maxlen={self.maxlen})"
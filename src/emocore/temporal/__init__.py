@@ -8,6 +8,13 @@ if root_dir not in sys.path:
     sys.path.append(root_dir)
 
 from emocore.temporal.controls import RetryPolicy, BackoffSchedule, CooldownGate
+from emocore.temporal.concurrency import AdaptiveConcurrencyLimiter, PermitRevoked
+from emocore.temporal.ratelimit import BudgetRateLimiter, RateLimited
 from emocore.temporal.signals import StagnationDetector
+from emocore.temporal.timerwheel import TimerWheel, EscalationScheduler
 
-__all__ = ["RetryPolicy", "BackoffSchedule", "CooldownGate", "StagnationDetector"]
+__all__ = [
+    "RetryPolicy", "BackoffSchedule", "CooldownGate", "StagnationDetector",
+    "AdaptiveConcurrencyLimiter", "PermitRevoked", "BudgetRateLimiter", "RateLimited",
+    "TimerWheel", "EscalationScheduler",
+]
@@ -0,0 +1,225 @@
+# emocore/temporal/concurrency.py
+"""
+Budget-driven concurrency limiting.
+
+NOTE: This is a downstream control primitive.
+It must NOT influence EmoCore state, failure, or recovery.
+
+AdaptiveConcurrencyLimiter caps how many tool calls a session runs in
+parallel. Its permit count follows the session's BehaviorBudget:
+
+    permits = ceil(max_permits * min(effort, persistence)), at least min_permits
+    permits = 0 and every waiter rejected once the session HALTs
+
+A healthy session (budget near 1.0) keeps full parallelism; a struggling
+one fans out less, which cuts load on backends that are already failing.
+
+What the limiter does:
+- Serves threads (acquire(timeout) / `with limiter:`) and asyncio tasks
+  (`await acquire_async()` / `async with limiter:`) from one FIFO queue
+- Re-evaluates on every follow(result) / update(budget): a larger limit
+  releases queued waiters at once, a smaller one holds new grants back
+  until enough permits are returned
+- On HALT (follow() of a halted result, revoke(), or the halt listener
+  installed by attach(agent)) rejects every waiter and every later
+  acquire with PermitRevoked, until a non-halted result is followed
+
+What the limiter does NOT do:
+- Interrupt work that already holds a permit (see emocore.cancellation)
+- Step or read the agent by itself: call follow() with each StepResult
+"""
+import asyncio
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+from emocore.behavior import BehaviorBudget
+from emocore.failures import FailureType
+
+
+class PermitRevoked(RuntimeError):
+    """The session halted: no permits are granted."""
+
+    def __init__(self, failure: Optional[FailureType] = None):
+        super().__init__(f"concurrency permits revoked (session halted: {failure.name if failure else 'unknown'})")
+        self.failure = failure
+
+
+class _Waiter:
+    __slots__ = ("event", "future", "loop", "granted", "revoked", "abandoned")
+
+    def __init__(self, event=None, future=None, loop=None):
+        self.event = event
+        self.future = future
+        self.loop = loop
+        self.granted = False
+        self.revoked = False
+        self.abandoned = False
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Semaphore whose size follows a session's budget (threads and asyncio)."""
+
+    def __init__(self, max_permits: int, min_permits: int = 1):
+        if max_permits < 1 or not 0 <= min_permits <= max_permits:
+            raise ValueError("need max_permits >= 1 and 0 <= min_permits <= max_permits")
+        self.max_permits = max_permits
+        self.min_permits = min_permits
+        self.limit = max_permits
+        self.in_use = 0
+        self.failure: Optional[FailureType] = None  # Set while revoked
+        self.revoked = False
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------
+    # Budget
+    # --------------------------------------------------
+
+    def permits_for(self, budget: BehaviorBudget) -> int:
+        share = min(budget.effort, budget.persistence)
+        return max(self.min_permits, min(self.max_permits, math.ceil(self.max_permits * share)))
+
+    def update(self, budget: BehaviorBudget) -> None:
+        """Resize to the budget of a non-halted step (lifts a revocation)."""
+        limit = self.permits_for(budget)
+        with self._lock:
+            self.limit = limit
+            self.revoked = False
+            self.failure = None
+            self._grant()
+
+    def follow(self, result) -> None:
+        """Track a StepResult: revoke if it halted, resize otherwise."""
+        if result.halted:
+            self.revoke(result.failure)
+        else:
+            self.update(result.budget)
+
+    def revoke(self, failure: Optional[FailureType] = None) -> None:
+        """Reject every waiter and every later acquire (session halted)."""
+        with self._lock:
+            self.limit = 0
+            self.revoked = True
+            self.failure = failure
+            waiters, self._waiters = self._waiters, deque()
+            for waiter in waiters:
+                waiter.revoked = True
+                waiter.wake()
+
+    def attach(self, agent) -> "AdaptiveConcurrencyLimiter":
+        """Revoke the moment `agent` halts (EmoEngine halt listener)."""
+        agent.engine.add_halt_listener(lambda failure, reason: self.revoke(failure))
+        return self
+
+    # --------------------------------------------------
+    # Permits
+    # --------------------------------------------------
+
+    def try_acquire(self) -> bool:
+        """Take a permit if one is free right now (never waits)."""
+        with self._lock:
+            if self.revoked:
+                raise PermitRevoked(self.failure)
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block the calling thread for a permit; False on timeout."""
+        with self._lock:
+            if self.revoked:
+                raise PermitRevoked(self.failure)
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return True
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        waiter.event.wait(timeout)
+        with self._lock:
+            if waiter.granted:
+                return True
+            if waiter.revoked:
+                raise PermitRevoked(self.failure)
+            waiter.abandoned = True
+            return False
+
+    async def acquire_async(self) -> None:
+        """Wait on the event loop for a permit."""
+        with self._lock:
+            if self.revoked:
+                raise PermitRevoked(self.failure)
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(future=loop.create_future(), loop=loop)
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # Granted while being cancelled: hand the permit on
+                    self.in_use -= 1
+                    self._grant()
+                else:
+                    waiter.abandoned = True
+            raise
+        if waiter.revoked:
+            raise PermitRevoked(self.failure)
+
+    def release(self) -> None:
+        with self._lock:
+            if self.in_use <= 0:
+                raise ValueError("release() without a matching acquire")
+            self.in_use -= 1
+            self._grant()
+
+    def _grant(self) -> None:
+        # Caller holds the lock. FIFO; abandoned waiters are skipped.
+        waiters = self._waiters
+        while waiters and self.in_use < self.limit:
+            waiter = waiters.popleft()
+            if waiter.abandoned:
+                continue
+            self.in_use += 1
+            waiter.granted = True
+            waiter.wake()
+
+    @property
+    def waiting(self) -> int:
+        return sum(not w.abandoned for w in self._waiters)
+
+    def __enter__(self) -> "AdaptiveConcurrencyLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.limit}, in_use={self.in_use}, "
+            f"waiting={self.waiting}, revoked={self.revoked})"
+        )
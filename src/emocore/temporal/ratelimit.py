@@ -0,0 +1,266 @@
+# emocore/temporal/ratelimit.py
+"""
+Budget-scaled request rate limiting.
+
+NOTE: This is a downstream control primitive.
+It must NOT influence EmoCore state, failure, or recovery.
+
+BudgetRateLimiter caps LLM / tool request rates per key (tenant, session)
+with one token bucket per key. The refill rate follows each key's
+governance state:
+
+    refill = rate * mode_scale[mode]     (RECOVERING: a fraction of rate)
+    refill = 0, bucket emptied           once the key's session HALTs
+
+and exploratory requests are charged against budget.exploration:
+
+    charge = cost                        ordinary request
+    charge = cost / exploration          explore=True (exploration 0: never)
+
+What the limiter does:
+- Refills lazily: a bucket is brought up to date only when its key is
+  used, from the time elapsed since it was last touched. No background
+  thread, no timers; each key costs one small slotted object
+- Offers try_acquire() (never waits) and `await acquire()` (sleeps until
+  the bucket can pay, re-checking after every sleep)
+- Tracks a key's governance through follow(key, result) / update(), or
+  the halt listener installed by attach(agent, key)
+
+What the limiter does NOT do:
+- Queue waiters: concurrent acquire() calls on one key race for refilled
+  tokens, with no FIFO order
+- Step or read the agent by itself: call follow() with each StepResult
+- Forget keys on its own: prune() drops buckets that are back to the
+  state of a fresh key, forget() drops one key
+
+Time comes from an emocore Clock (MonotonicClock by default). acquire()
+sleeps in real time, so pair it with a real-time clock.
+"""
+import asyncio
+import math
+import threading
+from typing import Dict, Hashable, Mapping, Optional
+
+from emocore.behavior import BehaviorBudget
+from emocore.clock import Clock, MonotonicClock
+from emocore.failures import FailureType
+from emocore.modes import Mode
+from emocore.temporal.concurrency import PermitRevoked
+
+DEFAULT_MODE_SCALE = {Mode.IDLE: 1.0, Mode.RECOVERING: 0.25}
+
+
+class RateLimited(RuntimeError):
+    """The request can never be paid under the key's current budget."""
+
+    def __init__(self, key: Hashable, charge: float):
+        super().__init__(f"rate limit: {key!r} cannot pay a charge of {charge} under its current budget")
+        self.key = key
+        self.charge = charge
+
+
+class _Bucket:
+    __slots__ = ("tokens", "stamp", "scale", "exploration", "halted", "failure")
+
+    def __init__(self, tokens: float, stamp: float):
+        self.tokens = tokens
+        self.stamp = stamp
+        self.scale = 1.0
+        self.exploration = 1.0
+        self.halted = False
+        self.failure: Optional[FailureType] = None
+
+
+class BudgetRateLimiter:
+    """
+    Per-key token buckets whose refill rate follows EmoCore governance.
+
+    Args:
+        rate: Tokens per second refilled for a key in IDLE mode.
+        burst: Bucket capacity; a fresh key starts full.
+        mode_scale: Refill multiplier per Mode (HALTED is always 0).
+        clock: Time source (MonotonicClock by default).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        mode_scale: Optional[Mapping[Mode, float]] = None,
+        clock: Optional[Clock] = None,
+    ):
+        if rate <= 0.0 or burst <= 0.0:
+            raise ValueError(f"need rate > 0 and burst > 0, got rate={rate}, burst={burst}")
+        scale = dict(DEFAULT_MODE_SCALE if mode_scale is None else mode_scale)
+        scale[Mode.HALTED] = 0.0
+        if any(not 0.0 <= s <= 1.0 for s in scale.values()):
+            raise ValueError(f"mode_scale values must be in [0, 1], got {scale}")
+        self.rate = rate
+        self.burst = burst
+        self.mode_scale = scale
+        self.clock = clock if clock is not None else MonotonicClock()
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    # --------------------------------------------------
+    # Governance
+    # --------------------------------------------------
+
+    def update(self, key: Hashable, budget: BehaviorBudget, mode: Mode = Mode.IDLE) -> None:
+        """Set a key's refill rate and exploration from a non-halted step."""
+        scale = self.mode_scale.get(mode, 1.0)
+        with self._lock:
+            bucket = self._refill(key)
+            bucket.scale = scale
+            bucket.exploration = budget.exploration
+            bucket.halted = False
+            bucket.failure = None
+
+    def follow(self, key: Hashable, result) -> None:
+        """Track a StepResult: halt the key if it halted, update it otherwise."""
+        if result.halted:
+            self.halt(key, result.failure)
+        else:
+            self.update(key, result.budget, result.mode)
+
+    def halt(self, key: Hashable, failure: Optional[FailureType] = None) -> None:
+        """Empty a key's bucket and stop its refill (session halted)."""
+        with self._lock:
+            bucket = self._refill(key)
+            bucket.tokens = 0.0
+            bucket.scale = 0.0
+            bucket.halted = True
+            bucket.failure = failure
+
+    def attach(self, agent, key: Hashable) -> "BudgetRateLimiter":
+        """Halt `key` the moment `agent` halts (EmoEngine halt listener)."""
+        agent.engine.add_halt_listener(lambda failure, reason: self.halt(key, failure))
+        return self
+
+    # --------------------------------------------------
+    # Tokens
+    # --------------------------------------------------
+
+    def charge(self, key: Hashable, cost: float = 1.0, explore: bool = False) -> float:
+        """Tokens a request would take from `key` right now (inf: never payable)."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return self._charge(bucket, cost, explore)
+
+    def try_acquire(self, key: Hashable, cost: float = 1.0, explore: bool = False) -> bool:
+        """
+        Take the request's charge from `key` if it is available now (never waits).
+
+        Raises PermitRevoked if the key is halted.
+        """
+        with self._lock:
+            bucket = self._refill(key)
+            if bucket.halted:
+                raise PermitRevoked(bucket.failure)
+            charge = self._charge(bucket, cost, explore)
+            if bucket.tokens >= charge:
+                bucket.tokens -= charge
+                return True
+            return False
+
+    def time_until(self, key: Hashable, cost: float = 1.0, explore: bool = False) -> float:
+        """Seconds until `key` can pay the request at its current rate (inf: never)."""
+        with self._lock:
+            return self._wait(self._refill(key), cost, explore)
+
+    async def acquire(
+        self,
+        key: Hashable,
+        cost: float = 1.0,
+        explore: bool = False,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait on the event loop until `key` can pay the request, then take it.
+
+        Returns False if the wait would exceed `timeout`. Raises
+        PermitRevoked if the key is halted and RateLimited if the charge can
+        never be paid (larger than burst, or no refill at all).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                bucket = self._refill(key)
+                if bucket.halted:
+                    raise PermitRevoked(bucket.failure)
+                wait = self._wait(bucket, cost, explore)
+                if wait == 0.0:
+                    bucket.tokens -= self._charge(bucket, cost, explore)
+                    return True
+                if wait == math.inf:
+                    raise RateLimited(key, self._charge(bucket, cost, explore))
+            if deadline is not None and loop.time() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    def tokens(self, key: Hashable) -> float:
+        """Tokens in `key`'s bucket right now."""
+        with self._lock:
+            if key not in self._buckets:
+                return self.burst  # Don't allocate a bucket just to read it
+            return self._refill(key).tokens
+
+    # --------------------------------------------------
+    # Keys
+    # --------------------------------------------------
+
+    def forget(self, key: Hashable) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def prune(self) -> int:
+        """Drop every bucket a fresh key would reproduce (full, default budget). Returns the count."""
+        now = self.clock.now()
+        with self._lock:
+            idle = [
+                key for key, bucket in self._buckets.items()
+                if bucket.scale == 1.0 and bucket.exploration == 1.0 and not bucket.halted
+                and bucket.tokens + (now - bucket.stamp) * self.rate >= self.burst
+            ]
+            for key in idle:
+                del self._buckets[key]
+        return len(idle)
+
+    def _refill(self, key: Hashable) -> _Bucket:
+        # Caller holds the lock
+        now = self.clock.now()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.burst, now)
+            return bucket
+        elapsed = now - bucket.stamp
+        if elapsed > 0.0:
+            bucket.tokens = min(self.burst, bucket.tokens + elapsed * self.rate * bucket.scale)
+            bucket.stamp = now
+        return bucket
+
+    def _charge(self, bucket: Optional[_Bucket], cost: float, explore: bool) -> float:
+        if cost < 0.0:
+            raise ValueError(f"cost must be >= 0, got {cost}")
+        if not explore or bucket is None:
+            return cost
+        if bucket.exploration <= 0.0:
+            return math.inf if cost > 0.0 else 0.0
+        return cost / bucket.exploration
+
+    def _wait(self, bucket: _Bucket, cost: float, explore: bool) -> float:
+        charge = self._charge(bucket, cost, explore)
+        deficit = charge - bucket.tokens
+        if deficit <= 0.0:
+            return 0.0
+        refill = self.rate * bucket.scale
+        if charge > self.burst or refill <= 0.0:
+            return math.inf
+        return deficit / refill
+
+    def __repr__(self) -> str:
+        return f"BudgetRateLimiter(rate={self.rate}, burst={self.burst}, keys={len(self._buckets)})"
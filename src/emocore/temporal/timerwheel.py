@@ -0,0 +1,338 @@
+# emocore/temporal/timerwheel.py
+"""
+Timer-wheel scheduling for backoff and cooldown across many sessions.
+
+NOTE: This is a downstream control primitive.
+It must NOT influence EmoCore state, failure, or recovery.
+
+BackoffSchedule only computes delays and CooldownGate has to be stepped,
+so waiting them out means one sleeping task (or one polled gate) per
+session. This module parks waiting sessions in one hierarchical timer
+wheel instead, and hands them back when their wait is over.
+
+What TimerWheel does:
+- Keeps one timer per key in `levels` wheels of `slots` slots each; level
+  l slots are slots**l ticks wide. Scheduling and cancelling are O(1); a
+  timer is moved down at most levels - 1 times before it fires, so each
+  expiry costs O(levels). Delays beyond the top level are parked at its
+  far end and re-filed when reached
+- Advances lazily to the clock's time when asked (advance() / expired());
+  runs of empty ticks are skipped a rotation at a time
+- Fires a timer on the first tick at or after its deadline, never before
+  (deadlines are rounded up to whole ticks)
+
+What EscalationScheduler does:
+- Drives each session through the EscalationResolver levels: a failure
+  parks it in BACKING_OFF for BackoffSchedule.delay(attempt); once
+  max_retries attempts are used up, in COOLDOWN for `cooldown` seconds
+  (CooldownGate's cooldown, as a duration instead of a step count); a
+  budget with effort <= 0.05 gives HALT, unparks it and clears its
+  attempts
+- Yields sessions whose backoff or cooldown has expired from ready(),
+  in expiry order, for a worker pool to drain
+
+What this module does NOT do:
+- Sleep or run background threads: the caller decides when to drain
+- Lock: use one wheel from one thread (or one event loop)
+
+Time comes from an emocore Clock (MonotonicClock by default); pass a
+VirtualClock to test without waiting.
+
+Usage:
+    scheduler = EscalationScheduler(BackoffSchedule(0.5), max_retries=3, cooldown=30.0)
+    scheduler.record_failure(session_id, result.budget)
+    ...
+    for session_id in scheduler.ready():
+        pool.submit(retry, session_id)
+"""
+import math
+from collections import deque
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from emocore.behavior import BehaviorBudget
+from emocore.clock import Clock, MonotonicClock
+from emocore.escalation import EscalationLevel, EscalationResolver
+from emocore.temporal.controls import BackoffSchedule
+
+# Slack (in ticks) for float noise: 0.3 / 0.1 must land on tick 3
+_EPS = 1e-9
+
+
+class _Timer:
+    __slots__ = ("key", "deadline", "value", "level", "slot", "cancelled")
+
+    def __init__(self, key: Hashable, deadline: int, value: Any):
+        self.key = key
+        self.deadline = deadline  # In ticks since the wheel's origin
+        self.value = value
+        self.level = -1           # -1 while in the ready queue
+        self.slot = 0
+        self.cancelled = False
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel: one timer per key, O(1) schedule and cancel.
+
+    Args:
+        tick: Resolution in seconds.
+        slots: Slots per level (a power of two).
+        levels: Number of levels; delays up to tick * slots**levels are
+                filed directly.
+        clock: Time source (MonotonicClock by default).
+    """
+
+    def __init__(self, tick: float = 0.01, slots: int = 256, levels: int = 4, clock: Optional[Clock] = None):
+        if tick <= 0.0:
+            raise ValueError(f"tick must be positive, got {tick}")
+        if slots < 2 or slots & (slots - 1) or levels < 1:
+            raise ValueError(f"need a power-of-two slots >= 2 and levels >= 1, got {slots}, {levels}")
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.clock = clock if clock is not None else MonotonicClock()
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self._counts = [0] * levels   # Timers filed per level
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._ready: deque = deque()
+        self._origin = self.clock.now()
+        self._tick = 0                # Last processed tick
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    # --------------------------------------------------
+    # Timers
+    # --------------------------------------------------
+
+    def schedule(self, key: Hashable, delay: float, value: Any = None) -> None:
+        """Fire `key` (with `value`) `delay` seconds from now, replacing its current timer."""
+        if delay < 0.0:
+            raise ValueError(f"delay must be >= 0, got {delay}")
+        self.cancel(key)
+        deadline = math.ceil((self.clock.now() + delay - self._origin) / self.tick - _EPS)
+        timer = self._timers[key] = _Timer(key, deadline, value)
+        self._file(timer)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop `key`'s timer. Returns False if it had none."""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        if timer.level < 0:
+            timer.cancelled = True  # Skipped when the ready queue reaches it
+        else:
+            del self._wheels[timer.level][timer.slot][key]
+            self._counts[timer.level] -= 1
+        return True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The value `key` was scheduled with."""
+        timer = self._timers.get(key)
+        return default if timer is None else timer.value
+
+    def remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until `key` fires (0.0 if due), or None if it has no timer."""
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return max(0.0, self._origin + timer.deadline * self.tick - self.clock.now())
+
+    # --------------------------------------------------
+    # Expiry
+    # --------------------------------------------------
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Process every tick up to `now` (default: the clock). Returns the ready count."""
+        if now is None:
+            now = self.clock.now()
+        target = math.floor((now - self._origin) / self.tick + _EPS)
+        mask = self._mask
+        counts = self._counts
+        level0 = self._wheels[0]
+        while self._tick < target:
+            if not counts[0]:
+                # Nothing can fire before the next rotation, where level 1 cascades
+                boundary = (self._tick | mask) + 1
+                if boundary > target or not any(counts):
+                    self._tick = target
+                    break
+                self._tick = boundary - 1
+            self._tick += 1
+            t = self._tick
+            if not t & mask:
+                self._cascade(1, t)
+            slot = level0[t & mask]
+            if slot:
+                level0[t & mask] = {}
+                counts[0] -= len(slot)
+                for timer in slot.values():
+                    if timer.deadline > t:
+                        self._file(timer)  # Parked past the top level (levels=1)
+                    else:
+                        timer.level = -1
+                        self._ready.append(timer)
+        return sum(not timer.cancelled for timer in self._ready)
+
+    def expired(self, now: Optional[float] = None) -> Iterator[Tuple[Hashable, Any]]:
+        """Advance, then yield (key, value) for every fired timer, oldest deadline first."""
+        self.advance(now)
+        ready = self._ready
+        while ready:
+            timer = ready.popleft()
+            if timer.cancelled:
+                continue
+            del self._timers[timer.key]
+            yield timer.key, timer.value
+
+    def _file(self, timer: _Timer) -> None:
+        delta = timer.deadline - self._tick
+        if delta <= 0:
+            timer.level = -1
+            self._ready.append(timer)
+            return
+        bits = self._bits
+        level, span = 0, self.slots
+        while delta >= span and level < self.levels - 1:
+            level += 1
+            span <<= bits
+        # Past the top level: park at its far end, re-filed when that slot cascades
+        deadline = timer.deadline if delta < span else self._tick + span - 1
+        slot = (deadline >> (bits * level)) & self._mask
+        timer.level, timer.slot = level, slot
+        self._wheels[level][slot][timer.key] = timer
+        self._counts[level] += 1
+
+    def _cascade(self, level: int, t: int) -> None:
+        # t is a multiple of slots**level: re-file that level's current slot
+        if level >= self.levels:
+            return
+        shift = self._bits * level
+        index = (t >> shift) & self._mask
+        if not index:
+            self._cascade(level + 1, t)
+        slot = self._wheels[level][index]
+        if slot:
+            self._wheels[level][index] = {}
+            self._counts[level] -= len(slot)
+            for timer in slot.values():
+                self._file(timer)
+
+
+class _Session:
+    __slots__ = ("attempts", "effort")
+
+    def __init__(self):
+        self.attempts = 0
+        self.effort = 1.0
+
+
+class EscalationScheduler:
+    """
+    Parks sessions in backoff / cooldown on a TimerWheel and reports their
+    EscalationLevel.
+
+    Args:
+        backoff: Delay per retry attempt.
+        max_retries: Failures backed off before a cooldown.
+        cooldown: Cooldown duration in seconds (attempts start over after it).
+        resolver: Maps a session's state to its EscalationLevel.
+        clock, tick, slots, levels: TimerWheel parameters.
+    """
+
+    def __init__(
+        self,
+        backoff: Optional[BackoffSchedule] = None,
+        max_retries: int = 3,
+        cooldown: float = 30.0,
+        resolver: Optional[EscalationResolver] = None,
+        clock: Optional[Clock] = None,
+        tick: float = 0.01,
+        slots: int = 256,
+        levels: int = 4,
+    ):
+        self.backoff = backoff if backoff is not None else BackoffSchedule()
+        self.max_retries = max_retries
+        self.cooldown = cooldown
+        self.resolver = resolver if resolver is not None else EscalationResolver()
+        self.wheel = TimerWheel(tick, slots, levels, clock)
+        self._sessions: Dict[Hashable, _Session] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def parked(self) -> int:
+        return len(self.wheel)
+
+    def record_failure(self, key: Hashable, budget: Optional[BehaviorBudget] = None) -> EscalationLevel:
+        """Park `key` after a failed attempt and return its new level."""
+        session = self._session(key, budget)
+        session.attempts += 1
+        if session.attempts <= self.max_retries:
+            self.wheel.schedule(key, self.backoff.delay(session.attempts), EscalationLevel.BACKING_OFF)
+        else:
+            session.attempts = 0
+            self.wheel.schedule(key, self.cooldown, EscalationLevel.COOLDOWN)
+        return self._resolve(key, session)
+
+    def record_success(self, key: Hashable) -> None:
+        """Unpark `key` and forget its attempts."""
+        self.forget(key)
+
+    def update(self, key: Hashable, budget: BehaviorBudget) -> EscalationLevel:
+        """Track `key`'s budget; a HALT level unparks it."""
+        return self._resolve(key, self._session(key, budget))
+
+    def follow(self, key: Hashable, result) -> EscalationLevel:
+        """update() with a StepResult (a halted result has a zero budget)."""
+        return self.update(key, result.budget)
+
+    def level(self, key: Hashable) -> EscalationLevel:
+        session = self._sessions.get(key)
+        if session is None:
+            session = _Session()
+        return self._level(key, session)
+
+    def remaining(self, key: Hashable) -> float:
+        """Seconds left in `key`'s backoff or cooldown (0.0 if not parked)."""
+        return self.wheel.remaining(key) or 0.0
+
+    def ready(self, now: Optional[float] = None) -> Iterator[Hashable]:
+        """Yield sessions whose backoff or cooldown has expired, oldest deadline first."""
+        for key, _ in self.wheel.expired(now):
+            yield key
+
+    def forget(self, key: Hashable) -> None:
+        self.wheel.cancel(key)
+        self._sessions.pop(key, None)
+
+    def _session(self, key: Hashable, budget: Optional[BehaviorBudget]) -> _Session:
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions[key] = _Session()
+        if budget is not None:
+            session.effort = budget.effort
+        return session
+
+    def _resolve(self, key: Hashable, session: _Session) -> EscalationLevel:
+        level = self._level(key, session)
+        if level is EscalationLevel.HALT:
+            self.wheel.cancel(key)  # A halted session is never handed back
+            session.attempts = 0
+        return level
+
+    def _level(self, key: Hashable, session: _Session) -> EscalationLevel:
+        parked = self.wheel.get(key)
+        left = self.wheel.remaining(key) or 0.0
+        return self.resolver.resolve(
+            can_try=0 < session.attempts <= self.max_retries,
+            backoff_delay=left if parked is EscalationLevel.BACKING_OFF else 0.0,
+            cooldown_active=parked is EscalationLevel.COOLDOWN and left > 0.0,
+            effort=session.effort,
+        )
@@ -0,0 +1,124 @@
+# emocore/trajectory.py
+"""
+Closed-form budget trajectories under constant signals.
+
+What this module does:
+- Describes how one budget dimension evolves over a run of IDLE steps in
+  which signals, dt and the stagnation flag do not change
+- Finds the first step at which a threshold predicate becomes true
+
+What this module does NOT do:
+- Mutate engine state (EmoEngine.advance applies the jump)
+- Model RECOVERING steps (risk freeze and bounded recovery are not affine)
+
+Model:
+Under constant signals the appraisal delta is constant, so pressure is
+linear in the step index j (P_j = P_0 + j * delta) and each raw governance
+dimension is linear until it reaches a clip bound:
+
+    g_j = A + B * j
+
+Budget inertia b_j = α b_{j-1} + (1 - α) g_j then has the closed form
+
+    b_j = (b_0 - D) α^j + D + B j,    D = A - α B / (1 - α)
+
+which is an exponential plus a line. Its derivative is monotone in j, so the
+trajectory is monotone or has a single extremum. On each monotone piece the
+set of steps where a threshold predicate holds is a prefix or suffix, which
+lets first_step() binary search instead of scanning.
+"""
+import math
+from typing import Callable, Optional
+
+INF = float("inf")
+
+
+class InertiaTrajectory:
+    """b_j = c * alpha**j + D + B * j for j >= 0, with b_0 = c + D."""
+
+    __slots__ = ("c", "D", "B", "alpha")
+
+    def __init__(self, b0: float, A: float, B: float, alpha: float):
+        self.alpha = alpha
+        self.B = B
+        self.D = A - alpha * B / (1.0 - alpha)
+        self.c = b0 - self.D
+
+    def at(self, j: int) -> float:
+        return self.c * self.alpha ** j + self.D + self.B * j
+
+    def extremum(self) -> Optional[float]:
+        """Real-valued j where the derivative vanishes, or None if monotone."""
+        if self.c == 0.0 or self.B == 0.0:
+            return None
+        ratio = -self.B / (self.c * math.log(self.alpha))
+        if ratio <= 0.0:
+            return None
+        return math.log(ratio) / math.log(self.alpha)
+
+    def first_step(self, bad: Callable[[float], bool], lo: int, hi: int) -> Optional[int]:
+        """
+        Smallest j in [lo, hi] with bad(at(j)), or None.
+
+        `bad` must be a threshold predicate on the value (v < T, v >= T, ...).
+        """
+        if hi < lo:
+            return None
+        pieces = [(lo, hi)]
+        m = self.extremum()
+        if m is not None and lo < m < hi:
+            split = int(math.floor(m))
+            pieces = [(lo, split), (split + 1, hi)]
+
+        for l, h in pieces:
+            if l > h:
+                continue
+            if bad(self.at(l)):
+                return l
+            if not bad(self.at(h)):
+                continue
+            # Monotone piece: bad at h, not at l => first bad step is in (l, h]
+            while h - l > 1:
+                mid = (l + h) // 2
+                if bad(self.at(mid)):
+                    h = mid
+                else:
+                    l = mid
+            return h
+        return None
+
+
+def clip_regime(value: float) -> int:
+    """-1 below the [0, 1] clip range, +1 above it, 0 inside (same tests as governance)."""
+    if value < 0.0:
+        return -1
+    if value > 1.0:
+        return 1
+    return 0
+
+
+def regime_span(a: float, b: float) -> float:
+    """
+    Largest real j >= 1 for which a + b * j stays in the clip regime it has at j = 1.
+
+    Returns INF when the regime never changes.
+    """
+    regime = clip_regime(a + b)
+    if b == 0.0:
+        return INF
+    if regime == 0:
+        # Leaves through 1 when rising, through 0 when falling
+        return (1.0 - a) / b if b > 0.0 else -a / b
+    if regime < 0:
+        return -a / b if b > 0.0 else INF
+    return (1.0 - a) / b if b < 0.0 else INF
+
+
+def clipped_line(a: float, b: float):
+    """(A, B) of the clipped raw value g_j = A + B * j within the regime at j = 1."""
+    regime = clip_regime(a + b)
+    if regime < 0:
+        return 0.0, 0.0
+    if regime > 0:
+        return 1.0, 0.0
+    return a, b
@@ -1,9 +1,4 @@
-from dataclasses import dataclass, replace
-from typing import List, Optional
-from collections import deque
-import math
-
-from typing import List, Optional
+from typing import Optional, Tuple
 from collections import deque
 import math
 
@@ -28,109 +23,124 @@ class SignalValidator:
     - strict=True: Raise ValidationError on any violation.
     """
     
+    MAX_DELTA = 0.5         # Largest allowed per-step change of any signal
+    OSCILLATION_WINDOW = 10  # Validated rewards kept for the oscillation check
+    MAX_FLIPS = 3           # Strict mode: more reward sign flips than this fail
+
     def __init__(self, strict: bool = False):
         self.strict = strict
-        self.last_signals: Optional[Signals] = None
-        self.signal_history: deque = deque(maxlen=10)
+        # State is kept as raw (reward, novelty, urgency, difficulty, trust) tuples
+        self._last: Optional[Tuple[float, float, float, float, float]] = None
+        self._history: deque = deque(maxlen=self.OSCILLATION_WINDOW)
+        # Sign flip (0/1) between each pair of consecutive history rewards,
+        # and their running sum: the oscillation check is O(1)
+        self._flips: deque = deque(maxlen=self.OSCILLATION_WINDOW - 1)
+        self._flip_count = 0
+
+    @property
+    def last_signals(self) -> Optional[Signals]:
+        return None if self._last is None else Signals(*self._last)
+
+    @last_signals.setter
+    def last_signals(self, signals: Optional[Signals]) -> None:
+        self._last = None if signals is None else (
+            signals.reward, signals.novelty, signals.urgency, signals.difficulty, signals.trust
+        )
+
+    @property
+    def signal_history(self) -> deque:
+        """Recent validated signals (a snapshot; oldest first)."""
+        return deque((Signals(*values) for values in self._history), maxlen=self._history.maxlen)
         
     def validate(self, signals: Signals) -> Signals:
         """
         Validate and optionally sanitize signals.
         Returns a guaranteed valid Signals object.
         """
+        return Signals(*self.validate_values(
+            signals.reward, signals.novelty, signals.urgency, signals.difficulty, signals.trust,
+        ))
+
+    def validate_values(
+        self,
+        reward: float,
+        novelty: float,
+        urgency: float,
+        difficulty: float = 0.0,
+        trust: float = 1.0,
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        validate() on raw floats: same checks, same state, no Signals objects.
+        Returns the validated (reward, novelty, urgency, difficulty, trust).
+        """
         # 1. Range Check & Clamping
-        validated = self._enforce_ranges(signals)
-        
+        if self.strict:
+            _check_ranges(reward, novelty, urgency, difficulty)
+        # Clamp (always safe; trust out of range is clamped, never an error)
+        r = max(-1.0, min(1.0, reward))
+        n = max(0.0, min(1.0, novelty))
+        u = max(0.0, min(1.0, urgency))
+        d = max(0.0, min(1.0, difficulty))
+        t = max(0.0, min(1.0, trust))
+
         # 2. Smoothness Check (Delta Limiting)
-        if self.last_signals:
-            validated = self._enforce_smoothness(validated, self.last_signals)
-            
+        last = self._last
+        if last is not None:
+            pr, pn, pu, pd, pt = last
+            limit = self.MAX_DELTA
+            if not (abs(r - pr) <= limit and abs(n - pn) <= limit and abs(u - pu) <= limit
+                    and abs(d - pd) <= limit and abs(t - pt) <= limit):
+                # Strict mode reports difficulty first (historical check order)
+                d = self._smooth(d, pd, "Difficulty")
+                r = self._smooth(r, pr, "Reward")
+                n = self._smooth(n, pn, "Novelty")
+                u = self._smooth(u, pu, "Urgency")
+                t = self._smooth(t, pt, "Trust")
+
         # 3. Oscillation Check
-        self._check_oscillation(validated)
-        
-        # Update history
-        self.last_signals = validated
-        self.signal_history.append(validated)
-        
+        history = self._history
+        flip = _sign_flip(history[-1][0], r) if history else 0
+        if self.strict and len(history) >= 4:
+            # Flips among the last len(history) + 1 rewards, this one included
+            flips = self._flip_count + flip
+            if flips > self.MAX_FLIPS:
+                raise ValidationError(f"Reward oscillation validation failed: {flips} flips in history")
+
+        # Update history (one tuple per step)
+        validated = (r, n, u, d, t)
+        if history:
+            flip_window = self._flips
+            if len(flip_window) == flip_window.maxlen:
+                self._flip_count -= flip_window[0]  # Pair leaving with the oldest reward
+            flip_window.append(flip)
+            self._flip_count += flip
+        self._last = validated
+        history.append(validated)
+
         return validated
-    
-    def _enforce_ranges(self, s: Signals) -> Signals:
-        """Enforce [-1, 1] for reward, [0, 1] for others."""
-        r = s.reward
-        n = s.novelty
-        u = s.urgency
-        d = s.difficulty  # Note: interface.Signals needs difficulty added
-        
-        # Check bounds
-        violations = []
-        if not (-1.0 <= r <= 1.0): violations.append(f"Reward {r} out of [-1, 1]")
-        if not (0.0 <= n <= 1.0): violations.append(f"Novelty {n} out of [0, 1]")
-        if not (0.0 <= u <= 1.0): violations.append(f"Urgency {u} out of [0, 1]")
-        # Difficulty range check assumes [0,1] based on spec
-        if hasattr(s, 'difficulty') and not (0.0 <= s.difficulty <= 1.0):
-             violations.append(f"Difficulty {s.difficulty} out of [0, 1]")
-             
-        if violations and self.strict:
-            raise ValidationError(f"Range violations: {violations}")
-        
-        # trust range check
-        if not (0.0 <= s.trust <= 1.0):
-            violations.append(f"Trust {s.trust} out of [0, 1]")
-            
-        # Clamp (always safe)
-        d = s.difficulty
-        return replace(s,
-            reward=max(-1.0, min(1.0, r)),
-            novelty=max(0.0, min(1.0, n)),
-            urgency=max(0.0, min(1.0, u)),
-            difficulty=max(0.0, min(1.0, d)),
-            trust=max(0.0, min(1.0, s.trust))
-        )
-        
-    def _enforce_smoothness(self, current: Signals, previous: Signals) -> Signals:
-        """Enforce max delta of 0.5 per step."""
-        MAX_DELTA = 0.5
-        
-        # Helper to clamp delta
-        def smooth(curr, prev, name):
-            delta = curr - prev
-            if abs(delta) > MAX_DELTA:
-                if self.strict:
-                    raise ValidationError(f"{name} delta {delta} > {MAX_DELTA}")
-                return prev + math.copysign(MAX_DELTA, delta)
-            return curr
-
-        # Difficulty might not be on Signals object yet in some phases
-        # We need to be robust
-        new_diff = 0.0
-        if hasattr(current, 'difficulty') and hasattr(previous, 'difficulty'):
-            new_diff = smooth(current.difficulty, previous.difficulty, "Difficulty")
-
-        return replace(current,
-            reward=smooth(current.reward, previous.reward, "Reward"),
-            novelty=smooth(current.novelty, previous.novelty, "Novelty"),
-            urgency=smooth(current.urgency, previous.urgency, "Urgency"),
-            difficulty=smooth(current.difficulty, previous.difficulty, "Difficulty"),
-            trust=smooth(current.trust, previous.trust, "Trust")
-        )
 
-    def _check_oscillation(self, current: Signals) -> None:
-        """Check for rapid sign flipping (oscillation)."""
-        # Combine history + current to check recent trend including this step
-        recent = list(self.signal_history) + [current]
-        
-        if len(recent) < 5:
-            return
-            
-        # Check reward oscillation (sign flips)
-        flips = 0
-        for i in range(1, len(recent)):
-            prev = recent[i-1].reward
-            curr = recent[i].reward
-            if (prev > 0 and curr < 0) or (prev < 0 and curr > 0):
-                flips += 1
-                
-        if flips > 3:
+    def _smooth(self, current: float, previous: float, name: str) -> float:
+        """Limit the change from previous to MAX_DELTA (strict: raise instead)."""
+        delta = current - previous
+        if abs(delta) > self.MAX_DELTA:
             if self.strict:
-                raise ValidationError(f"Reward oscillation validation failed: {flips} flips in history")
-            # In non-strict, we allow it but Extractor trust logic handles it
+                raise ValidationError(f"{name} delta {delta} > {self.MAX_DELTA}")
+            return previous + math.copysign(self.MAX_DELTA, delta)
+        return current
+
+
+def _check_ranges(r: float, n: float, u: float, d: float) -> None:
+    """Strict range check: [-1, 1] for reward, [0, 1] for the others (trust is never checked)."""
+    violations = []
+    if not (-1.0 <= r <= 1.0): violations.append(f"Reward {r} out of [-1, 1]")
+    if not (0.0 <= n <= 1.0): violations.append(f"Novelty {n} out of [0, 1]")
+    if not (0.0 <= u <= 1.0): violations.append(f"Urgency {u} out of [0, 1]")
+    # Difficulty range check assumes [0,1] based on spec
+    if not (0.0 <= d <= 1.0): violations.append(f"Difficulty {d} out of [0, 1]")
+    if violations:
+        raise ValidationError(f"Range violations: {violations}")
+
+
+def _sign_flip(previous: float, current: float) -> int:
+    """1 if the reward changed sign (zero is neither sign), else 0."""
+    return 1 if (previous > 0 and current < 0) or (previous < 0 and current > 0) else 0
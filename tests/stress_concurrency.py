@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Stress Test: Concurrent Governance
+==================================
+
+Scenario: N threads, each driving its own thread-safe agent through
+GovernedSession.observe_decision(), then N threads sharing ONE agent.
+Intent: Per-agent locks must not serialize independent sessions, and a
+shared session must stay consistent (every step counted exactly once).
+Detection: Throughput per thread count; on a free-threaded (no-GIL)
+CPython build independent sessions should scale with the number of cores,
+with the GIL they stay flat (the lock is uncontended either way).
+"""
+
+import sys
+import os
+import threading
+import time
+from dataclasses import replace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from emocore import EmoCoreAgent, GovernedSession, Observation, PROFILES, ProfileType
+
+STEPS = 20_000
+PROFILE = replace(PROFILES[ProfileType.AGGRESSIVE], max_steps=16 * STEPS)
+# Varied enough that no session halts (every step does full governance work)
+OBSERVATIONS = [
+    Observation(f"tool_{i % 97}", "success" if i % 3 else "failure", 0.4 if i % 2 else 0.1, 0.2, 1.0)
+    for i in range(STEPS)
+]
+
+
+def run(threads: int, shared: bool) -> float:
+    agents = [EmoCoreAgent(PROFILE, thread_safe=True) for _ in range(1 if shared else threads)]
+    sessions = [GovernedSession.of(agent) for agent in agents]
+    barrier = threading.Barrier(threads + 1)
+
+    def work(worker):
+        observe = sessions[0 if shared else worker].observe_decision
+        barrier.wait()
+        for obs in OBSERVATIONS:
+            observe(obs)
+
+    pool = [threading.Thread(target=work, args=(w,)) for w in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    expected = threads * STEPS if shared else STEPS
+    assert all(agent.engine.step_count == expected for agent in agents)
+    return threads * STEPS / elapsed
+
+
+def stress_test_concurrency():
+    print("=" * 60)
+    print("STRESS TEST: CONCURRENT GOVERNANCE")
+    print("=" * 60)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]} | GIL {'enabled' if gil else 'disabled'} | CPUs {os.cpu_count()}")
+
+    base = None
+    for threads in (1, 2, 4, 8):
+        independent = run(threads, shared=False)
+        shared = run(threads, shared=True)
+        base = base or independent
+        print(f"Threads {threads} | independent: {independent:10,.0f} steps/s "
+              f"(x{independent / base:.2f}) | shared agent: {shared:10,.0f} steps/s")
+
+
+if __name__ == "__main__":
+    stress_test_concurrency()
@@ -0,0 +1,138 @@
+import dataclasses
+import itertools
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import pytest
+
+from emocore.clock import DeltaClock, VirtualClock
+from emocore.engine import EmoEngine
+from emocore.failures import FailureType
+from emocore.modes import Mode
+from emocore.profiles import PROFILES, ProfileType
+from emocore.signals import Signals
+
+SIGNALS = [
+    Signals(reward=0.0, novelty=0.0, urgency=1.0),
+    Signals(reward=0.0, novelty=0.0, urgency=0.0),
+    Signals(reward=-0.4, novelty=0.1, urgency=0.3, difficulty=0.6),
+    Signals(reward=0.5, novelty=0.2, urgency=0.1),
+    Signals(reward=0.3, novelty=1.0, urgency=0.0),
+    Signals(reward=0.1, novelty=0.0, urgency=0.0),
+]
+
+
+def _sequential(engine, signals, n, dt):
+    halt_step = None
+    result = None
+    for _ in range(n):
+        result = engine.step(signals.reward, signals.novelty, signals.urgency, signals.difficulty, dt=dt)
+        if result.halted:
+            halt_step = engine.step_count
+            break
+    return result, halt_step
+
+
+def _count_steps(engine):
+    calls = [0]
+    original = engine.step
+
+    def counted(*args, **kwargs):
+        calls[0] += 1
+        return original(*args, **kwargs)
+
+    engine.step = counted
+    return calls
+
+
+@pytest.mark.parametrize("profile_type,signals,dt", list(itertools.product(ProfileType, SIGNALS, [0.0, 1.0])))
+def test_advance_matches_sequential_steps(profile_type, signals, dt):
+    profile = dataclasses.replace(PROFILES[profile_type], max_steps=5_000)
+    fast = EmoEngine(profile, clock=DeltaClock())
+    slow = EmoEngine(profile, clock=DeltaClock())
+
+    out = fast.advance(signals, 4_000, dt=dt)
+    res, halt_step = _sequential(slow, signals, 4_000, dt)
+
+    assert fast.step_count == slow.step_count
+    assert out.steps == slow.step_count
+    assert out.halt_step == halt_step
+    assert out.result.halted == res.halted
+    assert out.result.failure == res.failure
+    assert out.result.mode == res.mode
+    for field in ("effort", "risk", "exploration", "persistence"):
+        assert getattr(fast.budget, field) == pytest.approx(getattr(slow.budget, field), abs=1e-9)
+    for field in ("confidence", "frustration", "curiosity", "arousal", "risk"):
+        assert getattr(fast.state, field) == pytest.approx(getattr(slow.state, field), rel=1e-9, abs=1e-9)
+    assert fast.no_progress_steps == slow.no_progress_steps
+    assert fast.clock.now() == pytest.approx(slow.clock.now())
+
+
+def test_advance_is_sublinear_between_boundaries():
+    profile = dataclasses.replace(PROFILES[ProfileType.BALANCED], max_steps=10**7)
+    engine = EmoEngine(profile, clock=DeltaClock())
+    calls = _count_steps(engine)
+
+    out = engine.advance(Signals(reward=0.5, novelty=0.2), 1_000_000, dt=1.0)
+
+    assert out.steps == 1_000_000
+    assert out.halt_step is None
+    assert engine.step_count == 1_000_000
+    assert calls[0] < 100
+
+
+def test_advance_reports_exact_halt_step():
+    profile = PROFILES[ProfileType.BALANCED]
+    fast = EmoEngine(profile, clock=DeltaClock())
+    slow = EmoEngine(profile, clock=DeltaClock())
+    signals = Signals(reward=0.0, novelty=0.0, urgency=1.0)
+
+    out = fast.advance(signals, 10_000)
+    _, halt_step = _sequential(slow, signals, 10_000, None)
+
+    assert out.halt_step == halt_step
+    assert out.result.mode == Mode.HALTED
+    assert out.result.failure != FailureType.NONE
+    assert out.steps == halt_step
+
+
+def test_advance_external_fuse_step():
+    profile = dataclasses.replace(PROFILES[ProfileType.BALANCED], max_steps=777)
+    engine = EmoEngine(profile, clock=DeltaClock())
+
+    out = engine.advance(Signals(reward=0.5, novelty=0.2), 10_000)
+
+    assert out.halt_step == 777
+    assert out.result.failure == FailureType.EXTERNAL
+
+
+def test_advance_on_halted_engine_does_not_evolve():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+    engine.advance(Signals(reward=0.0, urgency=1.0), 10_000)
+    steps = engine.step_count
+
+    out = engine.advance(Signals(reward=1.0, novelty=1.0), 50)
+
+    assert out.steps == 0
+    assert out.halt_step is None
+    assert out.result.halted is True
+    assert engine.step_count == steps
+
+
+def test_advance_zero_and_negative():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=VirtualClock())
+    out = engine.advance(Signals(reward=0.5), 0)
+    assert out.steps == 0
+    assert out.result.mode == Mode.IDLE
+    with pytest.raises(ValueError):
+        engine.advance(Signals(reward=0.5), -1)
+
+
+def test_advance_with_monotonic_clock_steps_sequentially():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED])
+    calls = _count_steps(engine)
+
+    out = engine.advance(Signals(reward=0.5, novelty=0.2), 30)
+
+    assert out.steps == 30
+    assert calls[0] == 30
@@ -0,0 +1,187 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import dataclasses
+import gc
+import pickle
+import tracemalloc
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.behavior import BehaviorBudget
+from emocore.clock import DeltaClock
+from emocore.engine import EmoEngine
+from emocore.failures import FailureType
+from emocore.guarantees import StepResult
+from emocore.interface import step, Signals
+from emocore.modes import Mode
+from emocore.profiles import PROFILES, ProfileType
+from emocore.result import EngineResult
+from emocore.state import PressureState
+
+STEPS = 5_000
+
+
+def _endless_profile():
+    # Never halts: every measured step runs the full state machine
+    return dataclasses.replace(
+        PROFILES[ProfileType.BALANCED],
+        max_steps=10**9,
+        exhaustion_threshold=-1.0,
+        max_risk=10.0,
+        max_exploration=10.0,
+    )
+
+
+def _traced(fn, steps=STEPS):
+    """
+    (retained, peak) bytes traced over a window of `steps` fn(i) calls.
+
+    Tracing runs over two consecutive windows and only the second is
+    measured: the first absorbs one-time allocations (caches, interned
+    objects, specialization) whose timing varies across Python versions.
+    """
+    for i in range(100):
+        fn(i)  # Warm up caches and free lists
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i in range(steps):
+            fn(i)
+        gc.collect()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        for i in range(steps):
+            fn(i)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - base, peak - base
+
+
+def _signals(i):
+    return (0.3 if i % 3 else -0.2, 0.2, 0.1, 0.1)
+
+
+@pytest.mark.parametrize("method", ["step", "step_view"])
+def test_engine_step_allocations_are_bounded(method):
+    engine = EmoEngine(_endless_profile(), clock=DeltaClock())
+    call = getattr(engine, method)
+    retained, peak = _traced(lambda i: call(*_signals(i)))
+
+    # Nothing accumulates across steps, and a step's transient objects fit
+    # in a couple of KiB regardless of how many steps ran.
+    assert retained < 2048
+    assert peak < 4096
+
+
+def test_step_view_allocates_less_than_step():
+    a = EmoEngine(_endless_profile(), clock=DeltaClock())
+    b = EmoEngine(_endless_profile(), clock=DeltaClock())
+    _, step_peak = _traced(lambda i: a.step(*_signals(i)))
+    _, view_peak = _traced(lambda i: b.step_view(*_signals(i)))
+    assert view_peak <= step_peak
+
+
+def test_interface_step_allocations_are_bounded():
+    agent = EmoCoreAgent(_endless_profile(), clock=DeltaClock())
+    signals = Signals(reward=0.3, novelty=0.2, urgency=0.1, difficulty=0.1)
+    retained, peak = _traced(lambda i: step(agent, signals))
+    assert retained < 2048
+    assert peak < 4096
+
+
+def test_step_view_matches_step():
+    profile = PROFILES[ProfileType.AGGRESSIVE]
+    a = EmoEngine(profile, clock=DeltaClock())
+    b = EmoEngine(profile, clock=DeltaClock())
+    for i in range(profile.max_steps + 5):
+        args = (-0.1, 0.4, 0.3, 0.2, 0.9)
+        expected = a.step(*args)
+        view = b.step_view(*args)
+        assert view.freeze() == expected
+        assert view.budget == expected.budget
+        assert view.state == expected.state
+        assert view.pressure_log == expected.pressure_log
+        assert view.step_count == a.step_count
+    assert view.halted and view.mode == Mode.HALTED
+    assert view.pressure_log is None
+
+
+def test_step_view_is_reused():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+    first = engine.step_view(0.5, 0.1, 0.1)
+    frozen = first.freeze()
+    second = engine.step_view(-0.5, 0.1, 0.9)
+    assert first is second
+    assert frozen.budget != second.budget
+
+
+def test_engine_result_is_immutable():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+    result = engine.step(0.5, 0.1, 0.1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.halted = True
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.budget = BehaviorBudget(1.0, 1.0, 1.0, 1.0)
+    with pytest.raises(AttributeError):
+        result.extra = 1
+
+
+def test_lazy_views_are_snapshots():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+    result = engine.step(-0.5, 0.1, 0.9, 0.5)
+    engine.step(-0.5, 0.1, 0.9, 0.5)  # Engine moves on before the views are read
+
+    state = engine.state
+    assert result.state != state
+    assert result.pressure_log["frustration"] < state.frustration
+    assert result.pressure_log["trust"] == 1.0
+    assert result.pressure_log is result.pressure_log  # Built once
+
+
+def test_results_compare_and_pickle_like_records():
+    explicit = EngineResult(
+        state=PressureState(confidence=0.1),
+        budget=BehaviorBudget(1.0, 0.0, 1.0, 0.0),
+        halted=False,
+        failure=FailureType.NONE,
+        reason=None,
+        mode=Mode.IDLE,
+        pressure_log={"confidence": 0.1},
+    )
+    lazy = EngineResult.lazy(
+        (0.1, 0.0, 0.0, 0.0, 0.0), None, explicit.budget, False, FailureType.NONE, None, Mode.IDLE,
+    )
+    assert lazy.state == explicit.state
+    assert lazy.pressure_log is None
+    assert pickle.loads(pickle.dumps(explicit)) == explicit
+
+    agent = EmoCoreAgent(clock=DeltaClock())
+    result = step(agent, Signals(reward=0.2))
+    assert isinstance(result, StepResult)
+    assert result.state == dict(
+        confidence=result.pressure_log["confidence"],
+        frustration=result.pressure_log["frustration"],
+        curiosity=result.pressure_log["curiosity"],
+        arousal=result.pressure_log["arousal"],
+        risk=result.pressure_log["risk"],
+    )
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_results_are_frozen_dataclasses():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+    result = engine.step(0.5, 0.1, 0.1)
+    public = step(EmoCoreAgent(clock=DeltaClock()), Signals(reward=0.2))
+    for r in (result, public):
+        assert dataclasses.is_dataclass(r)
+        assert [f.name for f in dataclasses.fields(r)][:7] == [
+            "state", "budget", "halted", "failure", "reason", "mode", "pressure_log",
+        ]
+        assert dataclasses.asdict(r)["pressure_log"] == r.pressure_log
+        changed = dataclasses.replace(r, reason="x")
+        assert changed.reason == "x" and changed.state == r.state
+        assert pickle.loads(pickle.dumps(r)) == r
+    assert dataclasses.asdict(result)["state"] == dataclasses.asdict(result.state)
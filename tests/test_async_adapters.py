@@ -0,0 +1,165 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import asyncio
+
+import pytest
+
+from emocore.adapters import LLMLoopAdapter, ToolCallingAgentAdapter
+from emocore.agent import EmoCoreAgent
+from emocore.async_adapters import (
+    AsyncLLMLoopAdapter,
+    AsyncToolCallingAgentAdapter,
+    GovernanceWorker,
+)
+from emocore.clock import DeltaClock
+from emocore.extractor import ToolAgentExtractor
+
+
+def _agent():
+    return EmoCoreAgent(clock=DeltaClock())
+
+
+@pytest.mark.parametrize("offload", [False, True])
+def test_async_llm_adapter_matches_sync(offload):
+    responses = [f"step {i} says " + "the same thing again " * (i % 3) for i in range(20)]
+
+    sync = LLMLoopAdapter(_agent())
+    expected = []
+    for text in responses:
+        sync.start_step()
+        expected.append(sync.end_step("gen", "success", tokens_used=50, response=text))
+
+    async def run():
+        worker = GovernanceWorker() if offload else None
+        adapter = AsyncLLMLoopAdapter(_agent(), worker=worker)
+        results = []
+        for text in responses:
+            adapter.start_step()
+            results.append(await adapter.end_step("gen", "success", tokens_used=50, response=text))
+        if worker:
+            worker.close()
+        return results
+
+    for got, want in zip(asyncio.run(run()), expected):
+        assert (got.mode, got.failure, got.budget) == (want.mode, want.failure, want.budget)
+
+
+@pytest.mark.parametrize("offload", [False, True])
+def test_async_monitor_records_outcomes(offload):
+    async def run():
+        async with GovernanceWorker() as worker:
+            adapter = AsyncToolCallingAgentAdapter(_agent(), worker=worker if offload else None)
+
+            async with adapter.monitor("search") as ok:
+                await asyncio.sleep(0)
+                ok.success(env_delta=0.8)
+
+            with pytest.raises(ValueError):
+                async with adapter.monitor("parse") as failed:
+                    raise ValueError("bad json")
+
+            with pytest.raises(asyncio.TimeoutError):
+                async with adapter.monitor("slow", timeout=0.01) as slow:
+                    await asyncio.sleep(10)
+            return adapter, ok, failed, slow
+
+    adapter, ok, failed, slow = asyncio.run(run())
+    assert ok.status == "success" and ok.governance_result is not None
+    assert failed.status == "error" and failed.error_message == "bad json"
+    assert slow.status == "timeout" and slow.governance_result is not None
+    assert isinstance(adapter.agent._extractor, ToolAgentExtractor)
+    assert adapter.agent.engine.step_count == 3
+
+
+def test_async_monitor_matches_sync_monitor():
+    sync = ToolCallingAgentAdapter(_agent())
+    with sync.monitor("search") as expected:
+        expected.success(env_delta=0.5)
+
+    async def run():
+        adapter = AsyncToolCallingAgentAdapter(_agent())
+        async with adapter.monitor("search") as audit:
+            audit.success(env_delta=0.5)
+        return audit
+
+    got = asyncio.run(run()).governance_result
+    want = expected.governance_result
+    assert (got.mode, got.failure, got.budget.effort) == (want.mode, want.failure, want.budget.effort)
+
+
+def test_cancelled_call_is_recorded_without_blocking_cancellation():
+    async def run():
+        async with GovernanceWorker() as worker:
+            adapter = AsyncToolCallingAgentAdapter(_agent(), worker=worker)
+            audits = []
+
+            async def call():
+                async with adapter.monitor("fetch") as audit:
+                    audits.append(audit)
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(call())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        return adapter, audits[0]
+
+    adapter, audit = asyncio.run(run())
+    assert audit.status == "failure" and audit.error_message == "cancelled"
+    assert audit.governance_result is not None
+    assert adapter.agent.engine.step_count == 1
+
+
+def test_worker_batches_concurrent_steps():
+    async def run():
+        async with GovernanceWorker() as worker:
+            adapter = AsyncToolCallingAgentAdapter(_agent(), worker=worker)
+
+            async def call(i):
+                async with adapter.monitor(f"tool_{i % 5}") as audit:
+                    audit.success(env_delta=0.3)
+                return audit.governance_result
+
+            results = await asyncio.gather(*(call(i) for i in range(80)))
+            return adapter, worker, results
+
+    adapter, worker, results = asyncio.run(run())
+    assert adapter.agent.engine.step_count == 80
+    assert worker.batches < 80
+    assert all(r is not None for r in results)
+
+
+def test_worker_delivers_step_errors_to_the_caller():
+    async def run():
+        async with GovernanceWorker() as worker:
+            def boom():
+                raise RuntimeError("step failed")
+            with pytest.raises(RuntimeError, match="step failed"):
+                await worker.submit(boom)
+            assert await worker.submit(lambda: 42) == 42
+
+    asyncio.run(run())
+
+
+def test_worker_never_leaves_futures_pending():
+    async def run():
+        worker = GovernanceWorker()
+        assert await worker.submit(lambda: 1) == 1
+        worker.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            worker.submit(lambda: 2)
+
+        # The executor goes away under queued steps: all of them fail
+        worker = GovernanceWorker()
+        futures = [worker.submit(lambda i=i: i) for i in range(3)]
+        worker._executor.shutdown(wait=True)
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(future, timeout=5.0)
+        assert worker._drain is None and not worker._pending
+        worker.close()
+
+    asyncio.run(run())
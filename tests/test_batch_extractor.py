@@ -0,0 +1,170 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import random
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from emocore.batch_extractor import (
+    BatchLLMAgentExtractor,
+    BatchRuleBasedExtractor,
+    BatchToolAgentExtractor,
+)
+from emocore.extractor import LLMAgentExtractor, RuleBasedExtractor, ToolAgentExtractor
+from emocore.interface import step_many
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.observation import Observation
+
+VARIANTS = [
+    (RuleBasedExtractor, BatchRuleBasedExtractor, {}),
+    (LLMAgentExtractor, BatchLLMAgentExtractor, {"token_limit": 5000}),
+    (ToolAgentExtractor, BatchToolAgentExtractor, {}),
+]
+
+
+def _observation(rng):
+    # Small action / delta alphabets so cycling and repetition paths trigger
+    result = rng.choice(["success", "success", "failure", "timeout", "error", "ok"])
+    return Observation(
+        action=f"tool_{rng.randrange(6)}",
+        result=result,
+        env_state_delta=rng.choice([0.0, 0.005, 0.1, 0.3, round(rng.uniform(-1, 1), 3)]),
+        agent_state_delta=rng.choice([0.0, 0.1, 0.5, 0.9, rng.random()]),
+        elapsed_time=rng.uniform(0.0, 400.0),
+        tokens_used=rng.randrange(0, 400),
+        error="boom" if result == "error" or rng.random() < 0.05 else None,
+    )
+
+
+def _scalar_values(extractor, obs):
+    s = extractor.extract(obs)
+    return [s.reward, s.novelty, s.urgency, s.difficulty, s.trust]
+
+
+@pytest.mark.parametrize("scalar_cls, batch_cls, kwargs", VARIANTS)
+def test_batch_matches_scalar_exactly(scalar_cls, batch_cls, kwargs):
+    rng = random.Random(11)
+    n = 24
+    scalars = [scalar_cls(**kwargs) for _ in range(n)]
+    batch = batch_cls(n, **kwargs)
+
+    for step in range(80):
+        # A random subset of sessions, in random order, observes each step
+        sessions = rng.sample(range(n), rng.randrange(1, n + 1))
+        observations = [_observation(rng) for _ in sessions]
+        out = batch.extract(observations, sessions=sessions)
+        expected = [_scalar_values(scalars[i], obs) for i, obs in zip(sessions, observations)]
+        assert out.tolist() == expected
+
+    for i in range(n):
+        assert batch.current_reward[i] == scalars[i].current_reward
+        assert batch.novelty_debt[i] == scalars[i].novelty_debt
+        assert batch.failure_streak[i] == scalars[i].failure_streak
+
+
+@pytest.mark.parametrize("scalar_cls, batch_cls, kwargs", VARIANTS)
+def test_batch_matches_scalar_in_periodic_loops(scalar_cls, batch_cls, kwargs):
+    rng = random.Random(5)
+    n = 6
+    scalars = [scalar_cls(**kwargs) for _ in range(n)]
+    batch = batch_cls(n, **kwargs)
+    cycles = [[f"loop{i}_{j}" for j in range(2 + 5 * i)] for i in range(n)]
+    for step in range(120):
+        observations = []
+        for i in range(n):
+            obs = _observation(rng)
+            observations.append(Observation(
+                cycles[i][step % len(cycles[i])], obs.result, obs.env_state_delta,
+                obs.agent_state_delta, obs.elapsed_time, obs.tokens_used, obs.error,
+            ))
+        out = batch.extract(observations)
+        assert out.tolist() == [_scalar_values(e, o) for e, o in zip(scalars, observations)]
+    assert batch.loop_period.tolist() == [e.loop_period for e in scalars]
+    assert all(batch.loop_period > 0)
+
+
+def test_columnar_input_matches_observations():
+    rng = random.Random(3)
+    n = 8
+    a = BatchLLMAgentExtractor(n)
+    b = BatchLLMAgentExtractor(n)
+    for _ in range(20):
+        observations = [_observation(rng) for _ in range(n)]
+        columns = {
+            "action": [o.action for o in observations],
+            "result": np.array([o.result for o in observations]),
+            "env_state_delta": np.array([o.env_state_delta for o in observations]),
+            "agent_state_delta": [o.agent_state_delta for o in observations],
+            "elapsed_time": np.array([o.elapsed_time for o in observations]),
+            "tokens_used": np.array([o.tokens_used for o in observations]),
+            "error": [o.error for o in observations],
+        }
+        assert a.extract(observations).tolist() == b.extract(columns).tolist()
+
+
+def test_reset_selected_sessions():
+    batch = BatchRuleBasedExtractor(3)
+    fresh = RuleBasedExtractor()
+    obs = Observation("a", "failure", 0.0, 0.9, 10.0)
+    for _ in range(5):
+        batch.extract([obs] * 3)
+    batch.reset([1])
+    out = batch.extract([obs] * 3)
+    assert out[1].tolist() == _scalar_values(fresh, obs)
+    assert out[0].tolist() == out[2].tolist() != out[1].tolist()
+
+
+def test_batch_rejects_bad_sessions():
+    batch = BatchRuleBasedExtractor(4)
+    obs = Observation("a", "success", 0.5, 0.1, 1.0)
+    with pytest.raises(ValueError):
+        batch.extract([obs, obs], sessions=[1, 1])
+    with pytest.raises(IndexError):
+        batch.extract([obs], sessions=[4])
+    with pytest.raises(ValueError):
+        batch.extract([obs, obs])  # Defaults to all 4 sessions
+    with pytest.raises(ValueError):
+        batch.extract({"action": ["a"], "result": ["success"]}, sessions=[0])
+
+
+def test_output_feeds_step_many():
+    batch = BatchRuleBasedExtractor(1)
+    rows = np.vstack([
+        batch.extract([Observation(f"a{i}", "success", 0.4, 0.1, 1.0)]) for i in range(10)
+    ])
+    agent = EmoCoreAgent(clock=DeltaClock())
+    results = list(step_many(agent, rows))
+    assert len(results) == 10
+    assert results[-1].pressure_log["trust"] == rows[-1, 4]
+
+
+def test_memory_does_not_grow_with_distinct_states():
+    import gc
+    import tracemalloc
+    n = 8
+    batch = BatchRuleBasedExtractor(n)
+    scalars = [RuleBasedExtractor() for _ in range(n)]
+
+    def window(start):
+        for step in range(start, start + 300):
+            # Every fingerprint is new: the result string never repeats
+            observations = [Observation(f"act{i}", f"r{step}_{i}", 0.1, 0.1, 1.0) for i in range(n)]
+            out = batch.extract(observations)
+            assert out.tolist() == [list(e.extract_values(o)) for e, o in zip(scalars, observations)]
+
+    window(0)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        window(300)  # Absorbs one-time allocations
+        gc.collect()
+        base = tracemalloc.get_traced_memory()[0]
+        window(600)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    assert retained < 300 * n * 8  # Well under one entry per distinct state
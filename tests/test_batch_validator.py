@@ -0,0 +1,87 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import copy
+import random
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from emocore.batch_validator import BatchSignalValidator
+from emocore.validator import SignalValidator, ValidationError
+
+
+def _row(rng, wild):
+    # Small alternating rewards exercise oscillation; wild rows exercise
+    # clamping, delta limiting and NaN
+    if wild:
+        pick = lambda: rng.choice([rng.uniform(-1.5, 1.5), float("nan"), 0.0, 1.0])
+        return [pick() for _ in range(5)]
+    return [rng.choice([-0.2, 0.2, 0.0, 0.1]), rng.random(), 0.3 * rng.random(), 0.1, 1.0]
+
+
+def _scalar(validator, row):
+    try:
+        return list(validator.validate_values(*row)), None
+    except ValidationError as e:
+        return None, str(e)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("wild", [False, True])
+def test_matches_scalar_validators(strict, wild):
+    rng = random.Random(int(strict) * 2 + int(wild))
+    size = 12
+    batch = BatchSignalValidator(size, strict=strict)
+    scalars = [SignalValidator(strict=strict) for _ in range(size)]
+
+    for _ in range(80):
+        sessions = rng.sample(range(size), rng.randrange(1, size + 1))
+        rows = [_row(rng, wild) for _ in sessions]
+        saved = copy.deepcopy(scalars)
+        expected = [_scalar(scalars[i], row) for i, row in zip(sessions, rows)]
+        errors = [error for _, error in expected if error is not None]
+        if errors:
+            with pytest.raises(ValidationError) as excinfo:
+                batch.validate(np.array(rows), sessions=sessions)
+            assert str(excinfo.value) == errors[0]
+            # The batch is all-or-nothing: roll the reference back too
+            scalars = saved
+            continue
+        out = batch.validate(np.array(rows), sessions=sessions)
+        assert out.tolist() == [values for values, _ in expected]
+
+
+def test_flip_counter_matches_full_rescan():
+    rng = random.Random(5)
+    batch = BatchSignalValidator(3)
+    rewards = [[], [], []]
+    for _ in range(200):
+        rows = np.array([[rng.choice([-0.2, 0.2, 0.0]), 0, 0, 0, 1] for _ in range(3)])
+        out = batch.validate(rows)
+        for i in range(3):
+            rewards[i] = (rewards[i] + [out[i, 0]])[-batch.OSCILLATION_WINDOW:]
+            flips = sum((a > 0 > b) or (a < 0 < b) for a, b in zip(rewards[i], rewards[i][1:]))
+            assert batch.flip_count[i] == flips
+
+
+def test_strict_failure_leaves_every_session_unchanged():
+    batch = BatchSignalValidator(2, strict=True)
+    batch.validate(np.zeros((2, 5)))
+    before = batch.last.copy(), batch.step_count.copy()
+    with pytest.raises(ValidationError, match="Range violations"):
+        batch.validate(np.array([[0.1, 0, 0, 0, 0], [2.0, 0, 0, 0, 0]]))
+    assert (batch.last == before[0]).all() and (batch.step_count == before[1]).all()
+
+
+def test_reset_and_shape_checks():
+    batch = BatchSignalValidator(2)
+    batch.validate(np.ones((2, 5)))
+    batch.reset([1])
+    out = batch.validate(np.array([[0.0] * 5, [-1.0, 0, 0, 0, 0]]))
+    assert out[0, 0] == 0.5 and out[1, 0] == -1.0  # Session 1 has no previous step
+    with pytest.raises(ValueError):
+        batch.validate(np.zeros((2, 4)))
+    with pytest.raises(ValueError):
+        batch.validate(np.zeros((2, 5)), sessions=[0, 0])
@@ -0,0 +1,183 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.async_adapters import AsyncToolCallingAgentAdapter, GovernanceWorker
+from emocore.cancellation import HaltCancellation, HaltNotice, halt_notice
+from emocore.clock import DeltaClock
+from emocore.failures import FailureType
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+from emocore.session import GovernedSession
+
+PROFILE = PROFILES[ProfileType.CONSERVATIVE]
+
+
+def _near_halt(compiled=False):
+    # One step short of the step fuse: the next observe() halts (EXTERNAL)
+    agent = EmoCoreAgent(PROFILE, clock=DeltaClock(), compiled=compiled)
+    session = GovernedSession.of(agent)
+    for _ in range(PROFILE.max_steps - 1):
+        agent.step(0.3, 0.2, 0.1)
+    assert not agent.engine.halted
+    return agent, session
+
+
+OBS = Observation("final", "success", 0.3, 0.1, 1.0)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_halt_cancels_bound_tasks_with_failure(compiled):
+    agent, session = _near_halt(compiled)
+    seen = []
+
+    async def tool():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError as e:
+            seen.append(halt_notice(e))
+            raise
+
+    async def run():
+        cancellation = HaltCancellation.of(agent)
+        tasks = [cancellation.bind(asyncio.create_task(tool())) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert len(cancellation) == 3
+        assert session.observe(OBS).halted
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return cancellation, results
+
+    cancellation, results = asyncio.run(run())
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert [n.failure for n in seen] == [FailureType.EXTERNAL] * 3
+    assert isinstance(seen[0], HaltNotice) and seen[0].reason == "max_steps"
+    assert cancellation.cancelled == 3
+    assert len(cancellation) == 0
+
+
+def test_halt_from_another_thread_cancels_on_the_loop():
+    agent, session = _near_halt()
+
+    async def run():
+        cancellation = HaltCancellation.of(agent)
+        task = cancellation.bind(asyncio.create_task(asyncio.sleep(10)))
+        await asyncio.get_running_loop().run_in_executor(None, session.observe, OBS)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+
+def test_concurrent_futures_pending_are_cancelled_running_complete():
+    agent, session = _near_halt()
+    cancellation = HaltCancellation.of(agent)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        running = cancellation.bind(pool.submit(blocking))
+        started.wait(5)
+        pending = cancellation.bind(pool.submit(blocking))
+        session.observe(OBS)
+        release.set()
+        assert pending.cancelled()
+        assert running.result() == "done"
+    assert cancellation.cancelled == 1
+
+
+def test_completed_work_is_forgotten_and_late_binds_cancel_until_reset():
+    agent, session = _near_halt()
+
+    async def run():
+        cancellation = HaltCancellation.of(agent)
+        done = cancellation.bind(asyncio.create_task(asyncio.sleep(0)))
+        await done
+        assert len(cancellation) == 0
+
+        session.observe(OBS)
+        late = cancellation.bind(asyncio.create_task(asyncio.sleep(10)))
+        with pytest.raises(asyncio.CancelledError):
+            await late
+
+        agent.reset("operator")
+        fresh = cancellation.bind(asyncio.create_task(asyncio.sleep(0)))
+        await fresh
+        return cancellation
+
+    assert asyncio.run(run()).cancelled == 1
+
+
+def test_halting_task_is_not_cancelled_and_probes_do_not_fire():
+    agent, session = _near_halt()
+
+    async def run():
+        cancellation = HaltCancellation.of(agent)
+
+        async def governed():
+            assert session.halted is False
+            assert session.probe(OBS) != 0  # Would halt, but only on a fork
+            assert cancellation.notice is None
+            result = session.observe(OBS)
+            await asyncio.sleep(0)
+            return result
+
+        return await cancellation.bind(asyncio.create_task(governed()))
+
+    assert asyncio.run(run()).halted
+
+
+def test_halting_task_is_not_cancelled_when_governed_on_a_worker():
+    agent, _ = _near_halt()
+
+    async def run():
+        cancellation = HaltCancellation.of(agent)
+        other = cancellation.bind(asyncio.create_task(asyncio.sleep(10)))
+        async with GovernanceWorker() as worker:
+            adapter = AsyncToolCallingAgentAdapter(agent, worker=worker)
+
+            async def governed():
+                async with adapter.monitor("final") as audit:
+                    audit.success(env_delta=0.3)
+                await asyncio.sleep(0)  # A pending cancellation would land here
+                return audit.governance_result
+
+            result = await cancellation.bind(asyncio.create_task(governed()))
+        with pytest.raises(asyncio.CancelledError):
+            await other
+        return result
+
+    result = asyncio.run(run())
+    assert result.halted and result.failure is FailureType.EXTERNAL
+
+
+def test_halt_after_the_owning_loop_closed():
+    agent, session = _near_halt()
+    cancellation = HaltCancellation.of(agent)
+    loop = asyncio.new_event_loop()
+    orphan = cancellation.bind(loop.create_future())
+    loop.close()
+    result = session.observe(OBS)  # Must not raise: the halt is committed
+    assert result.halted and agent.engine.halted
+    assert not orphan.done() and len(cancellation) == 0
+    assert cancellation.cancelled == 0
+
+
+def test_registry_is_per_agent_and_can_be_closed():
+    agent, _ = _near_halt()
+    cancellation = HaltCancellation.of(agent)
+    assert HaltCancellation.of(agent) is cancellation
+    assert HaltCancellation.of(EmoCoreAgent()) is not cancellation
+    cancellation.close()
+    assert agent.engine._halt_listeners == []
+    assert HaltCancellation.of(agent) is not cancellation
@@ -0,0 +1,126 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock, MonotonicClock, VirtualClock
+from emocore.engine import EmoEngine
+from emocore.interface import observe, step, Signals
+from emocore.modes import Mode
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+
+
+def test_default_clock_is_monotonic_and_honors_dt():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED])
+    assert isinstance(engine.clock, MonotonicClock)
+
+    engine.step(0.5, 0.1, 0.0, dt=1000.0)
+    assert engine.last_dt == 1000.0
+    # No dt: wall time since the previous step
+    engine.step(0.5, 0.1, 0.0)
+    assert 0.0 <= engine.last_dt < 1000.0
+    with pytest.raises(ValueError):
+        engine.clock.tick(-1.0)
+
+
+def test_default_clock_dt_drives_time_decay():
+    short = EmoCoreAgent()
+    long = EmoCoreAgent()
+    r_short = short.step(1.0, 1.0, 1.0, dt=0.0)
+    r_long = long.step(1.0, 1.0, 1.0, dt=10.0)
+    assert r_long.budget.persistence < r_short.budget.persistence
+
+
+def test_delta_clock_honors_caller_dt():
+    clock = DeltaClock()
+    assert clock.tick(0.25) == 0.25
+    assert clock.tick() == 1.0
+    assert clock.now() == 1.25
+    with pytest.raises(ValueError):
+        clock.tick(-1.0)
+
+
+def test_virtual_clock_moves_only_when_advanced():
+    clock = VirtualClock()
+    assert clock.tick(5.0) == 0.0
+    clock.advance(0.5)
+    assert clock.tick() == 0.5
+    assert clock.tick() == 0.0
+    with pytest.raises(ValueError):
+        clock.advance(-0.1)
+
+
+def test_time_decay_is_deterministic_under_delta_clock():
+    """Same dt sequence => bit-identical trajectories, independent of host speed."""
+    def run():
+        agent = EmoCoreAgent(clock=DeltaClock())
+        agent.engine.state = agent.engine.state.integrate(
+            type(agent.engine.state)(confidence=1.0, arousal=1.0)
+        )
+        return [agent.step(0.1, 0.2, 0.0, dt=0.2).budget for _ in range(20)]
+
+    assert run() == run()
+
+
+def test_time_decay_scales_with_caller_dt():
+    short = EmoCoreAgent(clock=DeltaClock())
+    long = EmoCoreAgent(clock=DeltaClock())
+
+    r_short = short.step(1.0, 1.0, 1.0, dt=0.0)
+    r_long = long.step(1.0, 1.0, 1.0, dt=10.0)
+
+    assert r_long.budget.persistence < r_short.budget.persistence
+    assert r_long.budget.exploration <= r_short.budget.exploration
+
+
+def test_recovery_delay_respected_under_virtual_clock():
+    """Recovery only happens once virtual time reaches recovery_delay."""
+    profile = PROFILES[ProfileType.BALANCED]
+    clock = VirtualClock()
+    agent = EmoCoreAgent(profile, clock=clock)
+
+    r = agent.step(-0.5, 0.0, 0.0)
+    while r.mode != Mode.RECOVERING and not r.halted:
+        r = agent.step(-0.5, 0.0, 0.0)
+    assert not r.halted
+
+    # No virtual time passes: no recovery boost on the next step
+    frozen = agent.step(0.0, 0.0, 0.0)
+    assert frozen.mode == Mode.RECOVERING
+    assert frozen.budget.effort <= r.budget.effort
+
+    clock.advance(profile.recovery_delay)
+    recovered = agent.step(0.0, 0.0, 0.0)
+    assert recovered.mode == Mode.RECOVERING
+    assert recovered.budget.effort > frozen.budget.effort
+
+
+def test_interface_and_observe_pass_dt_through():
+    agent = EmoCoreAgent(clock=DeltaClock())
+
+    step(agent, Signals(reward=0.5), dt=0.3)
+    assert agent.engine.clock.now() == pytest.approx(0.3)
+
+    obs = Observation(
+        action="read", result="success",
+        env_state_delta=0.3, agent_state_delta=0.1, elapsed_time=1.0
+    )
+    observe(agent, obs, dt=0.7)
+    assert agent.engine.clock.now() == pytest.approx(1.0)
+
+
+def test_simulation_runs_at_cpu_speed():
+    """A long virtual-time run does not wait on the wall clock."""
+    import time
+    import dataclasses
+    profile = dataclasses.replace(PROFILES[ProfileType.BALANCED], max_steps=10_000)
+    agent = EmoCoreAgent(profile, clock=DeltaClock())
+
+    start = time.monotonic()
+    for _ in range(2_000):
+        r = agent.step(0.2, 0.1, 0.0, dt=60.0)
+        if r.halted:
+            break
+    assert time.monotonic() - start < 5.0
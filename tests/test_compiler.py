@@ -0,0 +1,104 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import dataclasses
+import gc
+import random
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.compiler import compile_profile
+from emocore.engine import EmoEngine
+from emocore.interface import step, Signals
+from emocore.profiles import PROFILES, ProfileType, Profile
+
+EXTRA_PROFILES = [
+    Profile(),
+    # No recovery rate, no time decay, no stagnation response, no risk limit
+    dataclasses.replace(
+        PROFILES[ProfileType.BALANCED],
+        recovery_rate=0.0,
+        time_exploration_decay=0.0,
+        time_persistence_decay=0.0,
+        exploration_decay=0.0,
+        stagnation_effort_scale=1.0,
+        stagnation_persistence_scale=1.0,
+        max_risk=float("inf"),
+    ),
+]
+
+
+@pytest.mark.parametrize("profile", list(PROFILES.values()) + EXTRA_PROFILES)
+@pytest.mark.parametrize("seed", range(5))
+def test_compiled_step_is_identical(profile, seed):
+    rng = random.Random(seed)
+    generic = EmoEngine(profile, clock=DeltaClock())
+    compiled = EmoEngine(profile, clock=DeltaClock(), compiled=True)
+
+    for _ in range(300):
+        args = (
+            rng.choice([0.0, -0.2, rng.uniform(-1.0, 1.0)]),
+            rng.random(),
+            rng.random(),
+            rng.random(),
+            rng.random(),
+            rng.choice([0.0, 0.3, 1.0, 2.5]),
+        )
+        expected = generic.step(*args)
+        assert compiled.step(*args) == expected
+        assert compiled.checkpoint() == generic.checkpoint()
+        if expected.halted:
+            break
+
+
+def test_compile_is_cached_per_profile():
+    profile = dataclasses.replace(PROFILES[ProfileType.CONSERVATIVE], name="cached")
+    first = compile_profile(profile)
+    assert compile_profile(profile) is first
+
+    a = EmoEngine(profile, compiled=True)
+    b = EmoEngine(profile, compiled=True)
+    assert a._step.__func__ is b._step.__func__ is first.step
+
+
+def test_cache_entries_die_with_their_profile():
+    from emocore import compiler
+    before = len(compiler._CACHE)
+    for i in range(50):
+        profile = dataclasses.replace(PROFILES[ProfileType.BALANCED], name=f"transient-{i}")
+        compile_profile(profile)
+    del profile
+    gc.collect()
+    assert len(compiler._CACHE) <= before
+
+
+def test_dead_branches_are_removed():
+    plain = compile_profile(EXTRA_PROFILES[1]).source
+    assert "if stagnating:" not in plain
+    assert "dt *" not in plain
+
+    balanced = compile_profile(PROFILES[ProfileType.BALANCED]).source
+    assert "if stagnating:" in balanced
+    assert "0.002" in balanced
+
+
+def test_compiled_engine_fork_and_advance():
+    profile = PROFILES[ProfileType.BALANCED]
+    generic = EmoEngine(profile, clock=DeltaClock())
+    compiled = EmoEngine(profile, clock=DeltaClock(), compiled=True)
+    signals = Signals(reward=0.0, novelty=0.1, urgency=0.4)
+
+    assert compiled.advance(signals, 500) == generic.advance(signals, 500)
+
+    fork = compiled.fork(compiled.checkpoint())
+    assert fork._step.__func__ is compiled._step.__func__
+
+
+def test_agent_compiled_flag():
+    plain = EmoCoreAgent(clock=DeltaClock())
+    fast = EmoCoreAgent(clock=DeltaClock(), compiled=True)
+    for _ in range(50):
+        signals = Signals(reward=-0.1, urgency=0.5, difficulty=0.3)
+        assert step(fast, signals) == step(plain, signals)
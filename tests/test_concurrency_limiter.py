@@ -0,0 +1,151 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.behavior import BehaviorBudget, ZERO_BUDGET
+from emocore.clock import DeltaClock
+from emocore.failures import FailureType
+from emocore.interface import step
+from emocore.profiles import PROFILES, ProfileType
+from emocore.signals import Signals
+from emocore.temporal.concurrency import AdaptiveConcurrencyLimiter, PermitRevoked
+
+
+def _budget(effort, persistence=1.0):
+    return BehaviorBudget(effort=effort, risk=0.5, persistence=persistence, exploration=0.5)
+
+
+def test_permits_follow_effort_and_persistence():
+    limiter = AdaptiveConcurrencyLimiter(8, min_permits=1)
+    assert limiter.permits_for(_budget(1.0)) == 8
+    assert limiter.permits_for(_budget(0.99, 0.999)) == 8
+    assert limiter.permits_for(_budget(0.5)) == 4
+    assert limiter.permits_for(_budget(0.9, 0.3)) == 3
+    assert limiter.permits_for(ZERO_BUDGET) == 1
+
+
+def test_shrinking_throttles_and_growing_releases_waiters():
+    limiter = AdaptiveConcurrencyLimiter(4)
+    assert all(limiter.try_acquire() for _ in range(4))
+    limiter.update(_budget(0.25))  # One permit: holders keep theirs
+    assert limiter.limit == 1 and limiter.in_use == 4
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(limiter.acquire(timeout=5)))
+    waiter.start()
+    for _ in range(3):
+        limiter.release()
+    time.sleep(0.05)
+    assert not got  # Still 1 in use, limit 1
+    limiter.update(_budget(1.0))
+    waiter.join(5)
+    assert got == [True] and limiter.in_use == 2
+
+
+def test_acquire_timeout_and_fifo_order():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    assert limiter.acquire()
+    assert limiter.acquire(timeout=0.01) is False
+    order = []
+
+    def worker(name):
+        limiter.acquire()
+        order.append(name)
+        limiter.release()
+
+    threads = []
+    for name in range(4):
+        t = threading.Thread(target=worker, args=(name,))
+        t.start()
+        threads.append(t)
+        while limiter.waiting <= name:
+            time.sleep(0.001)
+    limiter.release()
+    for t in threads:
+        t.join(5)
+    assert order == [0, 1, 2, 3]
+    assert limiter.in_use == 0
+
+
+def test_revoke_rejects_thread_and_async_waiters():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    limiter.acquire()
+    errors = []
+
+    def blocked():
+        try:
+            limiter.acquire()
+        except PermitRevoked as e:
+            errors.append(e.failure)
+
+    thread = threading.Thread(target=blocked)
+    thread.start()
+
+    async def run():
+        task = asyncio.create_task(limiter.acquire_async())
+        while limiter.waiting < 2:
+            await asyncio.sleep(0.001)
+        limiter.revoke(FailureType.EXHAUSTION)
+        with pytest.raises(PermitRevoked):
+            await task
+
+    asyncio.run(run())
+    thread.join(5)
+    assert errors == [FailureType.EXHAUSTION]
+    with pytest.raises(PermitRevoked):
+        limiter.try_acquire()
+    limiter.update(_budget(1.0))  # A non-halted step (after reset) lifts it
+    limiter.release()
+    assert limiter.try_acquire()
+
+
+def test_async_context_and_cancelled_waiter_returns_grant():
+    limiter = AdaptiveConcurrencyLimiter(2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_use)
+            await asyncio.sleep(0.001)
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(20)))
+        # A waiter cancelled right after being granted must not leak the permit
+        await limiter.acquire_async()
+        await limiter.acquire_async()
+        task = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0)
+        limiter.release()  # Grants the queued task...
+        task.cancel()      # ...which is cancelled before it resumes
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        limiter.release()
+
+    asyncio.run(run())
+    assert peak == 2
+    assert limiter.in_use == 0
+
+
+def test_follows_a_session_and_revokes_on_halt():
+    profile = PROFILES[ProfileType.CONSERVATIVE]
+    agent = EmoCoreAgent(profile, clock=DeltaClock())
+    limiter = AdaptiveConcurrencyLimiter(10).attach(agent)
+    for _ in range(profile.max_steps - 1):
+        limiter.follow(step(agent, Signals(0.3, 0.2, 0.1)))
+    assert not limiter.revoked and limiter.limit >= 1
+
+    limiter.acquire()
+    result = agent.step(0.3, 0.2, 0.1)  # Step fuse: halts
+    assert result.halted
+    # The halt listener revoked before any follow()
+    assert limiter.revoked and limiter.failure is FailureType.EXTERNAL
+    with pytest.raises(PermitRevoked):
+        limiter.acquire()
@@ -0,0 +1,64 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import random
+
+import pytest
+
+from emocore import decision
+from emocore.agent import EmoCoreAgent
+from emocore.behavior import BehaviorBudget
+from emocore.clock import DeltaClock
+from emocore.decision import CONTINUE, RECOVERING, HALTED_CODES
+from emocore.engine import EmoEngine
+from emocore.failures import FailureType
+from emocore.modes import Mode
+from emocore.profiles import PROFILES, ProfileType
+
+
+def test_codes_round_trip():
+    for mode in Mode:
+        for failure in FailureType:
+            code = decision.encode(mode, failure)
+            assert decision.mode_of(code) is mode
+            assert decision.failure_of(code) is failure
+            assert decision.is_halted(code) == (mode is Mode.HALTED)
+    assert decision.may_continue(CONTINUE) and decision.may_continue(RECOVERING)
+    assert len(set(HALTED_CODES.values()) | {CONTINUE, RECOVERING}) == len(FailureType) + 2
+
+
+@pytest.mark.parametrize("profile_type", list(ProfileType))
+@pytest.mark.parametrize("compiled", [False, True])
+def test_step_decision_mixes_with_step(profile_type, compiled):
+    profile = PROFILES[profile_type]
+    rng = random.Random(profile_type.value)
+    reference = EmoEngine(profile, clock=DeltaClock())
+    mixed = EmoEngine(profile, clock=DeltaClock(), compiled=compiled)
+
+    for i in range(profile.max_steps + 10):
+        args = (rng.choice([0.0, -0.3, 0.4]), rng.random(), rng.random(), rng.random())
+        expected = reference.step(*args)
+        if i % 3:
+            code = mixed.step_decision(*args)
+            assert decision.mode_of(code) is expected.mode
+            assert decision.failure_of(code) is expected.failure
+            assert mixed.current_budget() == expected.budget
+        else:
+            assert mixed.step(*args) == expected
+        assert mixed.checkpoint() == reference.checkpoint()
+
+
+def test_halted_code_carries_failure():
+    engine = EmoEngine(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+    code = CONTINUE
+    while not decision.is_halted(code):
+        code = engine.step_decision(0.0, 0.0, 1.0, 1.0)
+    assert decision.failure_of(code) is engine._failure
+    assert engine.step_decision(0.5, 0.0, 0.0) == code  # Terminal
+    assert engine.current_budget() == BehaviorBudget(0.0, 0.0, 0.0, 0.0)
+
+
+def test_agent_step_decision():
+    agent = EmoCoreAgent(clock=DeltaClock())
+    assert agent.step_decision(0.5, 0.1, 0.1) == CONTINUE
+    assert agent.current_budget() == agent.engine.budget
@@ -0,0 +1,94 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import random
+import zlib
+
+import pytest
+
+from emocore.adapters import LLMLoopAdapter
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.fingerprint import BINS, TextFingerprintIndex, shingle_hashes, similarity, sketch
+
+_VOCAB = [f"token{i}" for i in range(5000)]
+
+
+def _text(rng, words=600):
+    return " ".join(rng.choice(_VOCAB) for _ in range(words))
+
+
+def _paraphrase(text, rng):
+    # Small edits: a few inserted words and different punctuation / casing
+    words = text.split()
+    for _ in range(5):
+        words.insert(rng.randrange(len(words)), rng.choice(["indeed", "so", "well"]))
+    return ", ".join(words).upper()
+
+
+def test_sketch_similarity():
+    rng = random.Random(1)
+    a, b = _text(rng), _text(rng)
+    assert len(sketch(a)) == BINS
+    assert similarity(sketch(a), sketch(a)) == 1.0
+    assert similarity(sketch(a), sketch(b)) < 0.1
+    assert similarity(sketch(a), sketch(_paraphrase(a, rng))) > 0.8
+    assert similarity(sketch(""), sketch("")) == 1.0
+    assert similarity(sketch("short"), sketch("")) == 0.0
+
+
+def test_sketch_is_deterministic():
+    # CRC-32 based: identical across processes, unlike hash()
+    assert shingle_hashes("A b, C!") == {zlib.crc32(b"a b c")}
+    # Case and punctuation do not matter
+    assert sketch("the quick brown fox") == sketch("The quick, brown fox!")
+
+
+def test_index_reports_novelty_delta_and_clusters():
+    rng = random.Random(2)
+    index = TextFingerprintIndex()
+    a, b = _text(rng), _text(rng)
+
+    first = index.add(a)
+    assert first.novelty == 1.0 and not first.duplicate
+    second = index.add(b)
+    assert second.novelty > 0.9 and second.delta > 0.9
+    repeat = index.add(_paraphrase(a, rng))
+    # Repeats an older response: not new, but different from the previous one
+    assert repeat.duplicate and repeat.cluster == first.cluster
+    assert repeat.novelty < 0.2 and repeat.delta > 0.9
+
+
+def test_index_memory_is_fixed():
+    rng = random.Random(3)
+    index = TextFingerprintIndex(capacity=8)
+    first = _text(rng)
+    index.add(first)
+    for _ in range(50):
+        index.add(_text(rng, words=100))
+    assert len(index) == 8
+    assert sum(len(slots) for slots in index._buckets.values()) <= 8 * (BINS // 4)
+    assert not index.add(first).duplicate  # Evicted long ago
+    with pytest.raises(ValueError):
+        TextFingerprintIndex(capacity=0)
+
+
+def test_adapter_scores_raw_responses():
+    rng = random.Random(4)
+    agent = EmoCoreAgent(clock=DeltaClock())
+    adapter = LLMLoopAdapter(agent)
+    adapter.start_step()
+    obs = adapter.observation_from_text("generate", _text(rng), tokens_used=10)
+    assert obs.env_state_delta == 1.0 and obs.action.startswith("generate#")
+
+    # The same paraphrased answer over and over reads as fake progress:
+    # trust decays and the exploration budget collapses
+    answer = _text(rng)
+    varied = LLMLoopAdapter(EmoCoreAgent(clock=DeltaClock()))
+    for _ in range(20):
+        repeated = adapter.end_step("generate", "success", response=_paraphrase(answer, rng))
+        fresh = varied.end_step("generate", "success", response=_text(rng))
+    assert adapter.last_match.duplicate and not varied.last_match.duplicate
+    assert repeated.pressure_log["trust"] < 0.5 == fresh.pressure_log["trust"] - 0.5
+    assert repeated.budget.exploration < 0.1 < fresh.budget.exploration
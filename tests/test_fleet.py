@@ -0,0 +1,91 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from emocore.clock import DeltaClock
+from emocore.engine import EmoEngine
+from emocore.failures import FailureType
+from emocore.fleet import EmoFleet
+from emocore.modes import Mode
+from emocore.profiles import PROFILES, ProfileType
+
+
+def _signal_table(n_sessions, n_steps, seed=7):
+    rng = np.random.default_rng(seed)
+    reward = rng.uniform(-1.0, 1.0, (n_steps, n_sessions))
+    novelty = rng.uniform(0.0, 1.0, (n_steps, n_sessions))
+    urgency = rng.uniform(0.0, 1.0, (n_steps, n_sessions))
+    difficulty = rng.uniform(0.0, 1.0, (n_steps, n_sessions))
+    return reward, novelty, urgency, difficulty
+
+
+def test_fleet_matches_engine_per_session():
+    """Every fleet row evolves exactly like its own EmoEngine."""
+    profiles = [PROFILES[t] for t in ProfileType] * 4
+    n = len(profiles)
+    fleet = EmoFleet(profiles)
+    engines = [EmoEngine(p, clock=DeltaClock(default_dt=1.0)) for p in profiles]
+    reward, novelty, urgency, difficulty = _signal_table(n, 220)
+
+    for k in range(reward.shape[0]):
+        out = fleet.step(reward[k], novelty[k], urgency[k], difficulty[k], dt=1.0)
+        for i, engine in enumerate(engines):
+            res = engine.step(reward[k, i], novelty[k, i], urgency[k, i], difficulty[k, i])
+            assert out.halted[i] == res.halted
+            assert out.failure[i] == res.failure.value
+            assert out.mode[i] == res.mode.value
+            assert out.budget[i, 0] == pytest.approx(res.budget.effort, abs=1e-9)
+            assert out.budget[i, 1] == pytest.approx(res.budget.risk, abs=1e-9)
+            assert out.budget[i, 2] == pytest.approx(res.budget.exploration, abs=1e-9)
+            assert out.budget[i, 3] == pytest.approx(res.budget.persistence, abs=1e-9)
+            assert fleet.no_progress_steps[i] == engine.no_progress_steps
+            assert fleet.step_count[i] == engine.step_count
+
+    assert fleet.halted.all()
+
+
+def test_fleet_halt_is_terminal():
+    fleet = EmoFleet(PROFILES[ProfileType.BALANCED], size=3)
+
+    for _ in range(500):
+        out = fleet.step(reward=0.0, novelty=0.0, urgency=1.0)
+        if out.halted.all():
+            break
+
+    assert out.halted.all()
+    frozen_pressure = fleet.pressure.copy()
+    frozen_steps = fleet.step_count.copy()
+
+    out = fleet.step(reward=1.0, novelty=1.0, urgency=0.0)
+
+    assert np.array_equal(fleet.pressure, frozen_pressure)
+    assert np.array_equal(fleet.step_count, frozen_steps)
+    assert not out.stepped.any()
+    assert (out.budget == 0.0).all()
+    assert (out.mode == Mode.HALTED.value).all()
+    assert fleet.session_budget(0).effort == 0.0
+    assert fleet.session_reason(0) is not None
+
+
+def test_fleet_sessions_are_independent():
+    fleet = EmoFleet(PROFILES[ProfileType.BALANCED], size=2)
+
+    # Session 0 makes progress, session 1 spins without reward
+    for _ in range(100):
+        out = fleet.step(reward=np.array([0.5, 0.0]), novelty=0.2, urgency=0.0)
+
+    assert out.halted[1]
+    assert fleet.session_failure(1) in {
+        FailureType.EXHAUSTION,
+        FailureType.STAGNATION,
+        FailureType.EXTERNAL,
+    }
+    assert fleet.no_progress_steps[0] == 0
+
+
+def test_single_profile_requires_size():
+    with pytest.raises(ValueError):
+        EmoFleet(PROFILES[ProfileType.BALANCED])
@@ -36,3 +36,28 @@ def test_governance_frustration_suppression():
     budget = gov.compute(state)
     
     assert budget.exploration == 0.0
+
+
+def test_governance_fused_kernel_matches_matrix_form():
+    gov = GovernanceEngine()
+    state = PressureState(confidence=0.4, frustration=0.2, curiosity=0.7, arousal=0.3, risk=0.1)
+    s = np.array([state.confidence, state.frustration, state.curiosity, state.arousal, state.risk])
+
+    expected = np.clip(np.array(gov.W).T @ s - np.array(gov.V).T @ s, 0.0, 1.0)
+    budget = gov.compute(state)
+
+    assert budget.effort == pytest.approx(expected[0])
+    assert budget.risk == pytest.approx(expected[1])
+    assert budget.exploration == pytest.approx(expected[2])
+    assert budget.persistence == pytest.approx(expected[3])
+
+def test_core_importable_without_numpy():
+    import subprocess
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    code = (
+        "import sys; sys.modules['numpy'] = None\n"
+        "from emocore import EmoCoreAgent, step, Signals\n"
+        "r = step(EmoCoreAgent(), Signals(reward=0.5, novelty=0.2))\n"
+        "assert not r.halted\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=src)
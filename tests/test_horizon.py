@@ -0,0 +1,109 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.engine import EmoEngine
+from emocore.failures import FailureType
+from emocore.interface import step, Signals
+from emocore.profiles import PROFILES, ProfileType
+
+
+@pytest.mark.parametrize("profile_type", list(ProfileType))
+@pytest.mark.parametrize("signals", [
+    Signals(reward=0.0, novelty=0.0, urgency=1.0),
+    Signals(reward=-0.3, novelty=0.1, urgency=0.2, difficulty=0.5),
+    Signals(reward=0.5, novelty=0.2),
+])
+def test_forecast_matches_actual_halt(profile_type, signals):
+    agent = EmoCoreAgent(PROFILES[profile_type], clock=DeltaClock(), forecast=True)
+
+    first = step(agent, signals)
+    predicted_steps = first.horizon.steps_to_halt
+    predicted_failure = first.horizon.failure
+
+    taken = 0
+    result = first
+    while not result.halted:
+        result = step(agent, signals)
+        taken += 1
+
+    assert taken == predicted_steps
+    assert result.failure == predicted_failure
+
+
+def test_forecast_is_lazy(monkeypatch):
+    forks = []
+    original = EmoEngine.fork
+
+    def counting_fork(self, *args, **kwargs):
+        forks.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(EmoEngine, "fork", counting_fork)
+    agent = EmoCoreAgent(clock=DeltaClock(), forecast=True)
+
+    results = [step(agent, Signals(reward=0.2, novelty=0.1)) for _ in range(10)]
+    assert forks == []
+
+    results[-1].horizon.steps_to_halt
+    results[-1].horizon.failure
+    assert forks == [1]
+
+
+def test_forecast_counter_distances():
+    agent = EmoCoreAgent(PROFILES[ProfileType.BALANCED], clock=DeltaClock(), forecast=True)
+    profile = agent.engine.profile
+
+    r = step(agent, Signals(reward=0.0, urgency=0.1))
+    assert r.horizon.steps_to_external == profile.max_steps - 1
+    assert r.horizon.steps_to_stagnating == profile.stagnation_window - 1
+
+    r = step(agent, Signals(reward=0.5))
+    assert r.horizon.steps_to_stagnating is None
+
+
+def test_forecast_does_not_touch_engine():
+    agent = EmoCoreAgent(clock=DeltaClock(), forecast=True)
+    r = step(agent, Signals(reward=0.0, urgency=1.0))
+    before = agent.engine.checkpoint()
+
+    assert r.horizon.steps_to_halt > 0
+    assert agent.engine.checkpoint() == before
+
+
+def test_forecast_on_halted_engine():
+    agent = EmoCoreAgent(clock=DeltaClock(), forecast=True)
+    r = step(agent, Signals(reward=0.0, urgency=1.0))
+    while not r.halted:
+        r = step(agent, Signals(reward=0.0, urgency=1.0))
+
+    assert r.horizon.steps_to_halt == 0
+    assert r.horizon.failure == r.failure
+
+
+def test_forecast_off_by_default():
+    agent = EmoCoreAgent()
+    assert step(agent, Signals(reward=0.5)).horizon is None
+    assert step(agent, Signals(reward=0.5), forecast=True).horizon is not None
+
+
+def test_forecast_is_not_compared_or_repr():
+    def run():
+        agent = EmoCoreAgent(PROFILES[ProfileType.BALANCED], clock=DeltaClock(), forecast=True)
+        return step(agent, Signals(reward=0.2, novelty=0.1), dt=0.5)
+
+    a, b = run(), run()
+    assert a.horizon is not b.horizon
+    assert a == b
+    assert "horizon" not in repr(a)
+    assert a.horizon._steps_to_halt is None  # repr did not run the simulation
+
+
+def test_forecast_external_fuse():
+    agent = EmoCoreAgent(PROFILES[ProfileType.BALANCED], clock=DeltaClock(), forecast=True)
+    r = step(agent, Signals(reward=0.5, novelty=0.2))
+    assert r.horizon.failure == FailureType.EXTERNAL
+    assert r.horizon.steps_to_halt == r.horizon.steps_to_external
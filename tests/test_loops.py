@@ -0,0 +1,93 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import random
+
+import pytest
+
+from emocore.extractor import RuleBasedExtractor
+from emocore.loops import PeriodDetector
+from emocore.observation import Observation
+
+
+def _first_detection(detector, stream):
+    for i, action in enumerate(stream):
+        if detector.push(action):
+            return i, detector.period
+    return None, 0
+
+
+@pytest.mark.parametrize("period", [2, 3, 7, 40, 200])
+def test_detects_period_after_noise(period):
+    rng = random.Random(period)
+    noise = [rng.randrange(10_000) for _ in range(100)]
+    cycle = [rng.randrange(10_000) for _ in range(period)]
+    detector = PeriodDetector(max_period=256)
+    index, found = _first_detection(detector, noise + cycle * 4)
+    assert found == period
+    # Confirmed once the loop has repeated in full (two cycles plus one n-gram)
+    assert index < len(noise) + 2 * period + detector.ngram
+
+
+def test_no_loop_in_random_stream():
+    rng = random.Random(0)
+    detector = PeriodDetector()
+    assert all(detector.push(rng.randrange(50)) == 0 for _ in range(20_000))
+
+
+def test_period_one_and_too_long_periods_are_ignored():
+    detector = PeriodDetector(max_period=16)
+    assert all(detector.push(5) == 0 for _ in range(100))
+    cycle = list(range(32))
+    assert all(PeriodDetector(max_period=16).push(a) == 0 for a in cycle * 5)
+
+
+def test_memory_is_bounded():
+    detector = PeriodDetector(max_period=64)
+    for i in range(100_000):
+        detector.push(i)
+    assert len(detector._last_seen) <= 65
+    assert detector.steps == 100_000
+
+
+def test_loop_breaks_when_sequence_changes():
+    detector = PeriodDetector()
+    for action in [1, 2, 3] * 10:
+        detector.push(action)
+    assert detector.period == 3
+    detector.push(99)
+    assert detector.period == 0
+
+
+def test_extractor_penalizes_long_loops():
+    # Period 25 exceeds the 20-entry action window: only S-2 sees the repeat.
+    # The agent reports internal change but the environment never moves
+    looping = RuleBasedExtractor(step_limit=10**6, time_limit=10**6)
+    steps = [f"step_{i}" for i in range(25)]
+    signals = [
+        looping.extract(Observation(action, "success", 0.0, 0.5, 1.0))
+        for action in steps * 4
+    ]
+    assert looping.loop_period == 25
+    first = next(i for i in range(len(signals)) if signals[i].difficulty > 0.0)
+    assert first > 50
+    assert signals[-1].difficulty >= RuleBasedExtractor.LOOP_DIFFICULTY
+
+    looping.reset()
+    assert looping.loop_period == 0 and looping.loop_detector.steps == 0
+
+
+def test_extractor_does_not_penalize_productive_loops():
+    productive = RuleBasedExtractor(step_limit=10**6, time_limit=10**6)
+    signals = [
+        productive.extract(Observation(action, "success", 0.6, 0.2, 1.0))
+        for action in ["read", "write"] * 50 + [f"step_{i}" for i in range(25)] * 4
+    ]
+    assert productive.loop_period == 25
+    assert all(s.difficulty == 0.0 for s in signals)
+
+    # The same loop stops being penalty-free once it stops moving the environment
+    for action in [f"step_{i}" for i in range(25)] * 2:
+        stalled = productive.extract(Observation(action, "success", 0.0, 0.5, 1.0))
+    assert stalled.difficulty >= RuleBasedExtractor.LOOP_DIFFICULTY
@@ -0,0 +1,112 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import random
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.extractor import LLMAgentExtractor
+from emocore.interface import observe, observe_batch, OBSERVATION_COLUMNS
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+
+
+def _observations(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        Observation(
+            action=rng.choice(["search", "read", "write", "retry"]),
+            result=rng.choice(["success", "failure", "error", "timeout"]),
+            env_state_delta=rng.choice([0.0, 0.01, rng.random()]),
+            agent_state_delta=rng.random(),
+            elapsed_time=i * 0.5,
+            tokens_used=rng.randrange(0, 500),
+        )
+        for i in range(n)
+    ]
+
+
+def _agent():
+    return EmoCoreAgent(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+
+
+def _columns(observations, optional=True):
+    names = OBSERVATION_COLUMNS + (("tokens_used", "error") if optional else ())
+    return {name: [getattr(o, name) for o in observations] for name in names}
+
+
+def _reference(observations, extractor=None):
+    agent = _agent()
+    results = []
+    for o in observations:
+        results.append(observe(agent, o, extractor=extractor))
+        if results[-1].halted:
+            break
+    return results
+
+
+def test_batch_matches_observe_until_halt():
+    observations = _observations(400)
+    expected = _reference(observations)
+    assert expected[-1].halted and len(expected) < len(observations)
+
+    assert observe_batch(_agent(), observations) == expected
+    assert observe_batch(_agent(), _columns(observations)) == expected
+
+
+def test_custom_extractor_and_agent_state_is_kept():
+    observations = _observations(30, seed=2)
+    expected = _reference(observations, extractor=LLMAgentExtractor())
+
+    assert observe_batch(_agent(), observations, extractor=LLMAgentExtractor()) == expected
+
+    # Default extractor/validator persist across batches exactly like observe()
+    agent = _agent()
+    first = observe_batch(agent, observations[:10])
+    rest = observe_batch(agent, observations[10:])
+    assert first + rest == _reference(observations)
+
+
+def test_table_matches_results():
+    observations = _observations(400, seed=1)
+    expected = _reference(observations)
+    table = observe_batch(_agent(), _columns(observations, optional=False), table=True)
+
+    assert len(table) == len(expected)
+    assert table.halt_index == len(expected) - 1
+    assert table.result == expected[-1]
+    for i, result in enumerate(expected):
+        assert table.budget(i) == result.budget
+        assert table.mode(i) is result.mode
+        assert table.failure(i) is result.failure
+
+
+def test_stops_pulling_at_halt_and_halted_agent_processes_nothing():
+    pulled = []
+
+    def producer():
+        for i, o in enumerate(_observations(5_000, seed=4)):
+            pulled.append(i)
+            yield o
+
+    agent = _agent()
+    results = observe_batch(agent, producer())
+    assert results[-1].halted and len(pulled) == len(results)
+
+    assert observe_batch(agent, _observations(5)) == []
+    assert len(observe_batch(agent, _observations(5), table=True)) == 0
+
+
+def test_array_columns_and_validation():
+    np = pytest.importorskip("numpy")
+    observations = _observations(200, seed=6)
+    columns = _columns(observations)
+    for name in ("env_state_delta", "agent_state_delta", "elapsed_time", "tokens_used"):
+        columns[name] = np.array(columns[name])
+    assert observe_batch(_agent(), columns) == _reference(observations)
+
+    del columns["action"]
+    with pytest.raises(ValueError):
+        observe_batch(_agent(), columns)
@@ -0,0 +1,199 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import asyncio
+import math
+import time
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.behavior import BehaviorBudget
+from emocore.clock import VirtualClock
+from emocore.failures import FailureType
+from emocore.modes import Mode
+from emocore.profiles import PROFILES, ProfileType
+from emocore.temporal import BudgetRateLimiter, PermitRevoked, RateLimited
+
+
+def _budget(exploration=1.0):
+    return BehaviorBudget(effort=1.0, risk=0.5, persistence=1.0, exploration=exploration)
+
+
+def _limiter(rate=10.0, burst=5.0, **kwargs):
+    clock = VirtualClock()
+    return BudgetRateLimiter(rate, burst, clock=clock, **kwargs), clock
+
+
+def test_fresh_key_starts_full_and_refills_lazily():
+    limiter, clock = _limiter()
+    assert limiter.tokens("a") == 5.0
+    assert len(limiter) == 0  # Reading a fresh key allocates nothing
+    assert all(limiter.try_acquire("a") for _ in range(5))
+    assert not limiter.try_acquire("a")
+    clock.advance(0.25)  # 2.5 tokens at 10/s
+    assert limiter.tokens("a") == pytest.approx(2.5)
+    assert limiter.try_acquire("a", cost=2.0)
+    assert not limiter.try_acquire("a")
+    clock.advance(100.0)
+    assert limiter.tokens("a") == 5.0  # Capped at burst
+
+
+def test_keys_are_independent():
+    limiter, _ = _limiter()
+    assert limiter.try_acquire("a", cost=5.0)
+    assert not limiter.try_acquire("a")
+    assert limiter.try_acquire("b", cost=5.0)
+    assert len(limiter) == 2
+
+
+def test_recovering_refills_at_a_fraction_of_the_rate():
+    limiter, clock = _limiter()
+    limiter.try_acquire("a", cost=5.0)
+    limiter.update("a", _budget(), Mode.RECOVERING)
+    clock.advance(0.4)
+    assert limiter.tokens("a") == pytest.approx(1.0)  # 10/s * 0.25 * 0.4s
+    assert limiter.time_until("a", cost=2.0) == pytest.approx(0.4)
+    limiter.update("a", _budget(), Mode.IDLE)
+    clock.advance(0.1)
+    assert limiter.tokens("a") == pytest.approx(2.0)
+
+
+def test_mode_change_settles_refill_at_the_old_rate():
+    limiter, clock = _limiter()
+    limiter.try_acquire("a", cost=5.0)
+    clock.advance(0.2)  # 2 tokens earned at the IDLE rate
+    limiter.update("a", _budget(), Mode.RECOVERING)
+    assert limiter.tokens("a") == pytest.approx(2.0)
+
+
+def test_custom_mode_scale_cannot_unhalt():
+    limiter, _ = _limiter(mode_scale={Mode.IDLE: 1.0, Mode.RECOVERING: 0.5, Mode.HALTED: 1.0})
+    assert limiter.mode_scale[Mode.HALTED] == 0.0
+    with pytest.raises(ValueError):
+        BudgetRateLimiter(1.0, 1.0, mode_scale={Mode.RECOVERING: 2.0})
+    with pytest.raises(ValueError):
+        BudgetRateLimiter(0.0, 1.0)
+
+
+def test_exploration_charge():
+    limiter, _ = _limiter()
+    limiter.update("a", _budget(exploration=0.5))
+    assert limiter.charge("a") == 1.0
+    assert limiter.charge("a", explore=True) == 2.0
+    assert limiter.try_acquire("a", cost=2.0, explore=True)  # Charged 4
+    assert limiter.tokens("a") == pytest.approx(1.0)
+    assert not limiter.try_acquire("a", explore=True)
+    assert limiter.try_acquire("a")
+
+    limiter.update("b", _budget(exploration=0.0))
+    assert limiter.charge("b", explore=True) == math.inf
+    assert not limiter.try_acquire("b", explore=True)
+    assert limiter.time_until("b", explore=True) == math.inf
+    assert limiter.try_acquire("b")
+
+
+def test_follow_halts_and_a_later_result_lifts_the_halt():
+    limiter, clock = _limiter()
+    agent = EmoCoreAgent(PROFILES[ProfileType.BALANCED])
+    result = agent.step(0.3, 0.2, 0.1)
+    limiter.follow("a", result)
+    assert limiter.try_acquire("a")
+
+    class Halted:
+        halted = True
+        failure = FailureType.EXHAUSTION
+
+    limiter.follow("a", Halted())
+    assert limiter.tokens("a") == 0.0
+    with pytest.raises(PermitRevoked) as info:
+        limiter.try_acquire("a")
+    assert info.value.failure is FailureType.EXHAUSTION
+    clock.advance(10.0)
+    assert limiter.tokens("a") == 0.0  # No refill while halted
+
+    limiter.follow("a", result)
+    clock.advance(0.1)
+    assert limiter.tokens("a") == pytest.approx(1.0)  # Refills from empty
+
+
+def test_attach_halts_the_key_when_the_agent_halts():
+    profile = PROFILES[ProfileType.CONSERVATIVE]
+    agent = EmoCoreAgent(profile)
+    limiter, _ = _limiter()
+    limiter.attach(agent, "tenant")
+    for _ in range(profile.max_steps - 1):
+        agent.step(0.3, 0.2, 0.1)
+    assert limiter.try_acquire("tenant")
+    result = agent.step(0.3, 0.2, 0.1)
+    assert result.halted
+    with pytest.raises(PermitRevoked) as info:
+        limiter.try_acquire("tenant")
+    assert info.value.failure is result.failure
+
+
+def test_prune_drops_only_buckets_equal_to_a_fresh_key():
+    limiter, clock = _limiter()
+    limiter.try_acquire("full")
+    limiter.try_acquire("draining", cost=5.0)
+    limiter.update("recovering", _budget(), Mode.RECOVERING)
+    limiter.halt("halted")
+    clock.advance(0.1)  # "full" is back to burst, "draining" is not
+    assert limiter.prune() == 1
+    assert sorted(limiter._buckets) == ["draining", "halted", "recovering"]
+    limiter.forget("halted")
+    assert limiter.try_acquire("halted")
+
+
+def test_acquire_waits_for_refill():
+    limiter = BudgetRateLimiter(rate=200.0, burst=1.0)
+
+    async def run():
+        assert await limiter.acquire("a")
+        start = time.monotonic()
+        assert await limiter.acquire("a")
+        return time.monotonic() - start
+
+    waited = asyncio.run(run())
+    assert waited >= 0.004
+
+
+def test_acquire_timeout_and_impossible_charges():
+    limiter = BudgetRateLimiter(rate=1.0, burst=2.0)
+
+    async def run():
+        assert await limiter.acquire("a", cost=2.0)
+        assert not await limiter.acquire("a", timeout=0.01)
+        with pytest.raises(RateLimited):
+            await limiter.acquire("a", cost=3.0)
+        limiter.update("b", _budget(exploration=0.0))
+        with pytest.raises(RateLimited):
+            await limiter.acquire("b", explore=True)
+        limiter.halt("c", FailureType.SAFETY)
+        with pytest.raises(PermitRevoked):
+            await limiter.acquire("c")
+
+    asyncio.run(run())
+
+
+def test_halt_wakes_a_waiting_acquire_with_permit_revoked():
+    limiter = BudgetRateLimiter(rate=20.0, burst=1.0)
+
+    async def run():
+        limiter.try_acquire("a")
+        waiter = asyncio.ensure_future(limiter.acquire("a", cost=1.0))
+        await asyncio.sleep(0)
+        limiter.halt("a", FailureType.EXHAUSTION)
+        with pytest.raises(PermitRevoked):
+            await waiter
+
+    asyncio.run(run())
+
+
+def test_many_keys_stay_small():
+    limiter, _ = _limiter()
+    for key in range(100_000):
+        limiter.try_acquire(key)
+    assert len(limiter) == 100_000
+    assert not hasattr(next(iter(limiter._buckets.values())), "__dict__")
@@ -0,0 +1,132 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import pytest
+
+from emocore.adapters import LLMLoopAdapter, ToolCallingAgentAdapter
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.decision import encode
+from emocore.extractor import LLMAgentExtractor, RuleBasedExtractor, ToolAgentExtractor
+from emocore.interface import observe
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+from emocore.session import GovernedSession
+from emocore.signals import Signals
+from emocore.validator import SignalValidator, ValidationError
+
+
+def _observations(n=60):
+    # Mix of progress, stalls, errors, repeats and large swings
+    for i in range(n):
+        yield Observation(
+            action=f"act_{i % 4}",
+            result="error" if i % 7 == 0 else "ok",
+            env_state_delta=0.0 if i % 5 == 0 else 0.9 * ((i % 3) - 1),
+            agent_state_delta=0.1 + 0.05 * (i % 4),
+            elapsed_time=0.5 + (i % 6),
+            tokens_used=100 * i,
+            error="boom" if i % 7 == 0 else None,
+        )
+
+
+@pytest.mark.parametrize("extractor_cls", [RuleBasedExtractor, LLMAgentExtractor, ToolAgentExtractor])
+def test_session_matches_observe(extractor_cls):
+    profile = PROFILES[ProfileType.AGGRESSIVE]
+    agent = EmoCoreAgent(profile, clock=DeltaClock())
+    agent._extractor = extractor_cls()
+    session = GovernedSession(profile, extractor=extractor_cls(), clock=DeltaClock())
+
+    for obs in _observations():
+        expected = observe(agent, obs)
+        result = session.observe(obs)
+        assert result == expected
+        assert result.pressure_log == expected.pressure_log
+    assert session.halted == agent.engine.halted
+    assert session.validator.last_signals == agent._validator.last_signals
+
+
+def test_session_of_agent_is_cached_and_shares_state():
+    agent = EmoCoreAgent(clock=DeltaClock())
+    session = GovernedSession.of(agent)
+    assert GovernedSession.of(agent) is session
+    assert session.extractor is agent._extractor
+    assert session.validator is agent._validator
+
+    obs = next(_observations())
+    observe(agent, obs)
+    session.observe(obs)
+    assert agent.engine.step_count == 2
+    assert agent._extractor.step_count == 2
+
+
+def test_session_rebinds_when_agent_stages_are_replaced():
+    agent = EmoCoreAgent(clock=DeltaClock())
+    session = GovernedSession.of(agent)
+    agent._extractor = ToolAgentExtractor()
+    rebound = GovernedSession.of(agent)
+    assert rebound is not session
+    assert rebound.extractor is agent._extractor
+
+
+def test_explicit_stages_are_not_cached():
+    agent = EmoCoreAgent(clock=DeltaClock())
+    custom = RuleBasedExtractor()
+    session = GovernedSession.of(agent, extractor=custom)
+    assert session.extractor is custom
+    assert getattr(agent, '_session', None) is None
+    assert not hasattr(agent, "_extractor")
+
+
+def test_observe_decision_matches_observe():
+    a = GovernedSession(clock=DeltaClock())
+    b = GovernedSession(clock=DeltaClock())
+    for obs in _observations():
+        result = a.observe(obs)
+        assert b.observe_decision(obs) == encode(result.mode, result.failure)
+
+
+def test_overridden_signals_methods_are_honored():
+    class Muted(RuleBasedExtractor):
+        def extract(self, observation):
+            s = super().extract(observation)
+            return Signals(0.0, s.novelty, s.urgency, s.difficulty, s.trust)
+
+    class Counting(SignalValidator):
+        calls = 0
+
+        def validate(self, signals):
+            Counting.calls += 1
+            return super().validate(signals)
+
+    session = GovernedSession(extractor=Muted(), validator=Counting(), clock=DeltaClock())
+    result = session.observe(next(_observations()))
+    assert result.pressure_log is not None
+    assert session.validator.last_signals.reward == 0.0
+    assert Counting.calls == 1
+
+
+def test_strict_validation_errors_propagate():
+    session = GovernedSession(validator=SignalValidator(strict=True), clock=DeltaClock())
+    session.observe(Observation("a", "ok", 1.0, 0.1, 0.5))
+    with pytest.raises(ValidationError):
+        session.observe(Observation("b", "error", -1.0, 0.1, 0.5, error="x"))
+
+
+def test_adapters_govern_through_agent_session():
+    agent = EmoCoreAgent(clock=DeltaClock())
+    adapter = LLMLoopAdapter(agent, token_limit=500)
+    adapter.start_step()
+    adapter.end_step("gen", "text", env_delta=0.5, tokens_used=100)
+    assert isinstance(agent._extractor, LLMAgentExtractor)
+    assert agent._extractor.token_limit == 500
+    assert GovernedSession.of(agent).extractor is agent._extractor
+
+    tool_agent = EmoCoreAgent(clock=DeltaClock())
+    tools = ToolCallingAgentAdapter(tool_agent)
+    with tools.monitor("search") as audit:
+        audit.success(env_delta=0.8)
+    assert isinstance(tool_agent._extractor, ToolAgentExtractor)
+    assert audit.governance_result.budget.effort > 0.0
+    assert tool_agent._session.extractor is tool_agent._extractor
@@ -0,0 +1,167 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import dataclasses
+import gc
+import threading
+import weakref
+
+import pytest
+
+from emocore import SessionRegistry
+from emocore.agent import EmoCoreAgent
+from emocore.clock import VirtualClock
+from emocore.engine import EmoEngine
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+
+
+def _registry(**kwargs):
+    clock = VirtualClock()
+    evicted = []
+    registry = SessionRegistry(clock=clock, on_evict=lambda key, agent, reason: evicted.append((key, reason)),
+                               **kwargs)
+    return registry, clock, evicted
+
+
+def test_sessions_are_created_lazily_and_reused():
+    profile = PROFILES[ProfileType.CONSERVATIVE]
+    registry = SessionRegistry(profile, shards=4)
+    assert "a" not in registry and registry.peek("a") is None
+    agent = registry.get("a")
+    assert agent.engine.profile is profile
+    assert registry.get("a") is agent
+    assert registry.peek("a") is agent and "a" in registry
+    assert registry.get("b") is not agent
+    assert len(registry) == 2
+    assert registry.session("a") is registry.session("a")
+    assert registry.session("a").agent is agent
+    assert registry.remove("a") is agent
+    assert registry.remove("a") is None and len(registry) == 1
+
+
+def test_ttl_evicts_idle_sessions():
+    registry, clock, evicted = _registry(shards=1, ttl=10.0)
+    first = registry.get("a")
+    registry.get("b")
+    clock.advance(6.0)
+    registry.get("a")  # Refreshes "a" only
+    clock.advance(6.0)
+    registry.get("c")  # Using the shard expires "b"
+    assert evicted == [("b", "ttl")]
+    assert "b" not in registry and "a" in registry
+    clock.advance(11.0)
+    fresh = registry.get("a")  # Expired on lookup: a new session
+    assert fresh is not first
+    assert evicted == [("b", "ttl"), ("a", "ttl"), ("c", "ttl")]
+    assert registry.evictions == {"ttl": 3, "lru": 0}
+
+
+def test_sweep_evicts_across_shards():
+    registry, clock, evicted = _registry(shards=8, ttl=5.0)
+    for key in range(100):
+        registry.get(key)
+    clock.advance(3.0)
+    for key in range(50):
+        registry.get(key)
+    clock.advance(3.0)
+    assert registry.sweep() == 50
+    assert sorted(key for key, _ in evicted) == list(range(50, 100))
+    assert len(registry) == 50
+    assert SessionRegistry().sweep() == 0  # No ttl
+
+
+def test_lru_evicts_the_coldest_session_of_a_full_shard():
+    registry, _, evicted = _registry(shards=1, max_sessions=3)
+    for key in "abc":
+        registry.get(key)
+    registry.get("a")
+    registry.get("d")
+    assert evicted == [("b", "lru")]
+    registry.get("e")
+    assert evicted == [("b", "lru"), ("c", "lru")]
+    assert len(registry) == 3
+
+
+def test_lru_capacity_is_per_shard():
+    registry, _, evicted = _registry(shards=4, max_sessions=100)
+    for key in range(1000):
+        registry.get(key)
+    assert all(len(shard.entries) <= 25 for shard in registry._shards)
+    assert len(registry) + len(evicted) == 1000
+
+
+def test_eviction_callback_can_persist_and_factory_restore():
+    store = {}
+    profile = PROFILES[ProfileType.BALANCED]
+
+    def persist(key, agent, reason):
+        store[key] = agent.engine.checkpoint()
+
+    def restore(key):
+        agent = EmoCoreAgent(profile)
+        if key in store:
+            agent.engine = agent.engine.fork(store.pop(key))
+        return agent
+
+    clock = VirtualClock()
+    registry = SessionRegistry(profile, ttl=60.0, on_evict=persist, factory=restore, clock=clock)
+    for _ in range(5):
+        registry.session("conv").observe(Observation(action="search", result="failure",
+                                                     env_state_delta=0.0, agent_state_delta=0.1,
+                                                     elapsed_time=1.0))
+    before = registry.get("conv").engine.checkpoint()
+    clock.advance(61.0)
+    assert registry.sweep() == 1 and "conv" in store
+    restored = registry.get("conv")
+    assert restored.engine.step_count == 5
+    assert restored.engine.checkpoint()[0] == before[0]
+
+
+def test_concurrent_lookups_create_one_agent_per_key():
+    registry = SessionRegistry(shards=8)
+    seen = [[] for _ in range(4)]
+
+    def worker(out):
+        for key in range(2000):
+            out.append(registry.get(key % 500))
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in seen]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(registry) == 500
+    for i in range(2000):
+        assert len({id(out[i]) for out in seen}) == 1
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        SessionRegistry(shards=0)
+    with pytest.raises(ValueError):
+        SessionRegistry(ttl=0.0)
+    with pytest.raises(ValueError):
+        SessionRegistry(max_sessions=0)
+
+
+def test_engines_share_stateless_governance_per_profile():
+    balanced = PROFILES[ProfileType.BALANCED]
+    a, b = EmoEngine(balanced), EmoEngine(balanced)
+    assert a.governance is b.governance and a.appraisal is b.appraisal
+    assert EmoEngine(PROFILES[ProfileType.AGGRESSIVE]).governance is not a.governance
+
+
+def test_governance_cache_is_bounded_and_releases_profiles():
+    from emocore import engine as engine_module
+    first = dataclasses.replace(PROFILES[ProfileType.BALANCED], name="transient-0")
+    ref = weakref.ref(first)
+    EmoEngine(first).step(0.1, 0.1, 0.1)
+    del first
+    for i in range(1, 2000):
+        profile = dataclasses.replace(PROFILES[ProfileType.BALANCED], name=f"transient-{i}")
+        EmoEngine(profile).step(0.1, 0.1, 0.1)
+    gc.collect()
+    assert engine_module._shared_governance.cache_info().currsize <= engine_module._GOVERNANCE_CACHE_SIZE
+    assert ref() is None
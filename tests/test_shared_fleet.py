@@ -0,0 +1,126 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from emocore.behavior import ZERO_BUDGET
+from emocore.failures import FailureType
+from emocore.fleet import EmoFleet
+from emocore.modes import Mode
+from emocore.profiles import PROFILES, ProfileType
+from emocore.shared_fleet import FleetGovernor, SharedFleet, RECORD
+
+
+def _signals(n, steps, seed=11):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(-1.0, 1.0, (steps, n)), rng.uniform(0.0, 1.0, (steps, n)),
+            rng.uniform(0.0, 1.0, (steps, n)), rng.uniform(0.0, 1.0, (steps, n)))
+
+
+def test_governor_matches_emofleet():
+    profiles = [PROFILES[t] for t in ProfileType] * 7
+    n = len(profiles)
+    reference = EmoFleet(profiles)
+    reward, novelty, urgency, difficulty = _signals(n, 150)
+    with FleetGovernor(profiles, workers=3) as governor:
+        fleet = governor.fleet
+        assert governor.workers == 3 and fleet.shards == 3
+        for k in range(reward.shape[0]):
+            expected = reference.step(reward[k], novelty[k], urgency[k], difficulty[k], dt=0.5)
+            governor.step(reward[k], novelty[k], urgency[k], difficulty[k], dt=0.5)
+            assert np.array_equal(fleet.halted, expected.halted)
+            assert np.array_equal(fleet.records["failure"], expected.failure)
+            assert np.array_equal(fleet.records["mode"], expected.mode)
+            np.testing.assert_allclose(fleet.budgets, reference.budget, rtol=0, atol=1e-12)
+            assert np.array_equal(fleet.records["step_count"], reference.step_count)
+        for i in range(n):
+            budget = fleet.budget(i)
+            assert (budget == ZERO_BUDGET) == bool(expected.halted[i])
+            assert fleet.mode(i).value == expected.mode[i]
+
+
+def test_halt_request_is_terminal():
+    profile = PROFILES[ProfileType.BALANCED]
+    with FleetGovernor(profile, size=10, workers=2) as governor:
+        fleet = governor.fleet
+        governor.step(0.5, 0.2, 0.1)
+        governor.halt(7)
+        assert fleet.is_halted(7) and not fleet.halted[7]  # Visible before it is applied
+        assert fleet.budget(7) == ZERO_BUDGET
+        assert fleet.failure(7) is FailureType.EXTERNAL
+        governor.step(0.5, 0.2, 0.1)
+        assert fleet.halted[7] and fleet.mode(7) is Mode.HALTED
+        assert fleet.reason(7) == "halt_requested"
+        frozen = fleet.snapshot(7)
+        for _ in range(5):
+            governor.step(0.5, 0.2, 0.1)
+        after = fleet.snapshot(7)
+        assert all(np.array_equal(after[field], frozen[field]) for field in RECORD.names)
+        assert fleet.records["step_count"][6] == 7
+        assert not any(fleet.is_halted(i) for i in range(7))
+
+
+def _reader(name, session, queue):
+    fleet = SharedFleet.attach(name)
+    try:
+        queue.put((fleet.budget(session).effort, fleet.is_halted(session)))
+        fleet.request_halt(session)
+    finally:
+        fleet.close()
+
+
+def test_other_processes_read_and_halt_by_name():
+    context = multiprocessing.get_context("spawn")
+    with FleetGovernor(PROFILES[ProfileType.BALANCED], size=8, workers=2) as governor:
+        governor.step(0.5, 0.2, 0.1)
+        expected = governor.fleet.budget(3).effort
+        queue = context.Queue()
+        process = context.Process(target=_reader, args=(governor.fleet.name, 3, queue))
+        process.start()
+        effort, halted = queue.get(timeout=60)
+        process.join(timeout=60)
+        assert effort == expected and not halted
+        assert governor.fleet.is_halted(3)
+        governor.step(0.5, 0.2, 0.1)
+        assert governor.fleet.failure(3) is FailureType.EXTERNAL
+        # The reader exiting must not have unlinked the block
+        SharedFleet.attach(governor.fleet.name).close()
+
+
+def test_snapshot_waits_for_a_stepping_shard():
+    fleet = SharedFleet.create(4, shards=2)
+    try:
+        fleet._seq[1] += 1  # Shard 1 mid-step
+        fleet.records["budget"][3] = [0.5, 0.1, 0.2, 0.6]
+
+        def finish():
+            time.sleep(0.05)
+            fleet._seq[1] += 1
+
+        thread = threading.Thread(target=finish)
+        start = time.monotonic()
+        thread.start()
+        assert fleet.budget(0).effort == 1.0  # Shard 0 is not stepping
+        assert fleet.budget(3).effort == 0.5
+        assert time.monotonic() - start >= 0.04
+        thread.join()
+    finally:
+        fleet.close()
+        fleet.unlink()
+
+
+def test_layout_and_cleanup():
+    assert RECORD.itemsize % 8 == 0
+    with pytest.raises(ValueError):
+        SharedFleet.create(4, shards=5)
+    governor = FleetGovernor(PROFILES[ProfileType.BALANCED], size=4, workers=2)
+    name = governor.fleet.name
+    governor.close()
+    with pytest.raises(FileNotFoundError):
+        SharedFleet.attach(name)
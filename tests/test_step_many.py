@@ -0,0 +1,111 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+import random
+
+import pytest
+
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.interface import step, step_many, Signals
+from emocore.profiles import PROFILES, ProfileType
+
+
+def _signals(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        Signals(
+            reward=rng.choice([0.0, -0.2, 0.3]),
+            novelty=rng.random(),
+            urgency=rng.random(),
+            difficulty=rng.random(),
+            trust=rng.random(),
+        )
+        for _ in range(n)
+    ]
+
+
+def _agent():
+    return EmoCoreAgent(PROFILES[ProfileType.BALANCED], clock=DeltaClock())
+
+
+def test_stream_matches_step_until_halt():
+    signals = _signals(500)
+    reference = _agent()
+    expected = []
+    for s in signals:
+        expected.append(step(reference, s))
+        if expected[-1].halted:
+            break
+
+    assert list(step_many(_agent(), signals)) == expected
+    assert expected[-1].halted
+
+
+def test_stops_pulling_input_at_halt():
+    pulled = []
+
+    def producer():
+        for i, s in enumerate(_signals(10_000)):
+            pulled.append(i)
+            yield s
+
+    results = list(step_many(_agent(), producer()))
+    assert results[-1].halted
+    assert len(pulled) == len(results)
+
+
+def test_stream_is_lazy():
+    agent = _agent()
+    stream = step_many(agent, _signals(50))
+    assert agent.engine.step_count == 0
+    next(stream)
+    assert agent.engine.step_count == 1
+
+
+def test_summary_matches_stream():
+    signals = _signals(500, seed=3)
+    streamed = list(step_many(_agent(), signals))
+    summary = step_many(_agent(), iter(signals), summary=True)
+
+    assert summary.result == streamed[-1]
+    assert summary.steps == len(streamed)
+    assert summary.halt_index == len(streamed) - 1
+
+
+def test_summary_without_halt_and_empty_input():
+    signals = [Signals(reward=0.5, novelty=0.1)] * 5
+    summary = step_many(_agent(), signals, summary=True)
+    assert summary.steps == 5 and summary.halt_index is None
+    assert not summary.result.halted
+
+    empty = step_many(_agent(), [], summary=True)
+    assert empty.result is None and empty.steps == 0
+
+
+def test_halted_agent_consumes_nothing():
+    agent = _agent()
+    list(step_many(agent, _signals(10_000)))
+    assert agent.engine.halted
+
+    source = iter(_signals(3))
+    assert list(step_many(agent, source)) == []
+    assert len(list(source)) == 3
+
+
+def test_array_input():
+    np = pytest.importorskip("numpy")
+    signals = _signals(300, seed=5)
+    array = np.array([[s.reward, s.novelty, s.urgency, s.difficulty, s.trust] for s in signals])
+
+    assert list(step_many(_agent(), array)) == list(step_many(_agent(), signals))
+    assert step_many(_agent(), array, summary=True) == step_many(_agent(), signals, summary=True)
+
+    with pytest.raises(ValueError):
+        list(step_many(_agent(), array[:, :4]))
+
+
+def test_annotations_resolve_without_numpy():
+    import typing
+    hints = typing.get_type_hints(step_many)
+    assert "signals" in hints
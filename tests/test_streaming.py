@@ -0,0 +1,122 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import random
+
+import pytest
+
+from emocore.adapters import LLMLoopAdapter, StreamMonitor
+from emocore.agent import EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.failures import FailureType
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+from emocore.session import GovernedSession
+
+
+def _tokens(text):
+    # Fake tokenizer: one token per word, separators stay attached
+    return [word + " " for word in text.split()]
+
+
+def _runaway(n, seed=0):
+    rng = random.Random(seed)
+    intro = " ".join(f"w{rng.randrange(10_000)}" for _ in range(40))
+    loop = "so the answer is that we need to check the answer again"
+    return _tokens(intro + " " + " ".join([loop] * n))[:n]
+
+
+def _varied(n, seed=1):
+    rng = random.Random(seed)
+    return _tokens(" ".join(f"w{rng.randrange(100_000)}" for _ in range(n)))
+
+
+def _adapter(token_limit=100_000):
+    adapter = LLMLoopAdapter(EmoCoreAgent(clock=DeltaClock()), token_limit=token_limit)
+    adapter.start_step()
+    return adapter
+
+
+def test_runaway_repetition_aborts_early():
+    adapter = _adapter()
+    stream = adapter.stream("answer", check_every=32)
+    received = list(stream.wrap(_runaway(4000)))
+    assert stream.aborted
+    assert stream.abort_reason == "repetition"
+    assert len(received) < 200
+    assert stream.tokens == len(received)
+
+
+def test_varied_generation_completes():
+    adapter = _adapter()
+    stream = adapter.stream("answer", check_every=32)
+    received = list(stream.wrap(_varied(2000)))
+    assert not stream.aborted
+    assert len(received) == 2000
+    assert stream.repetition == 0.0
+    result = stream.close()
+    assert not result.halted
+    assert adapter.agent.engine.step_count == 1
+
+
+def test_step_that_would_halt_aborts_at_first_check():
+    profile = PROFILES[ProfileType.CONSERVATIVE]
+    adapter = LLMLoopAdapter(EmoCoreAgent(profile, clock=DeltaClock()), token_limit=2000)
+    for _ in range(profile.max_steps - 1):
+        adapter.start_step()
+        adapter.end_step("gen", "success", env_delta=0.0, agent_delta=0.0, tokens_used=10)
+    assert not adapter.agent.engine.halted
+
+    adapter.start_step()
+    stream = adapter.stream("answer", check_every=50)
+    received = list(stream.wrap(_varied(5000)))
+    assert stream.abort_reason == "projected_halt"
+    assert stream.probe_failure is FailureType.EXTERNAL
+    assert len(received) == 50
+    assert not adapter.agent.engine.halted  # Probing commits nothing
+    assert stream.close().halted
+
+
+def test_words_split_across_chunks():
+    stream = StreamMonitor(_adapter(), "answer", check_every=1_000_000)
+    text = "alpha beta gamma delta alpha beta gamma delta"
+    for ch in text:
+        stream.feed(ch)
+    stream._scan()
+    # 6 three-grams, of which the last 2 repeat earlier ones
+    assert stream._total == 5
+    stream.feed(" ")
+    stream._scan()
+    assert stream._total == 6
+    assert stream.repetition == pytest.approx(2 / 6)
+
+
+def test_probe_does_not_change_session():
+    session = GovernedSession(clock=DeltaClock())
+    for i in range(5):
+        session.observe(Observation(f"a{i}", "ok", 0.3, 0.1, 1.0))
+    before = (session.step_count, session.engine.checkpoint(),
+              list(session.extractor.action_history), session.validator.last_signals)
+
+    obs = Observation("b", "ok", 0.2, 0.1, 1.0)
+    code = session.probe(obs)
+    after = (session.step_count, session.engine.checkpoint(),
+             list(session.extractor.action_history), session.validator.last_signals)
+    assert before == after
+    assert session.observe_decision(obs) == code
+
+
+def test_close_commits_one_step_with_stream_tokens():
+    adapter = _adapter()
+    stream = adapter.stream("answer", check_every=32)
+    list(stream.wrap(_runaway(4000)))
+    stream.close()
+    assert adapter.agent.engine.step_count == 1
+    assert adapter.agent._extractor.tokens_accumulated == stream.tokens
+    assert adapter.last_match is not None
+
+
+def test_check_every_must_be_positive():
+    with pytest.raises(ValueError):
+        _adapter().stream("answer", check_every=0)
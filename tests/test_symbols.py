@@ -0,0 +1,68 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import random
+from collections import deque
+
+import pytest
+
+from emocore.extractor import RuleBasedExtractor
+from emocore.observation import Observation
+from emocore.symbols import ACTIONS, CountedWindow, SymbolTable
+
+
+def test_symbol_table_interns_densely():
+    table = SymbolTable()
+    assert table.intern("search") == 0
+    assert table.intern("read") == 1
+    assert table.intern("search") == 0
+    assert table.symbol(1) == "read"
+    assert "read" in table and "write" not in table
+    assert len(table) == 2
+
+
+@pytest.mark.parametrize("maxlen", [1, 3, 20])
+def test_counted_window_matches_deque(maxlen):
+    rng = random.Random(maxlen)
+    window = CountedWindow(maxlen)
+    reference = deque(maxlen=maxlen)
+    for _ in range(2000):
+        item = rng.randrange(8)
+        assert (item in window) == (item in reference)
+        window.append(item)
+        reference.append(item)
+        assert len(window) == len(reference)
+        assert list(window) == list(reference)
+        assert window.count(item) == reference.count(item)
+
+
+def test_counted_window_clear_and_validation():
+    window = CountedWindow(2)
+    window.append("a")
+    window.clear()
+    assert "a" not in window and len(window) == 0
+    with pytest.raises(ValueError):
+        CountedWindow(0)
+
+
+def test_extractor_history_holds_interned_ids():
+    extractor = RuleBasedExtractor()
+    extractor.extract(Observation("plan", "success", 0.5, 0.1, 1.0))
+    assert list(extractor.action_history) == [ACTIONS.intern("plan")]
+
+
+def test_long_action_window_sees_distant_repeats():
+    class LongMemory(RuleBasedExtractor):
+        ACTION_WINDOW = 5000
+
+    extractor = LongMemory()
+    extractor.symbols = SymbolTable()
+    novelty = []
+    for i in range(3000):
+        extractor.extract(Observation(f"a{i}", "success", 0.5, 0.1, 1.0))
+        novelty.append(extractor.current_novelty)
+    extractor.extract(Observation("a0", "success", 0.5, 0.1, 1.0))
+    # A repeat 3000 steps back still decays novelty
+    assert extractor.current_novelty == novelty[-1] * 0.7
+    assert len(extractor.symbols) == 3000
@@ -0,0 +1,157 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+
+from emocore.agent import NO_LOCK, EmoCoreAgent
+from emocore.clock import DeltaClock
+from emocore.failures import FailureType
+from emocore.interface import observe, observe_batch, step, step_many
+from emocore.observation import Observation
+from emocore.profiles import PROFILES, ProfileType
+from emocore.session import GovernedSession
+from emocore.signals import Signals
+
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _obs(worker, i):
+    return Observation(f"tool_{worker}_{i % 3}", "success", 0.3, 0.1, 1.0)
+
+
+def _hammer(threads, fn):
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def run(worker):
+        try:
+            barrier.wait()
+            fn(worker)
+        except Exception as e:  # Surface failures from worker threads
+            errors.append(e)
+
+    pool = [threading.Thread(target=run, args=(w,)) for w in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    assert not errors, errors
+
+
+@pytest.fixture(autouse=True)
+def _fast_switching():
+    # Switch threads often so unsynchronized interleavings would show up
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_halt_stays_terminal_under_concurrent_observe():
+    profile = PROFILES[ProfileType.BALANCED]
+    agent = EmoCoreAgent(profile, clock=DeltaClock(), thread_safe=True)
+    results = [[] for _ in range(8)]
+
+    def work(worker):
+        for i in range(50):
+            results[worker].append(observe(agent, _obs(worker, i)))
+
+    _hammer(8, work)
+    flat = [r for per_thread in results for r in per_thread]
+    assert agent.engine.step_count == profile.max_steps
+    assert agent.engine.halted
+    assert sum(not r.halted for r in flat) == profile.max_steps - 1
+    assert all(r.failure is FailureType.EXTERNAL for r in flat if r.halted)
+    # Per thread, nothing after the first HALT is un-halted
+    for per_thread in results:
+        halted = [r.halted for r in per_thread]
+        first = halted.index(True) if True in halted else len(halted)
+        assert all(halted[first:])
+
+
+def test_pipeline_state_stays_consistent():
+    agent = EmoCoreAgent(PROFILES[ProfileType.AGGRESSIVE], clock=DeltaClock(), thread_safe=True)
+    session = GovernedSession.of(agent)
+
+    def work(worker):
+        for i in range(20):
+            if i % 2:
+                session.observe(_obs(worker, i))
+            else:
+                observe_batch(agent, [_obs(worker, i)])
+            agent.current_budget()
+
+    _hammer(8, work)
+    assert agent.engine.step_count == 160
+    assert agent._extractor.step_count == 160
+    assert len(agent._validator.signal_history) == 10
+
+
+def test_step_many_and_step_interleave_safely():
+    agent = EmoCoreAgent(PROFILES[ProfileType.AGGRESSIVE], clock=DeltaClock(), thread_safe=True)
+    rows = [Signals(0.2, 0.1, 0.1)] * 20
+
+    def work(worker):
+        if worker % 2:
+            list(step_many(agent, rows))
+        else:
+            for row in rows:
+                agent.step(row.reward, row.novelty, row.urgency)
+
+    _hammer(6, work)
+    assert agent.engine.step_count == 120
+
+
+def test_forecasts_checkpoint_their_own_step():
+    profile = replace(PROFILES[ProfileType.AGGRESSIVE], max_steps=10**6)
+    agent = EmoCoreAgent(profile, clock=DeltaClock(), thread_safe=True, forecast=True)
+    rows = [Signals(0.2, 0.1, 0.1)] * 50
+    counts = [[] for _ in range(6)]
+
+    def work(worker):
+        if worker % 2:
+            counts[worker] += [r.horizon.step_count for r in step_many(agent, rows)]
+        else:
+            counts[worker] += [step(agent, row).horizon.step_count for row in rows]
+
+    _hammer(6, work)
+    # Each forecast saw the state right after its own step: every count once
+    assert sorted(c for per_thread in counts for c in per_thread) == list(range(1, 301))
+
+
+def test_sessions_do_not_share_locks():
+    a = EmoCoreAgent(thread_safe=True)
+    b = EmoCoreAgent(thread_safe=True)
+    assert a.lock is not b.lock
+    assert EmoCoreAgent().lock is NO_LOCK
+    assert GovernedSession(thread_safe=True).agent.thread_safe
+
+
+def _throughput(threads, steps=3000):
+    # No step fuse: every step does full governance work
+    profile = replace(PROFILES[ProfileType.AGGRESSIVE], max_steps=10 * steps)
+    agents = [EmoCoreAgent(profile, clock=DeltaClock(), thread_safe=True) for _ in range(threads)]
+    obs = [Observation(f"a{i % 97}", "success" if i % 3 else "failure", 0.4 if i % 2 else 0.1, 0.2, 1.0)
+           for i in range(steps)]
+
+    def work(worker):
+        session = GovernedSession.of(agents[worker])
+        for o in obs:
+            session.observe_decision(o)
+
+    start = time.perf_counter()
+    _hammer(threads, work)
+    return threads * steps / (time.perf_counter() - start)
+
+
+@pytest.mark.skipif(not FREE_THREADED, reason="needs a free-threaded (no-GIL) CPython build")
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 CPUs")
+def test_throughput_scales_across_threads_without_gil():
+    single = _throughput(1)
+    four = _throughput(4)
+    assert four > 2.0 * single
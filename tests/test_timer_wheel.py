@@ -0,0 +1,172 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import random
+
+import pytest
+
+from emocore.behavior import BehaviorBudget, ZERO_BUDGET
+from emocore.clock import VirtualClock
+from emocore.escalation import EscalationLevel
+from emocore.temporal import BackoffSchedule, EscalationScheduler, TimerWheel
+
+
+def _budget(effort):
+    return BehaviorBudget(effort=effort, risk=0.5, persistence=1.0, exploration=0.5)
+
+
+def test_timer_fires_on_its_tick_never_before():
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=0.1, clock=clock)
+    wheel.schedule("a", 0.3, "payload")
+    clock.advance(0.2)
+    assert list(wheel.expired()) == []
+    assert wheel.remaining("a") == pytest.approx(0.1)
+    clock.advance(0.1)
+    assert list(wheel.expired()) == [("a", "payload")]
+    assert "a" not in wheel and len(wheel) == 0
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_matches_brute_force_across_levels_and_overflow(levels):
+    # 4 slots: delays past 4**levels ticks overflow the top level
+    rng = random.Random(7 + levels)
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=1.0, slots=4, levels=levels, clock=clock)
+    deadlines = {}
+    for _ in range(400):
+        key = rng.randrange(300)
+        if rng.random() < 0.2:
+            wheel.cancel(key)
+            deadlines.pop(key, None)
+        else:
+            delay = rng.choice([0, 1, 3, 4, 15, 16, 17, 63, 64, 65, 200, rng.randrange(500)])
+            wheel.schedule(key, delay)
+            deadlines[key] = clock.now() + delay
+        clock.advance(rng.choice([0, 1, 2, 5, 30]))
+        for key, _ in wheel.expired():
+            assert deadlines.pop(key) <= clock.now()
+        for key, deadline in deadlines.items():
+            assert deadline > clock.now()
+    clock.advance(1000)
+    for key, _ in wheel.expired():
+        assert deadlines.pop(key) <= clock.now()
+    assert deadlines == {} and len(wheel) == 0
+
+
+def test_single_level_wheel_does_not_fire_parked_timers_early():
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=1.0, slots=4, levels=1, clock=clock)
+    wheel.schedule("k", 100)
+    for now in range(1, 100):
+        clock.advance(1.0)
+        assert list(wheel.expired()) == [], now
+    clock.advance(1.0)
+    assert list(wheel.expired()) == [("k", None)]
+
+
+def test_each_timer_fires_on_exactly_its_tick():
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=1.0, slots=8, levels=2, clock=clock)
+    for delay in range(1, 200):
+        wheel.schedule(delay, delay, delay)
+    for now in range(1, 200):
+        clock.advance(1.0)
+        assert list(wheel.expired()) == [(now, now)]
+
+
+def test_reschedule_and_cancel_after_firing():
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=1.0, slots=4, levels=2, clock=clock)
+    wheel.schedule("a", 2)
+    wheel.schedule("a", 10, "later")  # Replaces the first timer
+    wheel.schedule("b", 1)
+    clock.advance(5)
+    assert wheel.advance() == 1
+    assert wheel.cancel("b")  # Fired but not drained yet
+    assert not wheel.cancel("b")
+    assert list(wheel.expired()) == []
+    clock.advance(5)
+    assert list(wheel.expired()) == [("a", "later")]
+
+
+def test_large_jump_skips_empty_ticks():
+    clock = VirtualClock()
+    wheel = TimerWheel(tick=0.001, clock=clock)
+    wheel.schedule("far", 3600.0)
+    clock.advance(3599.0)
+    assert list(wheel.expired()) == []
+    clock.advance(1.0)
+    assert list(wheel.expired()) == [("far", None)]
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        TimerWheel(slots=6)
+    with pytest.raises(ValueError):
+        TimerWheel(tick=0.0)
+    with pytest.raises(ValueError):
+        TimerWheel().schedule("a", -1.0)
+
+
+def test_scheduler_escalates_backoff_then_cooldown():
+    clock = VirtualClock()
+    scheduler = EscalationScheduler(BackoffSchedule(1.0, 2.0), max_retries=2, cooldown=30.0, clock=clock)
+    assert scheduler.level("s") is EscalationLevel.NORMAL
+
+    assert scheduler.record_failure("s") is EscalationLevel.BACKING_OFF
+    assert scheduler.remaining("s") == pytest.approx(1.0)
+    clock.advance(1.0)
+    assert list(scheduler.ready()) == ["s"]
+    assert scheduler.level("s") is EscalationLevel.RETRYING
+
+    assert scheduler.record_failure("s") is EscalationLevel.BACKING_OFF
+    assert scheduler.remaining("s") == pytest.approx(2.0)
+    clock.advance(2.0)
+    assert list(scheduler.ready()) == ["s"]
+
+    assert scheduler.record_failure("s") is EscalationLevel.COOLDOWN
+    clock.advance(29.0)
+    assert list(scheduler.ready()) == []
+    clock.advance(1.0)
+    assert list(scheduler.ready()) == ["s"]
+    assert scheduler.level("s") is EscalationLevel.NORMAL  # Attempts start over
+
+    scheduler.record_failure("s")
+    scheduler.record_success("s")
+    assert scheduler.level("s") is EscalationLevel.NORMAL
+    assert scheduler.parked == 0 and len(scheduler) == 0
+
+
+def test_scheduler_halts_on_depleted_effort():
+    clock = VirtualClock()
+    scheduler = EscalationScheduler(clock=clock)
+    scheduler.record_failure("a", _budget(0.8))
+    assert scheduler.parked == 1
+    assert scheduler.update("a", ZERO_BUDGET) is EscalationLevel.HALT
+    assert scheduler.parked == 0  # Never handed back
+    assert scheduler.record_failure("a") is EscalationLevel.HALT
+    clock.advance(3600.0)
+    assert list(scheduler.ready()) == []
+    assert scheduler.update("a", _budget(0.9)) is EscalationLevel.NORMAL
+
+
+def test_ready_drains_many_sessions_in_deadline_order():
+    clock = VirtualClock()
+    scheduler = EscalationScheduler(BackoffSchedule(1.0, 2.0), max_retries=3, clock=clock)
+    rng = random.Random(3)
+    attempts = {}
+    for key in range(10_000):
+        attempts[key] = rng.randrange(1, 4)
+        for _ in range(attempts[key]):
+            scheduler.record_failure(key)
+    assert scheduler.parked == 10_000
+    clock.advance(2.0)
+    first = list(scheduler.ready())
+    assert sorted(first) == [k for k, n in attempts.items() if n <= 2]
+    order = [attempts[k] for k in first]
+    assert order == sorted(order)  # 1 s backoffs before 2 s ones
+    clock.advance(2.0)
+    assert sorted(scheduler.ready()) == [k for k, n in attempts.items() if n == 3]
+    assert scheduler.parked == 0